@@ -0,0 +1,142 @@
+"""
+💤 Idle- and occlusion-aware animation throttling for BrainrotOS
+Watches user input, window state and window stacking, and slows down or pauses
+the FrameClock animation subscriptions nobody is looking at. The next input
+event restores full speed.
+"""
+
+import time
+from PyQt5 import sip
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QObject, QTimer, QEvent, QRect, QPoint
+from PyQt5.QtGui import QRegion
+
+from frame_clock import FrameClock
+
+INPUT_EVENTS = {
+    QEvent.MouseMove, QEvent.MouseButtonPress, QEvent.MouseButtonRelease,
+    QEvent.MouseButtonDblClick, QEvent.Wheel, QEvent.KeyPress, QEvent.KeyRelease,
+    QEvent.TouchBegin, QEvent.TouchUpdate, QEvent.TabletPress, QEvent.TabletMove,
+}
+
+# Anything that can change which windows cover which
+WINDOW_EVENTS = {
+    QEvent.Show, QEvent.Hide, QEvent.Move, QEvent.Resize, QEvent.Close,
+    QEvent.WindowStateChange, QEvent.WindowActivate, QEvent.Expose,
+}
+
+ACTIVE, IDLE, SUSPENDED = "active", "idle", "suspended"
+
+class AnimationGovernor(QObject):
+    """Process-wide animation throttle; use AnimationGovernor.instance().install(app)"""
+    IDLE_AFTER = 60         # seconds without input before animations slow down
+    IDLE_SCALE = 4          # animation interval multiplier while idle
+    SUSPEND_AFTER = 600     # seconds without input before animations stop
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        super().__init__()
+        self.clock = FrameClock.instance()
+        self.level = ACTIVE
+        self.last_input = time.monotonic()
+        # Top-level windows, bottom to top, in the order they were shown/activated
+        self.stacking = []
+        
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.timeout.connect(self.check_idle)
+        
+        # Window events arrive in bursts (show + move + resize + activate)
+        self.occlusion_timer = QTimer(self)
+        self.occlusion_timer.setSingleShot(True)
+        self.occlusion_timer.setInterval(100)
+        self.occlusion_timer.timeout.connect(self.update_occlusion)
+    
+    def install(self, app=None):
+        app = app or QApplication.instance()
+        app.installEventFilter(self)
+        self.last_input = time.monotonic()
+        self.idle_timer.start(int(self.IDLE_AFTER * 1000))
+    
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type in INPUT_EVENTS:
+            self.note_input()
+        elif event_type in WINDOW_EVENTS:
+            if obj.isWidgetType() and obj.isWindow():
+                if event_type == QEvent.Show or event_type == QEvent.WindowActivate:
+                    self.raise_window(obj)
+                self.occlusion_timer.start()
+            elif obj.isWindowType() and event_type == QEvent.Expose:
+                self.occlusion_timer.start()
+        return False
+    
+    def note_input(self):
+        self.last_input = time.monotonic()
+        if self.level != ACTIVE:
+            self.set_level(ACTIVE)
+            self.idle_timer.start(int(self.IDLE_AFTER * 1000))
+    
+    def check_idle(self):
+        idle = time.monotonic() - self.last_input
+        if idle >= self.SUSPEND_AFTER:
+            self.set_level(SUSPENDED)
+        elif idle >= self.IDLE_AFTER:
+            self.set_level(IDLE)
+            self.idle_timer.start(int((self.SUSPEND_AFTER - idle) * 1000))
+        else:
+            # Input arrived since the timer was armed; wait out the remainder
+            self.idle_timer.start(int((self.IDLE_AFTER - idle) * 1000))
+    
+    def set_level(self, level):
+        if level == self.level:
+            return
+        self.level = level
+        if level == SUSPENDED:
+            self.clock.set_animation_rate(suspended=True)
+            print("💤 No input for a while, animations paused")
+        elif level == IDLE:
+            self.clock.set_animation_rate(self.IDLE_SCALE)
+        else:
+            self.clock.set_animation_rate()
+    
+    def raise_window(self, window):
+        if window in self.stacking:
+            self.stacking.remove(window)
+        self.stacking.append(window)
+    
+    def update_occlusion(self):
+        self.stacking = [w for w in self.stacking if not sip.isdeleted(w)]
+        windows = [w for w in self.stacking
+                   if w.isVisible() and not w.isMinimized() and w.windowType() in (Qt.Window, Qt.Dialog)]
+        for widget in self.clock.subscribed_widgets():
+            if not sip.isdeleted(widget):
+                self.clock.set_occluded(widget, self.is_occluded(widget, windows))
+    
+    def is_occluded(self, widget, windows):
+        """Minimized, unexposed, or fully covered by windows stacked above it"""
+        window = widget.window()
+        if not window.isVisible():
+            # Hidden widgets are already paused by the clock itself
+            return False
+        if window.isMinimized():
+            return True
+        handle = window.windowHandle()
+        if handle is not None and not handle.isExposed():
+            return True
+        if window not in windows:
+            return False
+        
+        covered = QRegion()
+        for other in windows[windows.index(window) + 1:]:
+            covered = covered.united(QRegion(other.frameGeometry()))
+        if covered.isEmpty():
+            return False
+        area = QRect(widget.mapToGlobal(QPoint(0, 0)), widget.size())
+        return QRegion(area).subtracted(covered).isEmpty()
@@ -0,0 +1,265 @@
+"""
+🛰️ Out-of-process app hosting for BrainrotOS
+An isolated app runs in its own Python process (`python app_host.py --app KEY
+--server NAME`) with its own GUI thread, so heavy work or a crash there never
+stalls the desktop and the kiosk's other cores get used. Shell and app talk over
+a QLocalSocket with one JSON object per line:
+
+    shell -> app   show, focus, close, state, restore {state}, ping
+    app -> shell   hello {key, pid}, state {state}, closed {state}, pong
+
+The shell pings every app; one that stops answering is treated as hung and killed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from PyQt5.QtCore import QObject, QProcess, QTimer, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+class JsonLineChannel(QObject):
+    """Newline-delimited JSON messages over a connected QLocalSocket"""
+    message = pyqtSignal(object)
+    closed = pyqtSignal()
+    
+    def __init__(self, socket):
+        super().__init__()
+        self.socket = socket
+        self.buffer = b""
+        socket.readyRead.connect(self.read)
+        socket.disconnected.connect(self.closed)
+    
+    def send(self, kind, **fields):
+        fields["type"] = kind
+        self.socket.write(json.dumps(fields).encode("utf-8") + b"\n")
+    
+    def flush(self, timeout_ms=1000):
+        self.socket.flush()
+        if self.socket.bytesToWrite():
+            self.socket.waitForBytesWritten(timeout_ms)
+    
+    def read(self):
+        self.buffer += bytes(self.socket.readAll())
+        while b"\n" in self.buffer:
+            line, self.buffer = self.buffer.split(b"\n", 1)
+            try:
+                message = json.loads(line)
+            except ValueError:
+                print(f"🛰️ Ignoring malformed app message: {line[:80]!r}")
+                continue
+            self.message.emit(message)
+
+class AppHost(QObject):
+    """Shell-side handle for one isolated app process"""
+    exited = pyqtSignal(str)
+    
+    PING_MS = 2000
+    
+    def __init__(self, server, key, name):
+        super().__init__()
+        self.server = server
+        self.key = key
+        self.name = name
+        self.channel = None
+        self.pending = []     # messages queued until the app says hello
+        self.state = None     # last state reported by the app
+        self.last_pong = 0.0
+        self.launched_at = None
+        self.hang_limit = float(os.environ.get("BRAINROT_APP_HANG_SECS", "15"))
+        
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.ForwardedChannels)
+        self.process.finished.connect(self.process_finished)
+        self.ping_timer = QTimer(self)
+        self.ping_timer.timeout.connect(self.ping)
+    
+    @property
+    def running(self):
+        return self.process.state() != QProcess.NotRunning
+    
+    @property
+    def responsive(self):
+        return self.channel is not None and time.monotonic() - self.last_pong < 2 * self.PING_MS / 1000
+    
+    def pid(self):
+        return int(self.process.processId())
+    
+    def launch(self):
+        """Start the app process, or bring the running one to the front"""
+        if self.running:
+            self.send("focus")
+            return
+        self.channel = None
+        self.pending = []
+        if self.state is not None:
+            self.send("restore", state=self.state)
+        self.send("show")
+        self.launched_at = time.monotonic()
+        self.process.start(sys.executable, [os.path.abspath(__file__), "--app", self.key,
+                                            "--server", self.server.name])
+    
+    def attach(self, channel, pid):
+        self.channel = channel
+        self.last_pong = time.monotonic()
+        channel.message.connect(self.handle_message)
+        channel.closed.connect(self.detach)
+        for kind, fields in self.pending:
+            channel.send(kind, **fields)
+        self.pending = []
+        self.ping_timer.start(self.PING_MS)
+        print(f"🛰️ {self.name} running in process {pid} ({(time.monotonic() - self.launched_at) * 1000:.0f} ms to connect)")
+    
+    def detach(self):
+        self.channel = None
+        self.ping_timer.stop()
+    
+    def send(self, kind, **fields):
+        if self.channel is None:
+            self.pending.append((kind, fields))
+        else:
+            self.channel.send(kind, **fields)
+    
+    def query_state(self):
+        """Ask for the app's state; the reply lands in self.state"""
+        self.send("state")
+    
+    def close(self):
+        self.send("close")
+    
+    def stop(self, timeout_ms=2000):
+        """Close the app at shell shutdown, killing it if it doesn't go quietly"""
+        if not self.running:
+            return
+        self.close()
+        if self.channel is not None:
+            self.channel.flush()
+        if not self.process.waitForFinished(timeout_ms):
+            self.process.kill()
+            self.process.waitForFinished(timeout_ms)
+    
+    def handle_message(self, message):
+        kind = message.get("type")
+        if kind == "pong":
+            self.last_pong = time.monotonic()
+        elif kind in ("state", "closed"):
+            self.state = message.get("state")
+    
+    def ping(self):
+        if time.monotonic() - self.last_pong > self.hang_limit:
+            print(f"🧊 {self.name} has not responded for {self.hang_limit:.0f}s, killing process {self.pid()}")
+            self.process.kill()
+            return
+        self.send("ping")
+    
+    def process_finished(self, exit_code, exit_status):
+        self.detach()
+        if exit_status == QProcess.CrashExit or exit_code != 0:
+            print(f"💥 {self.name} exited abnormally (code {exit_code}); the desktop is fine")
+        self.exited.emit(self.key)
+
+class AppHostServer(QObject):
+    """Local socket the isolated apps connect back to; use AppHostServer.instance()"""
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        super().__init__()
+        self.hosts = {}
+        self.unclaimed = []
+        self.name = f"brainrotos-{os.getpid()}"
+        QLocalServer.removeServer(self.name)
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        if not self.server.listen(self.name):
+            raise RuntimeError(f"Could not listen on {self.name}: {self.server.errorString()}")
+        self.server.newConnection.connect(self.accept)
+        
+        from PyQt5.QtWidgets import QApplication
+        QApplication.instance().aboutToQuit.connect(self.stop_all)
+    
+    def host(self, key, name):
+        if key not in self.hosts:
+            self.hosts[key] = AppHost(self, key, name)
+        return self.hosts[key]
+    
+    def accept(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            channel = JsonLineChannel(socket)
+            # Hold the channel until the app says which one it is
+            self.unclaimed.append(channel)
+            channel.message.connect(lambda message, channel=channel: self.claim(channel, message))
+    
+    def claim(self, channel, message):
+        if channel not in self.unclaimed or message.get("type") != "hello":
+            return
+        self.unclaimed.remove(channel)
+        channel.message.disconnect()
+        host = self.hosts.get(message.get("key"))
+        if host is None:
+            channel.send("close")
+            return
+        host.attach(channel, message.get("pid"))
+    
+    def stop_all(self):
+        for host in self.hosts.values():
+            host.stop()
+
+def run_app(key, server_name):
+    """Child process: host one app window and obey the shell"""
+    from PyQt5.QtWidgets import QApplication
+    from app_registry import AppRegistry
+    
+    app = QApplication(sys.argv)
+    socket = QLocalSocket()
+    socket.connectToServer(server_name)
+    if not socket.waitForConnected(5000):
+        print(f"🛰️ Could not reach the desktop at {server_name}: {socket.errorString()}")
+        return 1
+    channel = JsonLineChannel(socket)
+    window = AppRegistry.instance().window(key)
+    
+    def current_state():
+        return window.save_state() if hasattr(window, "save_state") else None
+    
+    def handle(message):
+        kind = message.get("type")
+        if kind == "ping":
+            channel.send("pong")
+        elif kind == "restore" and hasattr(window, "restore_state"):
+            window.restore_state(message["state"])
+        elif kind in ("show", "focus"):
+            window.showNormal()
+            window.raise_()
+            window.activateWindow()
+        elif kind == "state":
+            channel.send("state", state=current_state())
+        elif kind == "close":
+            window.close()
+    
+    def window_closed():
+        channel.send("closed", state=current_state())
+        channel.flush()
+        app.quit()
+    
+    channel.message.connect(handle)
+    # The desktop went away (or crashed): don't linger as an orphan
+    channel.closed.connect(app.quit)
+    app.setQuitOnLastWindowClosed(False)
+    app.lastWindowClosed.connect(window_closed)
+    channel.send("hello", key=key, pid=os.getpid())
+    return app.exec_()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one BrainrotOS app in its own process")
+    parser.add_argument("--app", required=True, help="manifest key of the app")
+    parser.add_argument("--server", required=True, help="local socket name of the desktop")
+    args = parser.parse_args()
+    sys.exit(run_app(args.app, args.server))
@@ -0,0 +1,178 @@
+"""
+🗂️ App registry for BrainrotOS
+Apps are declared in apps/manifest.json (key, name, emoji and either a module and
+class or a shell action). Nothing is imported until an app is first launched;
+each launch records how long the import and the window construction took.
+
+App windows may implement an optional lifecycle: suspend() when hidden (stop
+timers, drop caches), resume() when shown again, and save_state() /
+restore_state(state) so a window that was hidden for too long, or is the least
+recently used one beyond the budget, can be destroyed and rebuilt later.
+reveal(target) shows one item (a rizz line, a sound, a file) picked from the
+start menu search.
+
+Apps marked "isolated" in the manifest, or listed in BRAINROT_ISOLATE_APPS
+(comma-separated keys, or "all"), run in their own process (see app_host).
+"""
+
+import os
+import json
+import time
+import importlib
+from collections import namedtuple
+from PyQt5.QtCore import QObject, QEvent, QTimer, pyqtSignal
+
+from frame_clock import FrameClock
+
+MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "apps", "manifest.json")
+
+AppSpec = namedtuple("AppSpec", "key name emoji module class_name action isolated")
+LaunchTiming = namedtuple("LaunchTiming", "import_ms construct_ms")
+
+class AppRegistry(QObject):
+    """Process-wide registry; use AppRegistry.instance()"""
+    launched = pyqtSignal(str)
+    evicted = pyqtSignal(str)
+    
+    EVICT_CHECK_MS = 30000
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, manifest=MANIFEST):
+        super().__init__()
+        self.apps = self.load_manifest(manifest)
+        self.specs = {spec.key: spec for spec in self.apps}
+        self.windows = {}   # key -> window, for apps launched so far
+        self.timings = {}   # key -> LaunchTiming of the first launch
+        self.states = {}    # key -> save_state() of an evicted window
+        self.hidden_at = {} # key -> monotonic time the window was hidden
+        self.keys = {}      # id(window) -> key
+        self.hosts = {}     # key -> app_host.AppHost, for isolated apps launched so far
+        
+        # How many hidden windows stay alive, and for how long
+        self.hidden_budget = int(os.environ.get("BRAINROT_APP_BUDGET", "3"))
+        self.idle_limit = float(os.environ.get("BRAINROT_APP_IDLE_SECS", "300"))
+        self.evict_timer = FrameClock.instance().subscribe(self.evict_idle, self.EVICT_CHECK_MS, start=False)
+    
+    def load_manifest(self, path):
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+        isolate = {key.strip() for key in os.environ.get("BRAINROT_ISOLATE_APPS", "").split(",") if key.strip()}
+        return [AppSpec(entry["key"], entry["name"], entry["emoji"], entry.get("module"),
+                        entry.get("class"), entry.get("action"),
+                        bool(entry.get("module")) and (entry.get("isolated", False) or entry["key"] in isolate
+                                                       or "all" in isolate))
+                for entry in entries]
+    
+    def window(self, key):
+        """The app's window, importing and constructing it on first use"""
+        window = self.windows.get(key)
+        if window is not None:
+            return window
+        
+        spec = self.specs[key]
+        if spec.module is None:
+            raise ValueError(f"{spec.name} is a shell action, not an app window")
+        
+        start = time.perf_counter()
+        module = importlib.import_module(spec.module)
+        imported = time.perf_counter()
+        window = getattr(module, spec.class_name)()
+        constructed = time.perf_counter()
+        
+        if key in self.states and hasattr(window, "restore_state"):
+            try:
+                window.restore_state(self.states.pop(key))
+            except Exception as e:
+                # A stale or hand-edited session shouldn't keep the app from opening
+                print(f"⚠️ Could not restore {spec.name}: {e!r}; starting fresh")
+        
+        if key not in self.timings:
+            timing = LaunchTiming((imported - start) * 1000, (constructed - imported) * 1000)
+            self.timings[key] = timing
+            print(f"🚀 {spec.emoji} {spec.name}: import {timing.import_ms:.1f} ms, construct {timing.construct_ms:.1f} ms")
+        self.windows[key] = window
+        self.keys[id(window)] = key
+        window.installEventFilter(self)
+        self.launched.emit(key)
+        return window
+    
+    def launch(self, key):
+        """Show the app, in its own process when it is isolated"""
+        if self.specs[key].isolated:
+            return self.launch_isolated(key)
+        window = self.window(key)
+        window.show()
+        window.raise_()
+        return window
+    
+    def launch_isolated(self, key):
+        from app_host import AppHostServer
+        host = self.hosts.get(key)
+        if host is None:
+            host = AppHostServer.instance().host(key, self.specs[key].name)
+            host.state = self.states.pop(key, None)
+            self.hosts[key] = host
+        host.launch()
+        return host
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.Show or event_type == QEvent.Hide:
+            key = self.keys.get(id(obj))
+            if key is not None and self.windows.get(key) is obj:
+                if event_type == QEvent.Hide:
+                    self.window_hidden(key, obj)
+                else:
+                    self.window_shown(key, obj)
+        return False
+    
+    def window_hidden(self, key, window):
+        self.hidden_at[key] = time.monotonic()
+        if hasattr(window, "suspend"):
+            window.suspend()
+        self.evict_timer.start()
+        # Not from inside the Hide event: callers may be iterating over windows
+        QTimer.singleShot(0, self.evict_over_budget)
+    
+    def window_shown(self, key, window):
+        if self.hidden_at.pop(key, None) is not None and hasattr(window, "resume"):
+            window.resume()
+        if not self.hidden_at:
+            self.evict_timer.stop()
+    
+    def evictable(self):
+        """Keys of hidden (not minimized) windows, least recently used first"""
+        keys = [key for key in self.hidden_at
+                if key in self.windows and not self.windows[key].isMinimized()]
+        return sorted(keys, key=self.hidden_at.get)
+    
+    def evict_over_budget(self):
+        keys = self.evictable()
+        for key in keys[:max(0, len(keys) - self.hidden_budget)]:
+            self.evict(key)
+    
+    def evict_idle(self):
+        cutoff = time.monotonic() - self.idle_limit
+        for key in self.evictable():
+            if self.hidden_at[key] <= cutoff:
+                self.evict(key)
+    
+    def evict(self, key):
+        """Destroy a hidden window, keeping its state for the next launch"""
+        window = self.windows.pop(key)
+        self.hidden_at.pop(key, None)
+        self.keys.pop(id(window), None)
+        if hasattr(window, "save_state"):
+            self.states[key] = window.save_state()
+        window.removeEventFilter(self)
+        window.deleteLater()
+        if not self.hidden_at:
+            self.evict_timer.stop()
+        print(f"♻️ Closed idle app {self.specs[key].name}" + (" (state kept for next launch)" if key in self.states else ""))
+        self.evicted.emit(key)
@@ -0,0 +1,570 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
+                             QTableView, QAbstractItemView, QStyle, QApplication)
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThreadPool, QAbstractTableModel, QModelIndex,
+                          QUrl, QSize, QTimer, pyqtSignal)
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QDesktopServices
+from collections import OrderedDict, namedtuple
+from operator import itemgetter
+import hashlib
+import os
+import stat
+import threading
+import time
+
+import paths
+from search_index import SearchIndex
+
+IMAGE_TYPES = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
+
+# One directory entry; folded, rank (0 for folders) and extension are sort keys
+FileEntry = namedtuple("FileEntry", "name is_dir size mtime path folded rank extension")
+
+class DirectoryScanner(QObject):
+    """Lists a directory on a background thread and emits its entries in batches.
+    
+    Each listing gets a generation number; starting a new one makes the old
+    thread stop at its next entry, and batches from it are ignored. Batches go
+    out every BATCH_SIZE entries or BATCH_SECS, whichever comes first, so the
+    first rows show up at once and a huge folder fills in progressively.
+    """
+    batch = pyqtSignal(int, object)      # generation, list of rows
+    finished = pyqtSignal(int, object)   # generation, error message or None
+    
+    BATCH_SIZE = 2000
+    BATCH_SECS = 0.05
+    
+    def __init__(self):
+        super().__init__()
+        self.generation = 0
+        self.lock = threading.Lock()
+    
+    def list(self, path):
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+        threading.Thread(target=self.run, args=(path, generation),
+                         name="brainrot-file-scanner", daemon=True).start()
+        return generation
+    
+    def stop(self):
+        with self.lock:
+            self.generation += 1
+    
+    def current(self, generation):
+        return generation == self.generation
+    
+    def run(self, path, generation):
+        rows = []
+        flushed = time.monotonic()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if not self.current(generation):
+                        return
+                    rows.append(self.row_for(entry))
+                    if len(rows) >= self.BATCH_SIZE or time.monotonic() - flushed >= self.BATCH_SECS:
+                        self.batch.emit(generation, rows)
+                        rows = []
+                        flushed = time.monotonic()
+        except OSError as e:
+            if rows:
+                self.batch.emit(generation, rows)
+            self.finished.emit(generation, e.strerror or str(e))
+            return
+        if rows:
+            self.batch.emit(generation, rows)
+        self.finished.emit(generation, None)
+    
+    def row_for(self, entry):
+        """FileEntry for a DirEntry; one stat, following symlinks"""
+        folded = entry.name.casefold()
+        try:
+            info = entry.stat()
+            is_dir = stat.S_ISDIR(info.st_mode)
+            size, mtime = 0 if is_dir else info.st_size, info.st_mtime
+        except OSError:
+            # Dangling symlink or vanished entry: list it anyway
+            is_dir, size, mtime = False, 0, 0.0
+        extension = "" if is_dir else os.path.splitext(folded)[1]
+        return FileEntry(entry.name, is_dir, size, mtime, entry.path, folded, 0 if is_dir else 1, extension)
+
+class ThumbnailJob(QRunnable):
+    """Loads one thumbnail, from the disk cache when possible, off the GUI thread"""
+    def __init__(self, cache, key, path, cache_file):
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.path = path
+        self.cache_file = cache_file
+    
+    def run(self):
+        image = QImage(self.cache_file) if os.path.exists(self.cache_file) else QImage()
+        if image.isNull():
+            image = self.render()
+            if not image.isNull():
+                temp_file = f"{self.cache_file}.{threading.get_ident()}.tmp"
+                if image.save(temp_file, "PNG"):
+                    os.replace(temp_file, self.cache_file)
+        # QImage is safe to hand across threads; the QPixmap is made on the GUI thread
+        self.cache.loaded.emit(self.key, image)
+    
+    def render(self):
+        reader = QImageReader(self.path)
+        size = reader.size()
+        if size.isValid():
+            # Let the decoder downscale JPEGs instead of decoding full size
+            reader.setScaledSize(size.scaled(ThumbnailCache.SIZE, ThumbnailCache.SIZE, Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            return image
+        return image.scaled(ThumbnailCache.SIZE, ThumbnailCache.SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+class ThumbnailCache(QObject):
+    """Image thumbnails made in a thread pool and kept on disk under cache/thumbnails.
+    
+    Files are keyed by path, mtime and size, so an edited image gets a new
+    thumbnail and stale ones are simply never read again. Recently shown
+    thumbnails are also kept in memory.
+    """
+    loaded = pyqtSignal(str, object)
+    ready = pyqtSignal(str)
+    
+    SIZE = 32
+    MEMORY_ITEMS = 512
+    
+    def __init__(self, directory=None):
+        super().__init__()
+        self.directory = directory or paths.cache_path("thumbnails")
+        os.makedirs(self.directory, exist_ok=True)
+        self.pixmaps = OrderedDict()   # key -> QPixmap, least recently used first
+        self.pending = set()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(4, (os.cpu_count() or 2) - 1)))
+        self.loaded.connect(self.store)
+    
+    @staticmethod
+    def wants(name):
+        return os.path.splitext(name)[1].lower() in IMAGE_TYPES
+    
+    def key_for(self, path, mtime, size):
+        return hashlib.sha1(f"{path}\0{mtime}\0{size}".encode("utf-8", "surrogateescape")).hexdigest()
+    
+    def get(self, path, mtime, size):
+        """The thumbnail if it is in memory; otherwise queue it and return None"""
+        key = self.key_for(path, mtime, size)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            return pixmap
+        if key not in self.pending:
+            self.pending.add(key)
+            self.pool.start(ThumbnailJob(self, key, path, os.path.join(self.directory, key + ".png")))
+        return None
+    
+    def store(self, key, image):
+        if key not in self.pending:
+            return  # cancelled while it was being made
+        self.pending.discard(key)
+        # A failed decode is remembered as an empty pixmap so it isn't retried
+        self.pixmaps[key] = QPixmap.fromImage(image)
+        while len(self.pixmaps) > self.MEMORY_ITEMS:
+            self.pixmaps.popitem(last=False)
+        self.ready.emit(key)
+    
+    def cancel(self):
+        """Drop queued jobs, e.g. after leaving the folder they were for"""
+        self.pool.clear()
+        self.pending.clear()
+    
+    def clear_memory(self):
+        self.cancel()
+        self.pixmaps.clear()
+
+class FileTableModel(QAbstractTableModel):
+    """Directory rows appended batch by batch as the scanner finds them.
+    
+    Sorting and filtering happen here on plain lists rather than in a
+    QSortFilterProxyModel: the proxy compares rows through data() one pair at
+    a time, which takes seconds on the GUI thread for a 100k-entry folder.
+    """
+    HEADERS = ["Name", "Size", "Modified", "Kind"]
+    COLUMN_WIDTHS = [320, 90, 140]
+    # FileEntry fields each column sorts by; ties go by name, folders always come first.
+    # One stable sort per field is about twice as fast as one sort on tuple keys.
+    SORT_FIELDS = [(5,), (2, 5), (3, 5), (7, 5)]
+    RANK = itemgetter(6)
+    
+    def __init__(self, thumbnails):
+        super().__init__()
+        self.entries = []          # every row of the folder
+        self.rows = []             # the rows shown: filtered and sorted
+        self.filter_text = ""
+        self.sort_column = 0
+        self.sort_order = Qt.AscendingOrder
+        self.sorted = True
+        self.sort_ms = 0.0         # how long the last sort took
+        self.thumbnails = thumbnails
+        self.thumbnail_rows = {}   # thumbnail key -> row index
+        style = QApplication.style()
+        self.folder_icon = style.standardIcon(QStyle.SP_DirIcon)
+        self.file_icon = style.standardIcon(QStyle.SP_FileIcon)
+        thumbnails.ready.connect(self.thumbnail_ready)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        name, is_dir, size, mtime, path = self.rows[index.row()][:5]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return name
+            if column == 1:
+                return "" if is_dir else self.format_size(size)
+            if column == 2:
+                return time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime)) if mtime else ""
+            return self.kind(name, is_dir)
+        if role == Qt.DecorationRole and column == 0:
+            if is_dir:
+                return self.folder_icon
+            if self.thumbnails.wants(name):
+                # Only rows being painted ask, so only visible images get thumbnails
+                pixmap = self.thumbnails.get(path, mtime, size)
+                if pixmap is None:
+                    self.thumbnail_rows[self.thumbnails.key_for(path, mtime, size)] = index.row()
+                elif not pixmap.isNull():
+                    return pixmap
+            return self.file_icon
+        if role == Qt.TextAlignmentRole and column == 1:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+    
+    def kind(self, name, is_dir):
+        if is_dir:
+            return "Folder"
+        extension = os.path.splitext(name)[1][1:]
+        return f"{extension.upper()} file" if extension else "File"
+    
+    @staticmethod
+    def format_size(size):
+        for unit in ("B", "KB", "MB", "GB"):
+            if size < 1024 or unit == "GB":
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+    
+    def row_at(self, row):
+        return self.rows[row]
+    
+    def matching(self, rows):
+        if not self.filter_text:
+            return rows
+        text = self.filter_text
+        return [row for row in rows if text in row.folded]
+    
+    def clear(self):
+        self.beginResetModel()
+        self.entries = []
+        self.rows = []
+        self.thumbnail_rows = {}
+        self.sorted = True
+        self.endResetModel()
+    
+    def append(self, rows):
+        """Add a batch at the end; sort_rows() puts it in order later"""
+        self.entries.extend(rows)
+        rows = self.matching(rows)
+        if not rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.sorted = False
+        self.endInsertRows()
+    
+    def set_filter(self, text):
+        self.beginResetModel()
+        self.filter_text = text.casefold()
+        self.rows = self.matching(self.entries)
+        self.thumbnail_rows = {}
+        self.sort_in_place()
+        self.endResetModel()
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Called by the view when a header is clicked
+        if column == self.sort_column and order == self.sort_order and self.sorted:
+            return
+        self.sort_column = column
+        self.sort_order = order
+        self.sort_rows()
+    
+    def sort_rows(self):
+        """Re-sort the shown rows in place, keeping selection and current row"""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        moved = [(index, self.rows[index.row()]) for index in persistent]
+        self.sort_in_place()
+        self.thumbnail_rows = {}
+        if moved:
+            position = {id(row): number for number, row in enumerate(self.rows)}
+            self.changePersistentIndexList(
+                [index for index, _ in moved],
+                [self.index(position[id(row)], index.column()) for index, row in moved])
+        self.layoutChanged.emit()
+    
+    def sort_in_place(self):
+        started = time.perf_counter()
+        descending = self.sort_order == Qt.DescendingOrder
+        for field in reversed(self.SORT_FIELDS[self.sort_column]):
+            self.rows.sort(key=itemgetter(field), reverse=descending)
+        self.rows.sort(key=self.RANK)
+        self.sorted = True
+        self.sort_ms = (time.perf_counter() - started) * 1000
+    
+    def thumbnail_ready(self, key):
+        row = self.thumbnail_rows.pop(key, None)
+        if row is not None and row < len(self.rows):
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+class FileManagerApp(QWidget):
+    def __init__(self, start_path=None):
+        super().__init__()
+        self.setWindowTitle("📁 Ohio Files")
+        self.setGeometry(180, 100, 820, 560)
+        self.setStyleSheet("""
+            QWidget {
+                background-color: #1a1a2e;
+                color: white;
+                font-family: 'Courier New';
+            }
+        """)
+        
+        self.path = None
+        self.start_path = start_path or os.path.expanduser("~")
+        self.generation = 0
+        self.scanning = False
+        self.history = []
+        
+        self.scanner = DirectoryScanner()
+        self.scanner.batch.connect(self.add_batch)
+        self.scanner.finished.connect(self.scan_finished)
+        # The registry may destroy this window while hidden; stop the listing thread
+        self.destroyed.connect(self.scanner.stop)
+        self.thumbnails = ThumbnailCache()
+        self.model = FileTableModel(self.thumbnails)
+        
+        # Sorting a folder that is still arriving would re-sort on every batch;
+        # re-sort now and then instead, spending at most a tenth of the time sorting
+        self.sort_timer = QTimer(self)
+        self.sort_timer.setSingleShot(True)
+        self.sort_timer.timeout.connect(self.model.sort_rows)
+        
+        self.setup_ui()
+    
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        
+        # Title
+        title = QLabel("📁 OHIO FILES 📁")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("""
+            QLabel {
+                font-size: 20px;
+                font-weight: bold;
+                color: #ffff00;
+                margin: 10px;
+                border: 2px solid #00ffff;
+                padding: 10px;
+                border-radius: 10px;
+            }
+        """)
+        
+        # Navigation bar
+        nav_layout = QHBoxLayout()
+        self.back_button = QPushButton("⬅️")
+        self.back_button.clicked.connect(self.go_back)
+        self.up_button = QPushButton("⬆️")
+        self.up_button.clicked.connect(self.go_up)
+        home_button = QPushButton("🏠")
+        home_button.clicked.connect(lambda: self.open_path(os.path.expanduser("~")))
+        for button in (self.back_button, self.up_button, home_button):
+            button.setFixedWidth(44)
+            button.setStyleSheet(self.get_button_style())
+        
+        self.path_input = QLineEdit()
+        self.path_input.setStyleSheet(self.get_input_style("#00ffff"))
+        self.path_input.returnPressed.connect(lambda: self.open_path(self.path_input.text()))
+        
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("🔍 Filter...")
+        self.filter_input.setFixedWidth(180)
+        self.filter_input.setStyleSheet(self.get_input_style("#00ff00"))
+        
+        nav_layout.addWidget(self.back_button)
+        nav_layout.addWidget(self.up_button)
+        nav_layout.addWidget(home_button)
+        nav_layout.addWidget(self.path_input, 1)
+        nav_layout.addWidget(self.filter_input)
+        
+        # File table; the model sorts and filters itself
+        self.filter_input.textChanged.connect(self.model.set_filter)
+        
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setSortIndicator(0, Qt.AscendingOrder)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(ThumbnailCache.SIZE + 4)
+        self.table.setIconSize(QSize(ThumbnailCache.SIZE, ThumbnailCache.SIZE))
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setShowGrid(False)
+        # Fixed widths: ResizeToContents would measure every row of a huge folder
+        for column, width in enumerate(FileTableModel.COLUMN_WIDTHS):
+            self.table.setColumnWidth(column, width)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.doubleClicked.connect(self.activate)
+        self.table.setStyleSheet("""
+            QTableView {
+                background-color: #2d2d44;
+                border: 2px solid #00ffff;
+                border-radius: 8px;
+                font-size: 11px;
+                selection-background-color: #ff00ff;
+            }
+            QHeaderView::section {
+                background-color: #16213e;
+                color: #00ffff;
+                border: none;
+                padding: 4px;
+                font-size: 11px;
+                font-weight: bold;
+            }
+        """)
+        
+        self.status_label = QLabel("📁 Loading...")
+        self.status_label.setStyleSheet("color: #aaaaaa; font-size: 11px; padding: 2px;")
+        
+        layout.addWidget(title)
+        layout.addLayout(nav_layout)
+        layout.addWidget(self.table)
+        layout.addWidget(self.status_label)
+        self.setLayout(layout)
+    
+    def get_button_style(self):
+        return """
+            QPushButton {
+                background-color: #2d2d44;
+                border: 2px solid #00ffff;
+                border-radius: 8px;
+                padding: 4px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #3d3d5c;
+            }
+        """
+    
+    def get_input_style(self, color):
+        return f"""
+            QLineEdit {{
+                background-color: #2d2d44;
+                border: 2px solid {color};
+                border-radius: 8px;
+                padding: 6px;
+                font-size: 12px;
+            }}
+        """
+    
+    def open_path(self, path, remember=True):
+        path = os.path.abspath(os.path.expanduser(path))
+        if not os.path.isdir(path):
+            self.status_label.setText(f"💀 Not a folder: {path}")
+            self.path_input.setText(self.path or "")
+            return
+        if remember and self.path is not None and path != self.path:
+            self.history.append(self.path)
+        self.path = path
+        self.path_input.setText(path)
+        self.back_button.setEnabled(bool(self.history))
+        self.up_button.setEnabled(os.path.dirname(path) != path)
+        
+        self.thumbnails.cancel()
+        self.sort_timer.stop()
+        self.model.clear()
+        self.scanning = True
+        self.scan_started = time.perf_counter()
+        self.generation = self.scanner.list(path)
+        self.update_status()
+    
+    def go_up(self):
+        if self.path:
+            self.open_path(os.path.dirname(self.path))
+    
+    def go_back(self):
+        if self.history:
+            self.open_path(self.history.pop(), remember=False)
+    
+    def activate(self, index):
+        entry = self.model.row_at(index.row())
+        if entry.is_dir:
+            self.open_path(entry.path)
+        else:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(entry.path))
+            SearchIndex.instance().add_recent_file(entry.path)
+    
+    def add_batch(self, generation, rows):
+        if generation != self.generation:
+            return  # a folder we already navigated away from
+        self.model.append(rows)
+        if not self.sort_timer.isActive():
+            self.sort_timer.start(max(250, int(self.model.sort_ms * 10)))
+        self.update_status()
+    
+    def scan_finished(self, generation, error):
+        if generation != self.generation:
+            return
+        self.scanning = False
+        self.sort_timer.stop()
+        self.model.sort_rows()
+        self.update_status(error)
+    
+    def update_status(self, error=None):
+        count = len(self.model.rows)
+        if error:
+            self.status_label.setText(f"💀 {error} ({count:,} items)")
+        elif self.scanning:
+            self.status_label.setText(f"⏳ {count:,} items so far...")
+        else:
+            elapsed = (time.perf_counter() - self.scan_started) * 1000
+            self.status_label.setText(f"📁 {count:,} items · listed in {elapsed:.0f} ms")
+    
+    def showEvent(self, event):
+        # List the first folder once there is someone to look at it
+        if self.path is None:
+            self.open_path(self.start_path)
+        super().showEvent(event)
+    
+    def suspend(self):
+        # Hidden: stop making thumbnails and free the ones in memory
+        self.thumbnails.clear_memory()
+        self.model.thumbnail_rows = {}
+    
+    def save_state(self):
+        return {"path": self.path, "filter": self.filter_input.text()}
+    
+    def restore_state(self, state):
+        if state.get("path") and os.path.isdir(state["path"]):
+            if self.path is None:
+                self.start_path = state["path"]
+            elif state["path"] != self.path:
+                self.open_path(state["path"], remember=False)
+        self.filter_input.setText(state.get("filter", ""))
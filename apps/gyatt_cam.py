@@ -7,6 +7,9 @@ import random
 import datetime
 import math
 
+from frame_clock import FrameClock
+from glow_compositor import GlowUnderlay
+
 class GyattCam(QWidget):
     def __init__(self):
         super().__init__()
@@ -32,13 +35,10 @@ class GyattCam(QWidget):
         self.detection_active = False
         self.detected_objects = []
         
-        # Animation timers
-        self.detection_timer = QTimer()
-        self.detection_timer.timeout.connect(self.update_detection)
-        
-        self.gyatt_animation_timer = QTimer()
-        self.gyatt_animation_timer.timeout.connect(self.animate_gyatt_level)
-        self.gyatt_animation_timer.start(100)
+        # Animation timers (paused automatically while the camera window is hidden)
+        clock = FrameClock.instance()
+        self.detection_timer = clock.subscribe(self.update_detection, 500, self, start=False)
+        self.gyatt_animation_timer = clock.subscribe(self.animate_gyatt_level, 100, self, animation=True)
         
         self.animation_phase = 0
         
@@ -69,11 +69,7 @@ class GyattCam(QWidget):
         """)
         
         # Add glass effect
-        shadow_effect = QGraphicsDropShadowEffect()
-        shadow_effect.setBlurRadius(20)
-        shadow_effect.setColor(QColor(0, 0, 0, 100))
-        shadow_effect.setOffset(3, 3)
-        panel.setGraphicsEffect(shadow_effect)
+        panel.shadow_effect = GlowUnderlay(panel, 20, QColor(0, 0, 0, 100), offset=(3, 3), corner_radius=15)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
@@ -369,7 +365,7 @@ class GyattCam(QWidget):
                     border-radius: 10px;
                 }
             """)
-            self.detection_timer.start(500)
+            self.detection_timer.start()
             self.camera_viewport.setText("🔍 SCANNING ACTIVE...\n\n🎯 Detecting gyatt levels...\n\n⚡ AI Status: ONLINE")
         else:
             self.detection_btn.setText("🔍 START DETECTION")
@@ -472,6 +468,31 @@ class GyattCam(QWidget):
             }
         """)
         
+    def suspend(self):
+        self.gyatt_animation_timer.stop()
+        self.detection_timer.stop()
+        
+    def resume(self):
+        self.gyatt_animation_timer.start()
+        if self.detection_active:
+            self.detection_timer.start()
+        
+    def save_state(self):
+        return {
+            "gyatt_level": self.gyatt_level,
+            "detection_active": self.detection_active,
+            "sensitivity": self.sensitivity_slider.value(),
+            "mode": self.mode_combo.currentIndex(),
+        }
+        
+    def restore_state(self, state):
+        self.gyatt_level = state.get("gyatt_level", self.gyatt_level)
+        self.gyatt_meter.setValue(self.gyatt_level)
+        self.sensitivity_slider.setValue(state.get("sensitivity", self.sensitivity_slider.value()))
+        self.mode_combo.setCurrentIndex(state.get("mode", self.mode_combo.currentIndex()))
+        if state.get("detection_active") and not self.detection_active:
+            self.toggle_detection()
+        
     def take_screenshot(self):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         filename = f"gyatt_screenshot_{timestamp.replace(':', '-')}.png"
@@ -483,7 +504,7 @@ class GyattCam(QWidget):
         ]
         
         self.camera_viewport.setText(random.choice(messages))
-        QTimer.singleShot(3000, lambda: self.camera_viewport.setText("📷 Ready for next capture..."))
+        self.show_later(3000, "📷 Ready for next capture...")
         
     def toggle_recording(self):
         self.is_recording = not self.is_recording
@@ -496,11 +517,19 @@ class GyattCam(QWidget):
             timestamp = datetime.datetime.now().strftime("%H:%M:%S")
             filename = f"gyatt_video_{timestamp.replace(':', '-')}.mp4"
             self.camera_viewport.setText(f"🎬 Recording saved!\nFile: {filename}\n\n🎯 Duration: {random.randint(10, 60)}s\n✅ Quality: 4K ULTRA HD")
-            QTimer.singleShot(3000, lambda: self.camera_viewport.setText("📷 Ready to record..."))
+            self.show_later(3000, "📷 Ready to record...")
             
+    def show_later(self, delay_ms, text):
+        # The timer is a child of the viewport, so it goes away with the window instead of firing into it
+        timer = QTimer(self.camera_viewport)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: self.camera_viewport.setText(text))
+        timer.timeout.connect(timer.deleteLater)
+        timer.start(delay_ms)
+        
     def calibrate_gyatt(self):
         self.camera_viewport.setText("⚙️ CALIBRATING...\n\n🔧 Adjusting sensors...\n⚡ Optimizing detection...")
         
         # Simulate calibration process
-        QTimer.singleShot(2000, lambda: self.camera_viewport.setText("✅ CALIBRATION COMPLETE!\n\n🎯 Accuracy: +25%\n🔥 Sensitivity: OPTIMIZED\n💎 Quality: ENHANCED"))
-        QTimer.singleShot(5000, lambda: self.camera_viewport.setText("📷 CAMERA READY\n\n🎯 All systems: ONLINE\n⚡ Status: CALIBRATED"))
+        self.show_later(2000, "✅ CALIBRATION COMPLETE!\n\n🎯 Accuracy: +25%\n🔥 Sensitivity: OPTIMIZED\n💎 Quality: ENHANCED")
+        self.show_later(5000, "📷 CAMERA READY\n\n🎯 All systems: ONLINE\n⚡ Status: CALIBRATED")
@@ -5,7 +5,12 @@ from PyQt5.QtGui import QFont
 import random
 import datetime
 
+from search_index import SearchIndex
+
 class NPCChatApp(QWidget):
+    SENDER_COLORS = {"SYSTEM": "#888888", "YOU": "#00ff00", "NPC": "#ff00ff"}
+    HISTORY_LIMIT = 200  # messages kept by save_state
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("🤖 NPC Chat v2.0")
@@ -18,6 +23,7 @@ class NPCChatApp(QWidget):
             }
         """)
         
+        self.chat_history = []  # (timestamp, sender, message), newest last
         self.setup_ui()
         
         # NPC responses database
@@ -67,8 +73,6 @@ class NPCChatApp(QWidget):
             "You're literally iconic for this"
         ]
         
-        self.chat_history = []
-        
     def setup_ui(self):
         layout = QVBoxLayout()
         
@@ -196,17 +200,32 @@ class NPCChatApp(QWidget):
         }
         self.add_system_message(mode_messages[mode])
         
+    def save_state(self):
+        return {"mode": self.current_mode, "history": self.chat_history[-self.HISTORY_LIMIT:]}
+        
+    def restore_state(self, state):
+        self.current_mode = state.get("mode", self.current_mode)
+        if "history" not in state:
+            return
+        self.chat_display.clear()
+        self.chat_history = []
+        for timestamp, sender, message in state["history"]:
+            self.add_message(sender, message, timestamp)
+        
+    def add_message(self, sender, message, timestamp=None):
+        timestamp = timestamp or datetime.datetime.now().strftime("%H:%M:%S")
+        self.chat_history.append((timestamp, sender, message))
+        SearchIndex.instance().add_chat_message(timestamp, sender, message)
+        self.chat_display.append(f"<span style='color: {self.SENDER_COLORS[sender]};'>[{timestamp}] {sender}: {message}</span>")
+        
     def add_system_message(self, message):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(f"<span style='color: #888888;'>[{timestamp}] SYSTEM: {message}</span>")
+        self.add_message("SYSTEM", message)
         
     def add_user_message(self, message):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(f"<span style='color: #00ff00;'>[{timestamp}] YOU: {message}</span>")
+        self.add_message("YOU", message)
         
     def add_npc_message(self, message):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(f"<span style='color: #ff00ff;'>[{timestamp}] NPC: {message}</span>")
+        self.add_message("NPC", message)
         
     def send_message(self):
         message = self.message_input.text().strip()
@@ -266,4 +285,6 @@ class NPCChatApp(QWidget):
         
     def clear_chat(self):
         self.chat_display.clear()
+        self.chat_history = []
+        SearchIndex.instance().remove_kind("chat")
         self.add_system_message("Chat cleared. Ready for new conversations!")
@@ -4,6 +4,30 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 import random
 
+# Rizz lines database
+RIZZ_LINES = [
+    "Are you Ohio? Because you're making me feel sus 😳",
+    "Girl, are you a sigma? Because you got that grindset 💪",
+    "Are you TikTok? Because I can't stop scrolling through my feelings for you 📱",
+    "Damn girl, you got more rizz than a Level 100 Gyatt 🔥",
+    "Are you Wi-Fi? Because I'm feeling a connection (no cap) 📶",
+    "Girl, you're bussin like a fresh batch of chicken nuggets 🐔",
+    "Are you my phone battery? Because you're at 100% and I need you all day 🔋",
+    "You must be from Ohio because you're making me act unwise 🤪",
+    "Are you a Discord mod? Because you just banned me from being normal 🎮",
+    "Girl, you're more fire than my mixtape (and that's saying something) 🎵",
+    "Are you a rare Pokémon? Because I choose you (periodt) ⚡",
+    "You got that main character energy and I'm just an NPC in love 💕",
+    "Are you a meme? Because you make me laugh and I want to share you with everyone 😂",
+    "Girl, you're giving me butterflies like I just hit a TikTok dance perfectly 🦋",
+    "Are you my sleep schedule? Because you're messed up but I can't live without you 😴",
+    "You're more addictive than scrolling through memes at 3 AM 🌙",
+    "Are you a notification? Because you always make my day better 📲",
+    "Girl, you're the only cheat code I need in this game called life 🎮",
+    "Are you my screen time? Because you're embarrassingly high but worth it 📊",
+    "You must be a limited edition because you're one of a kind (no printer) 🖨️"
+]
+
 class RizzGeneratorApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -19,29 +43,7 @@ class RizzGeneratorApp(QWidget):
         
         self.setup_ui()
         
-        # Rizz lines database
-        self.rizz_lines = [
-            "Are you Ohio? Because you're making me feel sus 😳",
-            "Girl, are you a sigma? Because you got that grindset 💪",
-            "Are you TikTok? Because I can't stop scrolling through my feelings for you 📱",
-            "Damn girl, you got more rizz than a Level 100 Gyatt 🔥",
-            "Are you Wi-Fi? Because I'm feeling a connection (no cap) 📶",
-            "Girl, you're bussin like a fresh batch of chicken nuggets 🐔",
-            "Are you my phone battery? Because you're at 100% and I need you all day 🔋",
-            "You must be from Ohio because you're making me act unwise 🤪",
-            "Are you a Discord mod? Because you just banned me from being normal 🎮",
-            "Girl, you're more fire than my mixtape (and that's saying something) 🎵",
-            "Are you a rare Pokémon? Because I choose you (periodt) ⚡",
-            "You got that main character energy and I'm just an NPC in love 💕",
-            "Are you a meme? Because you make me laugh and I want to share you with everyone 😂",
-            "Girl, you're giving me butterflies like I just hit a TikTok dance perfectly 🦋",
-            "Are you my sleep schedule? Because you're messed up but I can't live without you 😴",
-            "You're more addictive than scrolling through memes at 3 AM 🌙",
-            "Are you a notification? Because you always make my day better 📲",
-            "Girl, you're the only cheat code I need in this game called life 🎮",
-            "Are you my screen time? Because you're embarrassingly high but worth it 📊",
-            "You must be a limited edition because you're one of a kind (no printer) 🖨️"
-        ]
+        self.rizz_lines = RIZZ_LINES
         
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -185,6 +187,25 @@ class RizzGeneratorApp(QWidget):
         success_rate = min(self.rizz_count * 5, 100)
         self.stats_label.setText(f"Rizz Level: {level} | Success Rate: {success_rate}% | Lines Generated: {self.rizz_count}")
         
+    def save_state(self):
+        return {
+            "current_rizz": self.current_rizz,
+            "rizz_count": self.rizz_count,
+            "display": self.rizz_display.toPlainText(),
+            "stats": self.stats_label.text(),
+        }
+        
+    def restore_state(self, state):
+        self.current_rizz = state.get("current_rizz", self.current_rizz)
+        self.rizz_count = state.get("rizz_count", self.rizz_count)
+        self.rizz_display.setPlainText(state.get("display", self.rizz_display.toPlainText()))
+        self.stats_label.setText(state.get("stats", self.stats_label.text()))
+        
+    def reveal(self, line):
+        # Picked from the start menu search
+        self.current_rizz = line
+        self.rizz_display.setPlainText(line)
+        
     def copy_rizz(self):
         if self.current_rizz:
             from PyQt5.QtWidgets import QApplication
@@ -192,9 +213,13 @@ class RizzGeneratorApp(QWidget):
             clipboard.setText(self.current_rizz)
             
             # Show feedback
-            original_text = self.copy_btn.text()
+            if self.copy_btn.text() != "✅ Copied!":
+                self.copy_text = self.copy_btn.text()
             self.copy_btn.setText("✅ Copied!")
-            QTimer.singleShot(1000, lambda: self.copy_btn.setText(original_text))
+            QTimer.singleShot(1000, self.reset_copy_button)
+            
+    def reset_copy_button(self):
+        self.copy_btn.setText(self.copy_text)
         
     def rate_rizz(self):
         if not self.current_rizz:
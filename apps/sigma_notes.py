@@ -0,0 +1,762 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
+                             QAbstractScrollArea, QFileDialog, QShortcut, QApplication)
+from PyQt5.QtCore import Qt, QObject, QRect, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QKeySequence
+from bisect import bisect_left, bisect_right
+import mmap
+import os
+import re
+import threading
+import numpy as np
+
+import paths
+from search_index import SearchIndex
+
+ORIGINAL, ADDED = 0, 1
+NEWLINE = ord("\n")
+# Bytes that aren't valid UTF-8 decode to one lone surrogate each and encode back
+# to the same byte, so editing a log with stray bytes keeps offsets and content intact
+ERRORS = "surrogateescape"
+ESCAPED = re.compile("[\udc80-\udcff]")
+
+class LineIndex:
+    """Offsets of every newline in a document, filled in on a background thread.
+    
+    The offsets array grows in place as chunks are scanned, so the lines found
+    so far can be shown while the rest of a big file is still being indexed.
+    """
+    CHUNK = 16 * 1024 * 1024
+    
+    def __init__(self, size):
+        # Half the memory for files under 4 GB
+        self.dtype = np.uint32 if size < 2 ** 32 else np.int64
+        self.offsets = np.zeros(0, dtype=self.dtype)
+        self.count = 0
+        self.done = False
+        self.cancelled = False
+    
+    def newlines(self):
+        count = self.count  # read before the array, which only ever grows
+        return self.offsets[:count]
+    
+    def append(self, found):
+        needed = self.count + len(found)
+        if needed > len(self.offsets):
+            grown = np.empty(max(needed, 2 * len(self.offsets), 65536), dtype=self.dtype)
+            grown[:self.count] = self.offsets[:self.count]
+            self.offsets = grown
+        self.offsets[self.count:needed] = found
+        self.count = needed
+    
+    def scan(self, chunk, base):
+        """Index one chunk of the document that starts at byte offset base"""
+        found = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == NEWLINE)
+        if len(found):
+            self.append(found + base)
+    
+    def build(self, data, progress=None):
+        view = memoryview(data)
+        # Pages already scanned are dropped from the mapping (they stay in the page
+        # cache), so indexing a huge file doesn't show up as resident memory
+        advise = getattr(data, "madvise", None)
+        try:
+            for start in range(0, len(data), self.CHUNK):
+                if self.cancelled:
+                    return
+                self.scan(view[start:start + self.CHUNK], start)
+                if advise is not None:
+                    advise(mmap.MADV_DONTNEED, start, min(self.CHUNK, len(data) - start))
+                if progress is not None:
+                    progress()
+        finally:
+            # A live export would keep the mmap from being closed
+            view.release()
+        self.done = True
+        if progress is not None:
+            progress()
+
+class PieceTable:
+    """The document as spans of the original file and of an append-only buffer of added text.
+    
+    Opening a file copies nothing and an edit only splits spans, so typing in a
+    500 MB log costs the same as in an empty one. Line positions come from the
+    original's LineIndex plus a count of newlines in the added spans.
+    """
+    def __init__(self, original, index):
+        self.original = original
+        self.index = index
+        self.added = bytearray()
+        self.pieces = [(ORIGINAL, 0, len(original))] if len(original) else []
+        self.refresh()
+    
+    def refresh(self):
+        """Recompute where each piece starts, in bytes and in lines"""
+        self.starts = []         # byte offset of each piece
+        self.line_starts = []    # newlines before each piece
+        self.first_newline = []  # original pieces: position of their first newline in the index
+        offset = lines = 0
+        newlines = self.index.newlines()
+        for source, start, length in self.pieces:
+            self.starts.append(offset)
+            self.line_starts.append(lines)
+            if source == ORIGINAL:
+                first = int(np.searchsorted(newlines, start))
+                count = int(np.searchsorted(newlines, start + length)) - first
+            else:
+                first = 0
+                count = self.added.count(b"\n", start, start + length)
+            self.first_newline.append(first)
+            offset += length
+            lines += count
+        self.length = offset
+        self.newline_count = lines
+    
+    def line_count(self):
+        return self.newline_count + 1
+    
+    def piece_at(self, offset):
+        return bisect_right(self.starts, offset) - 1
+    
+    def read(self, offset, length):
+        end = min(offset + length, self.length)
+        parts = []
+        piece = max(0, self.piece_at(offset))
+        while offset < end:
+            source, start, size = self.pieces[piece]
+            skip = offset - self.starts[piece]
+            take = min(size - skip, end - offset)
+            buffer = self.original if source == ORIGINAL else self.added
+            parts.append(buffer[start + skip:start + skip + take])
+            offset += take
+            piece += 1
+        return b"".join(parts)
+    
+    def chunks(self, size):
+        """The whole document in pieces of at most size bytes, for saving"""
+        for source, start, length in self.pieces:
+            buffer = self.original if source == ORIGINAL else self.added
+            for offset in range(start, start + length, size):
+                yield buffer[offset:min(offset + size, start + length)]
+    
+    def line_start(self, line):
+        """Byte offset where a line (0-based) starts"""
+        if line <= 0:
+            return 0
+        if line > self.newline_count:
+            return self.length
+        # The line starts after the line-th newline; find the piece holding it
+        piece = bisect_left(self.line_starts, line) - 1
+        nth = line - self.line_starts[piece]
+        source, start, length = self.pieces[piece]
+        if source == ORIGINAL:
+            position = int(self.index.newlines()[self.first_newline[piece] + nth - 1])
+        else:
+            position = start - 1
+            for _ in range(nth):
+                position = self.added.index(b"\n", position + 1)
+        return self.starts[piece] + position - start + 1
+    
+    def line_end(self, line):
+        """Byte offset of the newline ending a line, or the document length"""
+        return self.line_start(line + 1) - 1 if line < self.newline_count else self.length
+    
+    def insert(self, offset, data):
+        if not data:
+            return
+        start = len(self.added)
+        self.added += data
+        piece = len(self.pieces) if offset >= self.length else self.piece_at(offset)
+        if piece < len(self.pieces) and offset > self.starts[piece]:
+            # Inside a piece: split it around the new text
+            source, piece_start, length = self.pieces[piece]
+            split = offset - self.starts[piece]
+            self.pieces[piece:piece + 1] = [(source, piece_start, split), (ADDED, start, len(data)),
+                                            (source, piece_start + split, length - split)]
+        elif piece > 0 and self.pieces[piece - 1][0] == ADDED and sum(self.pieces[piece - 1][1:]) == start:
+            # Typing on from the last insert just grows that piece
+            source, previous_start, length = self.pieces[piece - 1]
+            self.pieces[piece - 1] = (ADDED, previous_start, length + len(data))
+        else:
+            self.pieces.insert(piece, (ADDED, start, len(data)))
+        self.refresh()
+    
+    def delete(self, offset, length):
+        end = min(offset + length, self.length)
+        kept = []
+        for piece, (source, start, size) in enumerate(self.pieces):
+            piece_start = self.starts[piece]
+            piece_end = piece_start + size
+            if piece_end <= offset or piece_start >= end:
+                kept.append((source, start, size))
+                continue
+            if piece_start < offset:
+                kept.append((source, start, offset - piece_start))
+            if piece_end > end:
+                kept.append((source, start + end - piece_start, piece_end - end))
+        self.pieces = kept
+        self.refresh()
+
+class LargeDocument(QObject):
+    """A file opened through mmap, edited in a PieceTable and saved as a stream.
+    
+    Indexing and full saves run on a worker thread. Edits are refused until
+    the index is complete and while a save is in progress.
+    """
+    indexed = pyqtSignal()
+    saved = pyqtSignal(object)   # error message or None
+    changed = pyqtSignal()
+    written = pyqtSignal(object, object)   # from the save thread: new index, error
+    
+    SAVE_CHUNK = 1024 * 1024
+    
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.saving = None
+        self.modified = False
+        self.indexed.connect(self.index_progress)
+        self.written.connect(self.finish_save)
+        self.load()
+    
+    def load(self, index=None):
+        size = os.path.getsize(self.path)
+        data = b""
+        if size:
+            with open(self.path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = size
+        if index is None:
+            index = LineIndex(size)
+            threading.Thread(target=index.build, args=(data, self.indexed.emit),
+                             name="brainrot-notes-index", daemon=True).start()
+        self.index = index
+        self.table = PieceTable(data, index)
+    
+    def close(self):
+        self.index.cancelled = True
+    
+    def index_progress(self):
+        # Only the untouched original piece exists until indexing is done
+        self.table.refresh()
+    
+    @property
+    def editable(self):
+        return self.index.done and self.saving is None
+    
+    @property
+    def progress(self):
+        if self.index.done or not self.size:
+            return 1.0
+        last = self.index.newlines()
+        return int(last[-1]) / self.size if len(last) else 0.0
+    
+    def insert(self, offset, data):
+        self.table.insert(offset, data)
+        self.modified = True
+        self.changed.emit()
+    
+    def delete(self, offset, length):
+        self.table.delete(offset, length)
+        self.modified = True
+        self.changed.emit()
+    
+    def appended_only(self):
+        """True when the edits are all appends to a file that hasn't changed on disk"""
+        pieces = self.table.pieces
+        untouched = not self.size or pieces[:1] == [(ORIGINAL, 0, self.size)]
+        return (untouched and all(source == ADDED for source, _, _ in pieces[1 if self.size else 0:])
+                and os.path.getsize(self.path) == self.size)
+    
+    def save(self, wait=False):
+        if not self.modified or self.saving is not None:
+            if wait and self.saving is not None:
+                self.saving.join()
+            return
+        if self.appended_only():
+            # Write only the new text and extend the index with it
+            offset = self.size
+            try:
+                with open(self.path, "ab") as f:
+                    for source, start, length in self.table.pieces[1 if self.size else 0:]:
+                        chunk = bytes(self.table.added[start:start + length])
+                        f.write(chunk)
+                        self.index.scan(chunk, offset)
+                        offset += length
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                self.saved.emit(e.strerror or str(e))
+                return
+            self.finish_save(self.index, None)
+            return
+        self.saving = threading.Thread(target=self.write_copy, name="brainrot-notes-save", daemon=True)
+        self.saving.start()
+        if wait:
+            self.saving.join()
+    
+    def write_copy(self):
+        """Stream the document to a temp file, indexing it as it goes, then swap it in"""
+        index = LineIndex(self.table.length)
+        temp_file = self.path + ".tmp"
+        offset = 0
+        error = None
+        try:
+            with open(temp_file, "wb") as f:
+                for chunk in self.table.chunks(self.SAVE_CHUNK):
+                    f.write(chunk)
+                    index.scan(chunk, offset)
+                    offset += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.path)
+        except OSError as e:
+            error = e.strerror or str(e)
+        self.written.emit(index, error)
+    
+    def finish_save(self, index, error):
+        if error is None:
+            # The saved file is the new original; its index came for free
+            index.done = True
+            self.load(index)
+            self.modified = False
+        self.saving = None
+        self.saved.emit(error)
+
+class TextView(QAbstractScrollArea):
+    """Plain text view that lays out and paints only the lines on screen.
+    
+    Lines are read from the document as they are painted; nothing is kept per
+    line, so memory stays flat however long the file is. Assumes a monospaced
+    font, which keeps column math to a multiplication.
+    """
+    MAX_LINE_BYTES = 64 * 1024
+    TAB_WIDTH = 4
+    
+    def __init__(self):
+        super().__init__()
+        self.document = None
+        self.cursor_line = 0
+        self.cursor_column = 0
+        self.widest = 0
+        
+        font = QFont("Courier New", 11)
+        font.setStyleHint(QFont.Monospace)
+        self.setFont(font)
+        metrics = QFontMetrics(font)
+        self.ascent = metrics.ascent()
+        self.line_height = metrics.lineSpacing()
+        self.char_width = metrics.horizontalAdvance("M")
+        self.digit_width = metrics.horizontalAdvance("9")
+        
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.viewport().setCursor(Qt.IBeamCursor)
+        self.setStyleSheet("""
+            QAbstractScrollArea {
+                background-color: #0f0f1e;
+                border: 2px solid #ff00ff;
+                border-radius: 8px;
+            }
+        """)
+    
+    def set_document(self, document):
+        self.document = document
+        self.cursor_line = self.cursor_column = 0
+        self.widest = 0
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+        self.document_changed()
+    
+    def document_changed(self):
+        self.update_scrollbars()
+        self.viewport().update()
+    
+    def visible_lines(self):
+        return max(1, self.viewport().height() // self.line_height)
+    
+    def gutter_width(self):
+        return self.digit_width * len(str(self.document.table.line_count())) + 16
+    
+    def update_scrollbars(self):
+        if self.document is None:
+            return
+        rows = self.visible_lines()
+        self.verticalScrollBar().setRange(0, max(0, self.document.table.line_count() - rows))
+        self.verticalScrollBar().setPageStep(rows)
+        self.update_horizontal_range()
+    
+    def update_horizontal_range(self):
+        text_width = self.viewport().width() - self.gutter_width()
+        self.horizontalScrollBar().setRange(0, max(0, (self.widest + 1) * self.char_width - text_width))
+        self.horizontalScrollBar().setPageStep(max(1, text_width))
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_scrollbars()
+    
+    def line_text(self, line):
+        table = self.document.table
+        start = table.line_start(line)
+        data = table.read(start, min(table.line_end(line) - start, self.MAX_LINE_BYTES + 1))
+        if len(data) > self.MAX_LINE_BYTES:
+            # Cut before a character, not inside one
+            cut = self.MAX_LINE_BYTES
+            while cut > self.MAX_LINE_BYTES - 3 and data[cut] & 0xC0 == 0x80:
+                cut -= 1
+            data = data[:cut]
+        return data.decode("utf-8", ERRORS).rstrip("\r")
+    
+    def byte_length(self, text):
+        return len(text.encode("utf-8", ERRORS))
+    
+    def display_column(self, text, column):
+        return len(text[:column].expandtabs(self.TAB_WIDTH))
+    
+    def paintEvent(self, event):
+        if self.document is None:
+            return
+        painter = QPainter(self.viewport())
+        width, height = self.viewport().width(), self.viewport().height()
+        gutter = self.gutter_width()
+        painter.fillRect(0, 0, gutter, height, QColor("#16213e"))
+        
+        table = self.document.table
+        first = self.verticalScrollBar().value()
+        scroll_x = self.horizontalScrollBar().value()
+        # Only the columns in view are drawn, so a 64 KB line costs the same as a short one
+        first_column = scroll_x // self.char_width
+        columns = width // self.char_width + 2
+        text_x = gutter + 4 - scroll_x % self.char_width
+        widest = self.widest
+        
+        for row in range(min(height // self.line_height + 1, table.line_count() - first)):
+            line = first + row
+            y = row * self.line_height
+            painter.setPen(QColor("#666699"))
+            painter.drawText(QRect(0, y, gutter - 8, self.line_height), Qt.AlignRight | Qt.AlignVCenter, str(line + 1))
+            text = self.line_text(line)
+            # Escaped bytes can't be drawn; show each as one replacement character
+            display = ESCAPED.sub("\ufffd", text).expandtabs(self.TAB_WIDTH)
+            widest = max(widest, len(display))
+            painter.setPen(QColor("#00ff88"))
+            painter.setClipRect(gutter, 0, width - gutter, height)
+            painter.drawText(text_x, y + self.ascent, display[first_column:first_column + columns])
+            if line == self.cursor_line and self.hasFocus():
+                column = self.display_column(text, self.cursor_column) - first_column
+                painter.fillRect(text_x + column * self.char_width, y, 2, self.line_height, QColor("#ff00ff"))
+            painter.setClipping(False)
+        
+        if widest > self.widest:
+            self.widest = widest
+            self.update_horizontal_range()
+    
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+    
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        self.viewport().update()
+    
+    def focusOutEvent(self, event):
+        super().focusOutEvent(event)
+        self.viewport().update()
+    
+    def mousePressEvent(self, event):
+        if self.document is None or event.button() != Qt.LeftButton:
+            return super().mousePressEvent(event)
+        line = min(self.verticalScrollBar().value() + event.pos().y() // self.line_height,
+                   self.document.table.line_count() - 1)
+        x = event.pos().x() - self.gutter_width() - 4 + self.horizontalScrollBar().value()
+        target = max(0, round(x / self.char_width))
+        text = self.line_text(line)
+        column = 0
+        while column < len(text) and self.display_column(text, column + 1) <= target:
+            column += 1
+        self.set_cursor(line, column)
+    
+    def set_cursor(self, line, column):
+        line = max(0, min(line, self.document.table.line_count() - 1))
+        self.cursor_line = line
+        self.cursor_column = max(0, min(column, len(self.line_text(line))))
+        self.ensure_cursor_visible()
+        self.viewport().update()
+    
+    def ensure_cursor_visible(self):
+        bar = self.verticalScrollBar()
+        rows = self.visible_lines()
+        if self.cursor_line < bar.value():
+            bar.setValue(self.cursor_line)
+        elif self.cursor_line >= bar.value() + rows:
+            bar.setValue(self.cursor_line - rows + 1)
+        x = self.display_column(self.line_text(self.cursor_line), self.cursor_column) * self.char_width
+        bar = self.horizontalScrollBar()
+        text_width = self.viewport().width() - self.gutter_width() - self.char_width
+        if x < bar.value():
+            bar.setValue(x)
+        elif x > bar.value() + text_width:
+            if x > bar.maximum() + text_width:
+                self.widest = max(self.widest, x // self.char_width + 1)
+                self.update_horizontal_range()
+            bar.setValue(x - text_width)
+    
+    def cursor_offset(self):
+        text = self.line_text(self.cursor_line)
+        return self.document.table.line_start(self.cursor_line) + self.byte_length(text[:self.cursor_column])
+    
+    def insert_text(self, text):
+        self.document.insert(self.cursor_offset(), text.encode("utf-8", ERRORS))
+        lines = text.split("\n")
+        if len(lines) > 1:
+            self.cursor_line += len(lines) - 1
+            self.cursor_column = len(lines[-1])
+        else:
+            self.cursor_column += len(text)
+        self.update_scrollbars()
+        self.set_cursor(self.cursor_line, self.cursor_column)
+    
+    def delete_backward(self):
+        table = self.document.table
+        if self.cursor_column > 0:
+            text = self.line_text(self.cursor_line)
+            length = self.byte_length(text[self.cursor_column - 1])
+            self.document.delete(self.cursor_offset() - length, length)
+            self.set_cursor(self.cursor_line, self.cursor_column - 1)
+        elif self.cursor_line > 0:
+            # Join with the line above, dropping its line break (\n or \r\n)
+            previous = self.line_text(self.cursor_line - 1)
+            end = table.line_start(self.cursor_line - 1) + self.byte_length(previous)
+            self.document.delete(end, table.line_start(self.cursor_line) - end)
+            self.update_scrollbars()
+            self.set_cursor(self.cursor_line - 1, len(previous))
+    
+    def delete_forward(self):
+        table = self.document.table
+        text = self.line_text(self.cursor_line)
+        offset = self.cursor_offset()
+        if self.cursor_column < len(text):
+            self.document.delete(offset, self.byte_length(text[self.cursor_column]))
+        elif self.cursor_line < table.line_count() - 1:
+            self.document.delete(offset, table.line_start(self.cursor_line + 1) - offset)
+            self.update_scrollbars()
+        self.viewport().update()
+    
+    def keyPressEvent(self, event):
+        if self.document is None:
+            return super().keyPressEvent(event)
+        key = event.key()
+        control = event.modifiers() & Qt.ControlModifier
+        line, column = self.cursor_line, self.cursor_column
+        rows = self.visible_lines()
+        
+        # Moving around works while the file is still being indexed
+        if key == Qt.Key_Left:
+            if column > 0:
+                self.set_cursor(line, column - 1)
+            elif line > 0:
+                self.set_cursor(line - 1, len(self.line_text(line - 1)))
+        elif key == Qt.Key_Right:
+            if column < len(self.line_text(line)):
+                self.set_cursor(line, column + 1)
+            else:
+                self.set_cursor(line + 1, 0)
+        elif key == Qt.Key_Up:
+            self.set_cursor(line - 1, column)
+        elif key == Qt.Key_Down:
+            self.set_cursor(line + 1, column)
+        elif key == Qt.Key_PageUp:
+            self.set_cursor(line - rows, column)
+        elif key == Qt.Key_PageDown:
+            self.set_cursor(line + rows, column)
+        elif key == Qt.Key_Home:
+            self.set_cursor(0 if control else line, 0)
+        elif key == Qt.Key_End:
+            if control:
+                last = self.document.table.line_count() - 1
+                self.set_cursor(last, len(self.line_text(last)))
+            else:
+                self.set_cursor(line, len(self.line_text(line)))
+        elif not self.document.editable:
+            return super().keyPressEvent(event)
+        elif key in (Qt.Key_Return, Qt.Key_Enter):
+            self.insert_text("\n")
+        elif key == Qt.Key_Backspace:
+            self.delete_backward()
+        elif key == Qt.Key_Delete:
+            self.delete_forward()
+        elif key == Qt.Key_Tab:
+            self.insert_text("\t")
+        elif event.text() and event.text().isprintable() and not control:
+            self.insert_text(event.text())
+        else:
+            return super().keyPressEvent(event)
+
+class SigmaNotesApp(QWidget):
+    def __init__(self, path=None):
+        super().__init__()
+        self.setWindowTitle("📝 Sigma Notes")
+        self.setGeometry(160, 90, 860, 600)
+        self.setStyleSheet("""
+            QWidget {
+                background-color: #1a1a2e;
+                color: white;
+                font-family: 'Courier New';
+            }
+        """)
+        
+        self.document = None
+        self.setup_ui()
+        self.open_file(path or self.scratch_path())
+        
+        QShortcut(QKeySequence.Save, self, self.save)
+        QShortcut(QKeySequence.Open, self, self.choose_file)
+        # Don't lose edits in a window that is still open at shutdown
+        QApplication.instance().aboutToQuit.connect(self.save_now)
+    
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        
+        # Title
+        title = QLabel("📝 SIGMA NOTES 📝")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("""
+            QLabel {
+                font-size: 20px;
+                font-weight: bold;
+                color: #ff00ff;
+                margin: 10px;
+                border: 2px solid #00ff88;
+                padding: 10px;
+                border-radius: 10px;
+            }
+        """)
+        
+        # File bar
+        file_layout = QHBoxLayout()
+        self.path_input = QLineEdit()
+        self.path_input.setStyleSheet("""
+            QLineEdit {
+                background-color: #2d2d44;
+                border: 2px solid #ff00ff;
+                border-radius: 8px;
+                padding: 6px;
+                font-size: 12px;
+            }
+        """)
+        self.path_input.returnPressed.connect(lambda: self.open_file(self.path_input.text()))
+        open_button = QPushButton("📂 Open")
+        open_button.clicked.connect(self.choose_file)
+        save_button = QPushButton("💾 Save")
+        save_button.clicked.connect(self.save)
+        for button in (open_button, save_button):
+            button.setStyleSheet("""
+                QPushButton {
+                    background-color: #2d2d44;
+                    border: 2px solid #00ff88;
+                    border-radius: 8px;
+                    padding: 6px 12px;
+                    font-size: 12px;
+                }
+                QPushButton:hover {
+                    background-color: #3d3d5c;
+                }
+            """)
+        file_layout.addWidget(self.path_input, 1)
+        file_layout.addWidget(open_button)
+        file_layout.addWidget(save_button)
+        
+        self.view = TextView()
+        
+        self.status_label = QLabel("📝 Ready")
+        self.status_label.setStyleSheet("color: #aaaaaa; font-size: 11px; padding: 2px;")
+        
+        layout.addWidget(title)
+        layout.addLayout(file_layout)
+        layout.addWidget(self.view)
+        layout.addWidget(self.status_label)
+        self.setLayout(layout)
+    
+    def scratch_path(self):
+        path = paths.data_path("sigma_notes.txt")
+        if not os.path.exists(path):
+            open(path, "ab").close()
+        return path
+    
+    def choose_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open in Sigma Notes", os.path.dirname(self.document.path))
+        if path:
+            self.open_file(path)
+    
+    def open_file(self, path):
+        path = os.path.abspath(os.path.expanduser(path))
+        if not os.path.isfile(path):
+            self.status_label.setText(f"💀 Not a file: {path}")
+            self.path_input.setText(self.document.path if self.document else "")
+            return
+        if self.document is not None:
+            if self.document.modified:
+                self.document.save(wait=True)
+            self.document.close()
+        try:
+            self.document = LargeDocument(path)
+        except OSError as e:
+            self.status_label.setText(f"💀 Could not open {path}: {e.strerror or e}")
+            return
+        self.document.indexed.connect(self.document_indexed)
+        self.document.changed.connect(self.update_status)
+        self.document.saved.connect(self.document_saved)
+        self.path_input.setText(path)
+        self.view.set_document(self.document)
+        self.update_status()
+        SearchIndex.instance().add_recent_file(path, "notes")
+    
+    def document_indexed(self):
+        self.view.document_changed()
+        self.update_status()
+    
+    def document_saved(self, error):
+        self.view.document_changed()
+        self.update_status(f"💀 Save failed: {error}" if error else None)
+    
+    def save(self):
+        if self.document is not None and self.document.modified:
+            self.document.save()
+            self.update_status()
+    
+    def save_now(self):
+        if self.document is not None:
+            self.document.save(wait=True)
+    
+    def update_status(self, message=None):
+        document = self.document
+        size = document.table.length
+        text = f"{document.table.line_count():,} lines · {size / (1024 * 1024):.1f} MB"
+        if document.saving is not None:
+            text = "💾 Saving... " + text
+        elif not document.index.done:
+            text = f"⏳ Indexing {document.progress:.0%} (read-only until done) · " + text
+        elif document.modified:
+            text = "✏️ Modified · " + text
+        else:
+            text = "📝 " + text
+        self.status_label.setText(message or text)
+        self.setWindowTitle(("* " if document.modified else "") + f"📝 Sigma Notes - {os.path.basename(document.path)}")
+    
+    def reveal(self, path):
+        # Picked from the start menu search
+        if path != self.document.path:
+            self.open_file(path)
+    
+    def suspend(self):
+        # Hidden windows may be closed by the registry: keep the edits
+        self.save()
+    
+    def save_state(self):
+        return {"path": self.document.path, "line": self.view.verticalScrollBar().value(),
+                "cursor": [self.view.cursor_line, self.view.cursor_column]}
+    
+    def restore_state(self, state):
+        if state.get("path") and state["path"] != self.document.path and os.path.isfile(state["path"]):
+            self.open_file(state["path"])
+        # Lines past what has been indexed so far clamp to the end
+        line, column = state.get("cursor", [0, 0])
+        self.view.set_cursor(line, column)
+        self.view.verticalScrollBar().setValue(state.get("line", 0))
@@ -4,9 +4,11 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 import random
 import pygame
-import numpy as np
 import os
 
+import sound_assets
+from audio_synth import SOUND_RECIPES, render
+
 class SoundPlayerApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -30,15 +32,14 @@ class SoundPlayerApp(QWidget):
             print(f"⚠️ Audio initialization failed: {e}")
             self.audio_enabled = False
             
-        # Generate sounds on first run
+        # Sounds are loaded from their prebuilt WAVs on first play and dropped again while the player is hidden
+        self.sound_names = list(SOUND_RECIPES) if self.audio_enabled else []
         self.sounds = {}
-        self.generate_meme_sounds()
         
         self.setup_ui()
         
-        # Update meme sounds to match generated sounds
         self.meme_sounds = []
-        for sound_name in self.sounds.keys():
+        for sound_name in self.sound_names:
             # Extract duration info (approximate)
             duration = "0:01" if "Beep" in sound_name or "Ding" in sound_name else "0:03"
             if "Startup" in sound_name or "Trombone" in sound_name:
@@ -57,8 +58,7 @@ class SoundPlayerApp(QWidget):
             self.meme_sounds.append({
                 "name": sound_name,
                 "duration": duration,
-                "vibe": vibe,
-                "pygame_sound": self.sounds[sound_name]
+                "vibe": vibe
             })
         
         self.current_sound = None
@@ -66,91 +66,61 @@ class SoundPlayerApp(QWidget):
         self.current_pygame_sound = None
         self.populate_playlist()
         
-    def generate_tone(self, frequency, duration, sample_rate=22050, amplitude=0.5):
-        """Generate a simple sine wave tone"""
-        frames = int(duration * sample_rate)
-        arr = np.zeros(frames)
-        
-        for i in range(frames):
-            arr[i] = amplitude * np.sin(2 * np.pi * frequency * i / sample_rate)
-        
-        # Convert to 16-bit integers and make stereo
-        arr = (arr * 32767).astype(np.int16)
-        stereo_arr = np.column_stack((arr, arr))  # Make stereo
-        return stereo_arr
-    
-    def generate_sweep(self, start_freq, end_freq, duration, sample_rate=22050, amplitude=0.5):
-        """Generate a frequency sweep"""
-        frames = int(duration * sample_rate)
-        arr = np.zeros(frames)
-        
-        for i in range(frames):
-            freq = start_freq + (end_freq - start_freq) * (i / frames)
-            arr[i] = amplitude * np.sin(2 * np.pi * freq * i / sample_rate)
-        
-        # Apply envelope to avoid clicks
-        envelope_len = frames // 10
-        envelope = np.linspace(0, 1, envelope_len)
-        arr[:envelope_len] *= envelope
-        arr[-envelope_len:] *= envelope[::-1]
-        
-        arr = (arr * 32767).astype(np.int16)
-        stereo_arr = np.column_stack((arr, arr))
-        return stereo_arr
-    
-    def generate_noise_burst(self, duration, sample_rate=22050, amplitude=0.3):
-        """Generate a noise burst"""
-        frames = int(duration * sample_rate)
-        arr = np.random.normal(0, amplitude, frames)
-        
-        # Apply envelope
-        envelope = np.exp(-np.linspace(0, 5, frames))
-        arr *= envelope
-        
-        arr = (arr * 32767).astype(np.int16)
-        stereo_arr = np.column_stack((arr, arr))
-        return stereo_arr
-    
-    def generate_meme_sounds(self):
-        """Generate all meme sounds"""
-        if not self.audio_enabled:
-            return
-            
-        try:
-            print("🎵 Generating meme sounds...")
+    def load_sound(self, name):
+        """The pygame Sound for name, read on first use"""
+        sound = self.sounds.get(name)
+        if sound is None and name in SOUND_RECIPES:
+            try:
+                sound = self.read_sound(name)
+                self.sounds[name] = sound
+            except Exception as e:
+                print(f"⚠️ Failed to load {name}: {e}")
+        return sound
+        
+    def read_sound(self, name):
+        frequency, size, channels = pygame.mixer.get_init()
+        path = sound_assets.find(name, frequency, channels)
+        if path is None:
+            # Not built for this mixer format: synthesize it once and keep the WAV for next time
+            pcm = render(SOUND_RECIPES[name], frequency, channels)
+            path = sound_assets.save(name, pcm, frequency, channels)
+            if path is None:
+                return pygame.sndarray.make_sound(pcm)
+        with sound_assets.open_wav(path) as (rate, file_channels, width, samples):
+            if (rate, file_channels, width, size) == (frequency, channels, 2, -16):
+                # Already in the mixer's format: hand over the mapped samples as they are
+                return pygame.mixer.Sound(buffer=samples)
+        return pygame.mixer.Sound(file=path)
             
-            # Generate different meme sounds
-            sound_generators = {
-                '🔊 MLG Airhorn': lambda: self.generate_tone(1000, 0.3, amplitude=0.6),
-                '🗿 Vine Boom': lambda: self.generate_sweep(80, 40, 0.5, amplitude=0.8),
-                '💻 Windows XP Startup': lambda: self.generate_sweep(200, 800, 1.0, amplitude=0.4),
-                '🚫 Error Sound': lambda: self.generate_sweep(600, 200, 0.8, amplitude=0.5),
-                '✅ Success Sound': lambda: self.generate_sweep(300, 600, 0.6, amplitude=0.4),
-                '🔔 Notification': lambda: self.generate_tone(800, 0.2, amplitude=0.3),
-                '🌪️ Whoosh': lambda: self.generate_sweep(1000, 100, 0.4, amplitude=0.4),
-                '📺 Static': lambda: self.generate_noise_burst(0.3, amplitude=0.2),
-                '🔔 Ding': lambda: self.generate_tone(1200, 0.5, amplitude=0.3),
-                '🚨 Buzzer': lambda: self.generate_tone(150, 0.8, amplitude=0.5),
-                '🎺 Sad Trombone': lambda: self.generate_sweep(200, 100, 1.2, amplitude=0.4),
-                '⚡ Zap': lambda: self.generate_noise_burst(0.1, amplitude=0.5),
-                '🔊 Bass Drop': lambda: self.generate_sweep(60, 30, 0.8, amplitude=0.9),
-                '🎸 Guitar Riff': lambda: self.generate_tone(440, 0.4, amplitude=0.5),
-                '🤖 Robot Beep': lambda: self.generate_tone(1500, 0.15, amplitude=0.4)
-            }
+    def suspend(self):
+        # Hidden: stop playing and free the loaded buffers
+        self.stop_sound()
+        self.current_pygame_sound = None
+        self.sounds.clear()
             
-            for name, generator in sound_generators.items():
-                try:
-                    audio_data = generator()
-                    sound = pygame.sndarray.make_sound(audio_data)
-                    self.sounds[name] = sound
-                except Exception as e:
-                    print(f"⚠️ Failed to generate {name}: {e}")
+    def save_state(self):
+        return {
+            "volume": self.volume_slider.value(),
+            "current": self.current_sound["name"] if self.current_sound else None,
+        }
                     
-            print(f"✅ Generated {len(self.sounds)} meme sounds!")
-            
-        except Exception as e:
-            print(f"⚠️ Sound generation failed: {e}")
-            self.audio_enabled = False
+    def restore_state(self, state):
+        self.volume_slider.setValue(state.get("volume", self.volume_slider.value()))
+        self.select_named(state.get("current"))
+        
+    def select_named(self, name):
+        for i in range(self.playlist.count()):
+            item = self.playlist.item(i)
+            if item.data(Qt.UserRole)["name"] == name:
+                self.playlist.setCurrentItem(item)
+                self.select_sound(item)
+                return True
+        return False
+        
+    def reveal(self, name):
+        # Picked from the start menu search: play it right away
+        if self.select_named(name) and not self.is_playing:
+            self.play_sound()
         
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -362,8 +332,9 @@ class SoundPlayerApp(QWidget):
         
         # Play the actual pygame sound
         try:
-            if 'pygame_sound' in self.current_sound:
-                self.current_pygame_sound = self.current_sound['pygame_sound']
+            sound = self.load_sound(self.current_sound['name'])
+            if sound is not None:
+                self.current_pygame_sound = sound
                 # Set volume based on slider
                 volume = self.volume_slider.value() / 100.0
                 self.current_pygame_sound.set_volume(volume)
@@ -428,14 +399,16 @@ class SoundPlayerApp(QWidget):
         # Play multiple random sounds in sequence
         self.now_playing.setText("🌪️ CHAOS MODE ACTIVATED! 🌪️")
         
-        chaos_sounds = random.sample(self.meme_sounds, min(5, len(self.meme_sounds)))
-        
-        def play_next_chaos_sound(index=0):
-            if index < len(chaos_sounds):
-                self.current_sound = chaos_sounds[index]
-                self.now_playing.setText(f"🌪️ CHAOS: {self.current_sound['name']} ({index+1}/{len(chaos_sounds)})")
-                QTimer.singleShot(1000, lambda: play_next_chaos_sound(index + 1))
-            else:
-                self.now_playing.setText("🌪️ Chaos complete! Your ears have been blessed 🙏")
-                
-        play_next_chaos_sound()
+        self.chaos_sounds = random.sample(self.meme_sounds, min(5, len(self.meme_sounds)))
+        self.chaos_index = 0
+        self.play_next_chaos_sound()
+        
+    def play_next_chaos_sound(self):
+        # A bound method, so a pending step is dropped if the window is closed
+        if self.chaos_index < len(self.chaos_sounds):
+            self.current_sound = self.chaos_sounds[self.chaos_index]
+            self.chaos_index += 1
+            self.now_playing.setText(f"🌪️ CHAOS: {self.current_sound['name']} ({self.chaos_index}/{len(self.chaos_sounds)})")
+            QTimer.singleShot(1000, self.play_next_chaos_sound)
+        else:
+            self.now_playing.setText("🌪️ Chaos complete! Your ears have been blessed 🙏")
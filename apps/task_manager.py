@@ -0,0 +1,396 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QTableView, QAbstractItemView, QApplication)
+from PyQt5.QtCore import (Qt, QObject, QTimer, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel, pyqtSignal)
+import os
+import threading
+import time
+
+from frame_clock import FrameClock
+from app_registry import AppRegistry
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+class ProcessScanner(QObject):
+    """Scans /proc on a background thread and emits only what changed.
+    
+    Each pass does one small read of /proc/<pid>/stat per process. Entries whose
+    stat bytes are unchanged are not parsed again, the command line is only
+    read for new processes, and the result is a diff of (added, changed, removed).
+    """
+    scanned = pyqtSignal(object)
+    
+    INTERVAL = 2.0
+    
+    def __init__(self):
+        super().__init__()
+        self.raw = {}         # pid -> last stat bytes
+        self.known = {}       # pid -> (start time, cpu ticks, row tuple)
+        self.last_scan = None
+        self.active = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = None
+    
+    @property
+    def available(self):
+        return os.path.isdir("/proc") and os.path.exists("/proc/self/stat")
+    
+    def resume(self):
+        if not self.available:
+            return
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="brainrot-task-scanner", daemon=True)
+            self.thread.start()
+        # CPU since before the pause would be a meaningless average
+        self.last_scan = None
+        self.active.set()
+    
+    def pause(self):
+        self.active.clear()
+    
+    def stop(self):
+        self.stopping.set()
+        self.active.set()
+    
+    def run(self):
+        while True:
+            self.active.wait()
+            if self.stopping.is_set():
+                break
+            self.scanned.emit(self.scan())
+            if self.stopping.wait(self.INTERVAL):
+                break
+    
+    def scan(self):
+        now = time.monotonic()
+        elapsed = now - self.last_scan if self.last_scan else None
+        self.last_scan = now
+        
+        added, changed, reused = [], [], []
+        seen = set()
+        for name in os.listdir("/proc"):
+            if not name.isdigit():
+                continue
+            pid = int(name)
+            try:
+                with open(f"/proc/{name}/stat", "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue  # exited while we were looking
+            seen.add(pid)
+            
+            previous = self.known.get(pid)
+            if previous is not None and data == self.raw[pid]:
+                # Untouched since the last pass; only a non-zero CPU reading goes stale
+                if previous[2][2]:
+                    row = previous[2][:2] + (0.0,) + previous[2][3:]
+                    self.known[pid] = (previous[0], previous[1], row)
+                    changed.append(row)
+                continue
+            stats = self.parse_stat(pid, data)
+            if stats is None:
+                continue
+            # Kept only for pids in known, which is what the cleanup below walks
+            self.raw[pid] = data
+            comm, start_time, ticks, threads, rss = stats
+            
+            if previous is not None and previous[0] != start_time:
+                # The pid was reused by a new process: drop the old row, add a new one
+                reused.append(pid)
+                previous = None
+            
+            if previous is None:
+                cpu = 0.0
+                row = (pid, comm, cpu, rss, threads, self.read_command(pid) or comm)
+                added.append(row)
+            else:
+                cpu = 100.0 * (ticks - previous[1]) / CLOCK_TICKS / elapsed if elapsed else 0.0
+                row = (pid, comm, round(cpu, 1), rss, threads, previous[2][5])
+                if row != previous[2]:
+                    changed.append(row)
+            self.known[pid] = (start_time, ticks, row)
+        
+        removed = [pid for pid in self.known if pid not in seen]
+        for pid in removed:
+            del self.known[pid]
+            del self.raw[pid]
+        
+        # Removals are applied before additions, so reused pids get a fresh row
+        return {"added": added, "changed": changed, "removed": removed + reused}
+    
+    def parse_stat(self, pid, data):
+        """(comm, start time, utime+stime ticks, threads, rss bytes) from /proc/<pid>/stat"""
+        try:
+            # comm may itself contain spaces and parentheses
+            close = data.rindex(b")")
+            comm = data[data.index(b"(") + 1:close].decode("utf-8", "replace")
+            fields = data[close + 2:].split()
+            ticks = int(fields[11]) + int(fields[12])
+            return comm, int(fields[19]), ticks, int(fields[17]), int(fields[21]) * PAGE_SIZE
+        except (ValueError, IndexError):
+            return None
+    
+    def read_command(self, pid):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                args = f.read().split(b"\0")
+        except OSError:
+            return ""
+        args = [arg.decode("utf-8", "replace") for arg in args if arg]
+        if not args:
+            return ""
+        return " ".join([os.path.basename(args[0])] + args[1:])[:120]
+
+class ProcessTableModel(QAbstractTableModel):
+    """Process rows kept in place; scans are applied as row inserts/removes/changes"""
+    HEADERS = ["PID", "Name", "CPU %", "Memory (MB)", "Threads", "Command"]
+    COLUMN_WIDTHS = [60, 150, 60, 95, 65]
+    
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self.index_of = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        row = self.rows[index.row()]
+        column = index.column()
+        if role == Qt.UserRole:
+            # Raw value for sorting
+            return row[column]
+        if role == Qt.DisplayRole:
+            if column == 2:
+                return f"{row[2]:.1f}"
+            if column == 3:
+                return f"{row[3] / (1024 * 1024):.1f}"
+            return str(row[column])
+        if role == Qt.TextAlignmentRole and column in (0, 2, 3, 4):
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+    
+    def row_for(self, pid):
+        index = self.index_of.get(pid)
+        return None if index is None else self.rows[index]
+    
+    def apply(self, diff):
+        removed = sorted((self.index_of[pid] for pid in diff["removed"] if pid in self.index_of), reverse=True)
+        for index in removed:
+            self.beginRemoveRows(QModelIndex(), index, index)
+            del self.rows[index]
+            self.endRemoveRows()
+        if removed:
+            self.index_of = {row[0]: index for index, row in enumerate(self.rows)}
+        
+        last_column = len(self.HEADERS) - 1
+        for row in diff["changed"]:
+            index = self.index_of.get(row[0])
+            if index is not None:
+                self.rows[index] = row
+                self.dataChanged.emit(self.index(index, 0), self.index(index, last_column))
+        
+        added = [row for row in diff["added"] if row[0] not in self.index_of]
+        if added:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for offset, row in enumerate(added):
+                self.index_of[row[0]] = first + offset
+                self.rows.append(row)
+            self.endInsertRows()
+
+class TaskManagerApp(QWidget):
+    def __init__(self, registry=None):
+        super().__init__()
+        self.setWindowTitle("🧮 Brainrot Task Manager")
+        self.setGeometry(200, 120, 760, 560)
+        self.setStyleSheet("""
+            QWidget {
+                background-color: #1a1a2e;
+                color: white;
+                font-family: 'Courier New';
+            }
+        """)
+        
+        # The desktop's app registry, to report which app windows are alive and their launch cost
+        self.registry = registry or AppRegistry.instance()
+        
+        self.scanner = ProcessScanner()
+        self.scanner.scanned.connect(self.apply_scan)
+        # The registry may destroy this window while hidden; don't leave the scan thread behind
+        self.destroyed.connect(self.scanner.stop)
+        self.model = ProcessTableModel()
+        
+        self.setup_ui()
+    
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        
+        # Title
+        title = QLabel("🧮 BRAINROT TASK MANAGER 🧮")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("""
+            QLabel {
+                font-size: 20px;
+                font-weight: bold;
+                color: #00ff00;
+                margin: 10px;
+                border: 2px solid #ff00ff;
+                padding: 10px;
+                border-radius: 10px;
+            }
+        """)
+        
+        # BrainrotOS's own footprint
+        stats_layout = QHBoxLayout()
+        self.self_label = QLabel("🧠 BrainrotOS: scanning...")
+        self.self_label.setStyleSheet(self.get_panel_style("#00ffff"))
+        self.windows_label = QLabel("🪟 App windows: none yet")
+        self.windows_label.setStyleSheet(self.get_panel_style("#ffff00"))
+        self.windows_label.setWordWrap(True)
+        stats_layout.addWidget(self.self_label, 1)
+        stats_layout.addWidget(self.windows_label, 1)
+        
+        # Filter
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("🔍 Filter processes (name, pid, command)...")
+        self.filter_input.setStyleSheet("""
+            QLineEdit {
+                background-color: #2d2d44;
+                border: 2px solid #00ff00;
+                border-radius: 8px;
+                padding: 6px;
+                font-size: 12px;
+            }
+        """)
+        
+        # Process table; sorting/filtering happen in the proxy, rows update in place
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(Qt.UserRole)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy.setFilterKeyColumn(-1)
+        self.proxy.setDynamicSortFilter(True)
+        self.filter_input.textChanged.connect(self.proxy.setFilterFixedString)
+        
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(3, Qt.DescendingOrder)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(20)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Fixed widths: ResizeToContents would re-measure every row on each update
+        for column, width in enumerate(ProcessTableModel.COLUMN_WIDTHS):
+            self.table.setColumnWidth(column, width)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setStyleSheet("""
+            QTableView {
+                background-color: #2d2d44;
+                border: 2px solid #00ff00;
+                border-radius: 8px;
+                gridline-color: #3d3d5c;
+                font-size: 11px;
+                selection-background-color: #ff00ff;
+            }
+            QHeaderView::section {
+                background-color: #16213e;
+                color: #00ff00;
+                border: none;
+                padding: 4px;
+                font-size: 11px;
+                font-weight: bold;
+            }
+        """)
+        
+        layout.addWidget(title)
+        layout.addLayout(stats_layout)
+        layout.addWidget(self.filter_input)
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+        
+        if not self.scanner.available:
+            self.self_label.setText("🧠 BrainrotOS: /proc not available on this system 💀")
+    
+    def get_panel_style(self, color):
+        return f"""
+            QLabel {{
+                background-color: #2d2d44;
+                border: 2px solid {color};
+                border-radius: 8px;
+                padding: 8px;
+                font-size: 11px;
+                color: {color};
+            }}
+        """
+    
+    def showEvent(self, event):
+        # Only scan while someone is looking
+        self.scanner.resume()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        self.scanner.pause()
+        super().hideEvent(event)
+    
+    def closeEvent(self, event):
+        self.scanner.pause()
+        super().closeEvent(event)
+    
+    def apply_scan(self, diff):
+        self.model.apply(diff)
+        # Walking every object tree is GUI-thread work; skip it when nobody can see the result
+        if self.isVisible() and not self.isMinimized():
+            self.update_self_stats()
+        self.update_windows()
+    
+    def update_self_stats(self):
+        app = QApplication.instance()
+        clock = FrameClock.instance()
+        roots = [app, clock] + app.topLevelWidgets()
+        objects = sum(1 + len(root.findChildren(QObject)) for root in roots)
+        timers = sum(len(root.findChildren(QTimer)) for root in roots)
+        subscriptions = clock.subscriptions
+        active = sum(1 for subscription in subscriptions if subscription.is_active())
+        
+        row = self.model.row_for(os.getpid())
+        if row is None:
+            usage = "RSS: --   CPU: --   Threads: --"
+        else:
+            usage = f"RSS: {row[3] / (1024 * 1024):.1f} MB   CPU: {row[2]:.1f}%   Threads: {row[4]}"
+        self.self_label.setText(
+            f"🧠 BrainrotOS (pid {os.getpid()})\n{usage}\n"
+            f"QObjects: {objects}   QTimers: {timers}\n"
+            f"Clock callbacks: {active} active / {len(subscriptions)}")
+    
+    def update_windows(self):
+        windows = self.registry.windows
+        hosts = self.registry.hosts
+        if not windows and not hosts:
+            self.windows_label.setText("🪟 App windows: none yet")
+            return
+        lines = ["🪟 App windows"]
+        for key, window in windows.items():
+            state = "🟢 open" if window.isVisible() else "⚪ hidden"
+            line = f"{key}: {state} · {1 + len(window.findChildren(QObject))} QObjects"
+            timing = self.registry.timings.get(key)
+            if timing is not None:
+                line += f" · launch {timing.import_ms:.0f}+{timing.construct_ms:.0f} ms"
+            lines.append(line)
+        for key, host in hosts.items():
+            if not host.running:
+                lines.append(f"{key}: ⚪ isolated, not running")
+            else:
+                state = "🟢 responding" if host.responsive else "🧊 not responding"
+                lines.append(f"{key}: {state} · own process {host.pid()}")
+        self.windows_label.setText("\n".join(lines))
@@ -18,6 +18,11 @@ class VibeCheckApp(QWidget):
             }
         """)
         
+        # Scores must exist before setup_ui builds the displays
+        self.vibe_score = 50
+        self.total_checks = 0
+        self.passed_checks = 0
+        
         self.setup_ui()
         
         # Vibe check results
@@ -48,10 +53,6 @@ class VibeCheckApp(QWidget):
             ]
         }
         
-        self.vibe_score = 50
-        self.total_checks = 0
-        self.passed_checks = 0
-        
     def setup_ui(self):
         layout = QVBoxLayout()
         
@@ -277,18 +278,36 @@ class VibeCheckApp(QWidget):
         # Rapidly change vibe score multiple times
         self.result_display.setPlainText("🌪️ CHAOS MODE ACTIVATED! Your vibes are going WILD!")
         
-        def chaos_update(count=0):
-            if count < 10:
-                self.vibe_score = random.randint(0, 100)
-                self.update_displays()
-                QTimer.singleShot(200, lambda: chaos_update(count + 1))
-            else:
-                final_score = random.randint(20, 80)
-                self.vibe_score = final_score
-                self.result_display.setPlainText(f"🌪️ Chaos complete! Your vibes have stabilized at {final_score}/100")
-                self.update_displays()
-                
-        chaos_update()
+        self.chaos_count = 0
+        self.chaos_update()
+        
+    def chaos_update(self):
+        # A bound method, so a pending step is dropped if the window is closed
+        if self.chaos_count < 10:
+            self.chaos_count += 1
+            self.vibe_score = random.randint(0, 100)
+            self.update_displays()
+            QTimer.singleShot(200, self.chaos_update)
+        else:
+            final_score = random.randint(20, 80)
+            self.vibe_score = final_score
+            self.result_display.setPlainText(f"🌪️ Chaos complete! Your vibes have stabilized at {final_score}/100")
+            self.update_displays()
+        
+    def save_state(self):
+        return {
+            "vibe_score": self.vibe_score,
+            "total_checks": self.total_checks,
+            "passed_checks": self.passed_checks,
+            "result": self.result_display.toPlainText(),
+        }
+        
+    def restore_state(self, state):
+        self.vibe_score = state.get("vibe_score", self.vibe_score)
+        self.total_checks = state.get("total_checks", self.total_checks)
+        self.passed_checks = state.get("passed_checks", self.passed_checks)
+        self.result_display.setPlainText(state.get("result", self.result_display.toPlainText()))
+        self.update_displays()
         
     def update_displays(self):
         self.vibe_display.setText(f"Current Vibe Score: {self.vibe_score}/100")
@@ -0,0 +1,129 @@
+"""
+🎛️ Audio synthesis for BrainrotOS
+Vectorized oscillators, phase-continuous chirps, envelopes, noise and mixing,
+shared by the meme sound player and generate_sounds.py. Every generator works on
+whole NumPy arrays at once and returns float32 samples in [-1, 1]; to_pcm16()
+turns them into the int16 frames pygame plays.
+
+SOUND_RECIPES describes every meme sound as plain data, so the player, the
+asset build and the start menu search all see the same set.
+"""
+
+import numpy as np
+
+SAMPLE_RATE = 22050
+# Part of every prebuilt sound's file name: bump it when a generator's output changes
+SYNTH_VERSION = 1
+
+# Every meme sound: playlist name -> (generator in this module, args, keyword args)
+SOUND_RECIPES = {
+    '🔊 MLG Airhorn': ("tone", (1000, 0.3), {"amplitude": 0.6}),
+    '🗿 Vine Boom': ("sweep", (80, 40, 0.5), {"amplitude": 0.8}),
+    '💻 Windows XP Startup': ("sweep", (200, 800, 1.0), {"amplitude": 0.4}),
+    '🚫 Error Sound': ("sweep", (600, 200, 0.8), {"amplitude": 0.5}),
+    '✅ Success Sound': ("sweep", (300, 600, 0.6), {"amplitude": 0.4}),
+    '🔔 Notification': ("tone", (800, 0.2), {"amplitude": 0.3}),
+    '🌪️ Whoosh': ("sweep", (1000, 100, 0.4), {"amplitude": 0.4}),
+    '📺 Static': ("noise_burst", (0.3,), {"amplitude": 0.2}),
+    '🔔 Ding': ("tone", (1200, 0.5), {"amplitude": 0.3}),
+    '🚨 Buzzer': ("tone", (150, 0.8), {"amplitude": 0.5}),
+    '🎺 Sad Trombone': ("sweep", (200, 100, 1.2), {"amplitude": 0.4}),
+    '⚡ Zap': ("noise_burst", (0.1,), {"amplitude": 0.5}),
+    '🔊 Bass Drop': ("sweep", (60, 30, 0.8), {"amplitude": 0.9}),
+    '🎸 Guitar Riff': ("tone", (440, 0.4), {"amplitude": 0.5}),
+    '🤖 Robot Beep': ("tone", (1500, 0.15), {"amplitude": 0.4}),
+}
+
+def frame_count(duration, sample_rate=SAMPLE_RATE):
+    return int(duration * sample_rate)
+
+def shape(phase, wave="sine"):
+    """Waveform value at each phase (radians)"""
+    if wave == "sine":
+        return np.sin(phase)
+    cycles = phase / (2 * np.pi)
+    if wave == "square":
+        return np.where(cycles % 1.0 < 0.5, 1.0, -1.0)
+    if wave == "saw":
+        return 2.0 * (cycles % 1.0) - 1.0
+    raise ValueError(f"Unknown waveform: {wave}")
+
+def oscillator(frequency, frames, sample_rate=SAMPLE_RATE, wave="sine", phase=0.0):
+    """frames samples of a waveform; frequency is a number or one value per sample.
+    
+    A per-sample frequency is integrated into the phase, so the pitch can move
+    without clicks.
+    """
+    if np.ndim(frequency) == 0:
+        phases = (2 * np.pi * frequency / sample_rate) * np.arange(frames) + phase
+    else:
+        step = np.asarray(frequency, dtype=np.float64)[:frames] * (2 * np.pi / sample_rate)
+        # Phase before each sample is the running sum of the steps before it
+        phases = phase + np.concatenate(([0.0], np.cumsum(step[:-1])))
+    return shape(phases, wave).astype(np.float32)
+
+def chirp(start_freq, end_freq, frames, sample_rate=SAMPLE_RATE, wave="sine", phase=0.0):
+    """Linear sweep from start_freq to end_freq with a continuous phase"""
+    t = np.arange(frames) / sample_rate
+    span = frames / sample_rate
+    phases = 2 * np.pi * (start_freq * t + (end_freq - start_freq) * t * t / (2 * span)) + phase
+    return shape(phases, wave).astype(np.float32)
+
+def adsr(frames, attack=0.0, decay=0.0, sustain=1.0, release=0.0):
+    """Attack/decay/sustain/release envelope; the stage lengths are shares of frames"""
+    attack_len = int(frames * attack)
+    decay_len = int(frames * decay)
+    release_len = min(int(frames * release), frames - attack_len - decay_len)
+    envelope = np.full(frames, sustain, dtype=np.float32)
+    envelope[:attack_len] = np.linspace(0, 1, attack_len, dtype=np.float32)
+    envelope[attack_len:attack_len + decay_len] = np.linspace(1, sustain, decay_len, dtype=np.float32)
+    if release_len > 0:
+        envelope[frames - release_len:] = np.linspace(sustain, 0, release_len, dtype=np.float32)
+    return envelope
+
+def exponential_decay(frames, rate=5.0):
+    """Envelope falling from 1 to exp(-rate)"""
+    return np.exp(-np.linspace(0, rate, frames, dtype=np.float32))
+
+def white_noise(frames, seed=None):
+    """Gaussian noise with unit standard deviation"""
+    return np.random.default_rng(seed).standard_normal(frames, dtype=np.float32)
+
+def mix(signals, gains=None):
+    """Sum signals of any lengths (shorter ones are padded), clipped to [-1, 1]"""
+    signals = [np.asarray(signal, dtype=np.float32) for signal in signals]
+    gains = gains or [1.0] * len(signals)
+    out = np.zeros(max((len(signal) for signal in signals), default=0), dtype=np.float32)
+    for signal, gain in zip(signals, gains):
+        out[:len(signal)] += gain * signal
+    return np.clip(out, -1.0, 1.0, out=out)
+
+def to_pcm16(signal, channels=2):
+    """int16 frames for pygame.sndarray: shape (n,) for mono, (n, channels) otherwise"""
+    pcm = (np.clip(signal, -1.0, 1.0) * 32767).astype(np.int16)
+    if channels == 1:
+        return pcm
+    return np.ascontiguousarray(np.repeat(pcm[:, None], channels, axis=1))
+
+def tone(frequency, duration, sample_rate=SAMPLE_RATE, amplitude=0.5, wave="sine"):
+    """A steady tone"""
+    return amplitude * oscillator(frequency, frame_count(duration, sample_rate), sample_rate, wave)
+
+def sweep(start_freq, end_freq, duration, sample_rate=SAMPLE_RATE, amplitude=0.5, wave="sine"):
+    """A frequency sweep (whoosh, boom), faded in and out over 10% to avoid clicks"""
+    frames = frame_count(duration, sample_rate)
+    envelope = adsr(frames, attack=0.1, release=0.1)
+    return amplitude * envelope * chirp(start_freq, end_freq, frames, sample_rate, wave)
+
+def noise_burst(duration, sample_rate=SAMPLE_RATE, amplitude=0.3, seed=None):
+    """A burst of static that dies away"""
+    frames = frame_count(duration, sample_rate)
+    return amplitude * exponential_decay(frames) * white_noise(frames, seed)
+
+def render(recipe, sample_rate=SAMPLE_RATE, channels=2):
+    """int16 frames for a (generator, args, kwargs) recipe from SOUND_RECIPES"""
+    generator, args, kwargs = recipe
+    signal = GENERATORS[generator](*args, sample_rate=sample_rate, **kwargs)
+    return to_pcm16(signal, channels)
+
+GENERATORS = {"tone": tone, "sweep": sweep, "noise_burst": noise_burst}
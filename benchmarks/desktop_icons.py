@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+🖥️ BrainrotOS desktop icon benchmark
+Fills the desktop canvas with many icons, then measures how long it takes to
+add them, repaint the visible viewport, scroll, and hit-test the cursor.
+Paint cost should track the viewport, not the icon count.
+
+    python benchmarks/desktop_icons.py --icons 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from harness import create_application, spin
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the BrainrotOS desktop icon canvas")
+    parser.add_argument("--icons", type=int, default=5000, help="how many icons to put on the desktop")
+    parser.add_argument("--columns", type=int, default=8, help="grid columns")
+    parser.add_argument("--frames", type=int, default=60, help="repaints to time")
+    args = parser.parse_args()
+
+    # Keep the generated layout out of the real data dir
+    os.environ.setdefault("BRAINROT_HOME", tempfile.mkdtemp(prefix="brainrot-bench-"))
+    app = create_application()
+
+    from PyQt5.QtCore import QPoint
+    from PyQt5.QtWidgets import QScrollArea
+    from desktop_canvas import DesktopCanvas
+
+    canvas = DesktopCanvas(columns=args.columns)
+    started = time.perf_counter()
+    canvas.add_icons([(f"bench{i}", f"App {i}", "🔥", None) for i in range(args.icons)])
+    add_ms = (time.perf_counter() - started) * 1000
+
+    scroll = QScrollArea()
+    scroll.setWidget(canvas)
+    scroll.setWidgetResizable(True)
+    scroll.resize(1280, 800)
+    scroll.show()
+    spin(0.3)
+
+    painted = [0]
+    paint_icon = canvas.paint_icon
+    def counting_paint_icon(*icon_args):
+        painted[0] += 1
+        return paint_icon(*icon_args)
+    canvas.paint_icon = counting_paint_icon
+
+    started = time.perf_counter()
+    for _ in range(args.frames):
+        canvas.repaint()
+    paint_ms = (time.perf_counter() - started) * 1000 / args.frames
+    per_frame = painted[0] / args.frames
+
+    bar = scroll.verticalScrollBar()
+    started = time.perf_counter()
+    for frame in range(args.frames):
+        bar.setValue(bar.maximum() * frame // max(1, args.frames - 1))
+        canvas.repaint()
+    scroll_ms = (time.perf_counter() - started) * 1000 / args.frames
+
+    height = max(1, canvas.height())
+    probes = 100000
+    started = time.perf_counter()
+    for i in range(probes):
+        canvas.icon_at(QPoint(i % canvas.width(), (i * 7919) % height))
+    hit_us = (time.perf_counter() - started) * 1e6 / probes
+
+    print(f"🖥️ {args.icons} icons on a {args.columns}-column desktop")
+    print(f"    add icons      {add_ms:8.1f} ms")
+    print(f"    repaint        {paint_ms:8.2f} ms/frame ({per_frame:.0f} icons painted)")
+    print(f"    scroll+paint   {scroll_ms:8.2f} ms/frame")
+    print(f"    hit test       {hit_us:8.2f} µs")
+
+    scroll.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+📐 BrainrotOS layout pass benchmark
+Counts layout requests (QEvent.LayoutRequest, posted whenever a layout is
+invalidated) while the desktop sits idle. An idle desktop should not relayout.
+
+    python benchmarks/layout_passes.py --seconds 5
+"""
+
+import argparse
+import sys
+import time
+
+from harness import create_application, spin
+from perf_monitor import CostStats
+
+from PyQt5.QtCore import QObject, QEvent
+
+class LayoutCounter(QObject):
+    """Application-wide event filter counting layout requests per receiver"""
+    def __init__(self):
+        super().__init__()
+        self.requests = CostStats()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.LayoutRequest:
+            label = type(obj).__name__
+            if obj.objectName():
+                label += f"#{obj.objectName()}"
+            self.requests.add(label, 0.0)
+        return False
+
+def main():
+    parser = argparse.ArgumentParser(description="Count BrainrotOS layout passes at idle")
+    parser.add_argument("--seconds", type=float, default=5.0, help="how long to sit idle")
+    parser.add_argument("--settle", type=float, default=1.0, help="startup settle time before counting")
+    args = parser.parse_args()
+
+    app = create_application()
+
+    from desktop_shell import BrainrotDesktop
+
+    desktop = BrainrotDesktop()
+    desktop.show()
+    spin(args.settle)
+
+    counter = LayoutCounter()
+    app.installEventFilter(counter)
+    started = time.perf_counter()
+    spin(args.seconds)
+    wall = time.perf_counter() - started
+    app.removeEventFilter(counter)
+
+    count, _ = counter.requests.totals()
+    print(f"📐 Idle desktop layout passes over {wall:.1f}s: {count} ({count / wall:.2f}/s)")
+    for label, calls, _, _, _ in sorted(counter.requests.rows(), key=lambda row: row[1], reverse=True):
+        print(f"    {label:<40} {calls:>6} ({calls / wall:.2f}/s)")
+    print("✅ No relayouts while idle" if count == 0 else "❌ Desktop relayouts while idle")
+
+    desktop.close()
+    return 0 if count == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
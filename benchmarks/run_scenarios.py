@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+📊 BrainrotOS scenario benchmarks
+Starts BrainrotDesktop on the offscreen Qt platform, runs scripted scenarios and
+reports event-loop latency percentiles, timer callback cost and paint time.
+
+    python benchmarks/run_scenarios.py --seconds 5 --json results.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+
+from harness import LatencyProbe, create_application, spin
+
+from PyQt5.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+
+from animation_governor import AnimationGovernor, ACTIVE, IDLE
+
+def open_app(desktop, method_name, key):
+    """Open an app through the shell and return (window, open time in ms)"""
+    start = time.perf_counter()
+    getattr(desktop, method_name)()
+    elapsed = (time.perf_counter() - start) * 1000
+    return desktop.app_windows[key], elapsed
+
+def scenario_idle_desktop(desktop):
+    return {}
+
+def scenario_open_all_apps(desktop):
+    # Placeholder apps open a modal QMessageBox and are left out on purpose
+    apps = [
+        ("open_rizz_generator", "rizz"),
+        ("open_npc_chat", "npc"),
+        ("open_sound_player", "sound"),
+        ("open_vibe_check", "vibe"),
+        ("open_camera", "camera"),
+        ("open_task_manager", "tasks"),
+        ("open_file_manager", "files"),
+        ("open_notepad", "notes"),
+    ]
+    open_ms = {}
+    for method_name, key in apps:
+        _, open_ms[method_name] = open_app(desktop, method_name, key)
+    # The registry splits each first launch into import and construction time
+    launch_ms = {key: {"import": round(timing.import_ms, 3), "construct": round(timing.construct_ms, 3)}
+                 for key, timing in desktop.registry.timings.items()}
+    return {"open_ms": {name: round(ms, 3) for name, ms in open_ms.items()}, "launch_ms": launch_ms}
+
+def scenario_sound_chaos(desktop):
+    player, open_ms = open_app(desktop, "open_sound_player", "sound")
+    player.chaos_mode()
+    return {"open_ms": round(open_ms, 3), "audio_enabled": player.audio_enabled}
+
+def scenario_vibe_chaos(desktop):
+    vibe, open_ms = open_app(desktop, "open_vibe_check", "vibe")
+    vibe.chaos_mode()
+    return {"open_ms": round(open_ms, 3)}
+
+def scenario_gyatt_detection(desktop):
+    camera, open_ms = open_app(desktop, "open_camera", "camera")
+    if not camera.detection_active:
+        camera.toggle_detection()
+    return {"open_ms": round(open_ms, 3)}
+
+def scenario_idle_throttled(desktop):
+    # What an unattended desktop costs once the governor has throttled it
+    AnimationGovernor.instance().set_level(IDLE)
+    return {"animation_scale": AnimationGovernor.IDLE_SCALE}
+
+SCENARIOS = {
+    "idle_desktop": scenario_idle_desktop,
+    "open_all_apps": scenario_open_all_apps,
+    "sound_chaos": scenario_sound_chaos,
+    "vibe_chaos": scenario_vibe_chaos,
+    "gyatt_detection": scenario_gyatt_detection,
+    "idle_throttled": scenario_idle_throttled,
+}
+
+def close_apps(desktop):
+    for window in desktop.app_windows.values():
+        window.hide()
+    camera = desktop.app_windows.get("camera")
+    if camera is not None and camera.detection_active:
+        camera.toggle_detection()
+    AnimationGovernor.instance().set_level(ACTIVE)
+
+def run_scenario(app, desktop, name, seconds):
+    probe = LatencyProbe()
+    app.reset_stats()
+    probe.start()
+    started = time.perf_counter()
+    try:
+        details = SCENARIOS[name](desktop)
+        spin(seconds)
+    finally:
+        probe.stop()
+    wall = time.perf_counter() - started
+    
+    timer_count, timer_total = app.timers.totals()
+    paint_count, paint_total = app.paints.totals()
+    result = {
+        "scenario": name,
+        "seconds": round(wall, 3),
+        "details": details,
+        "latency": probe.summary(),
+        "timers": {
+            "callbacks": timer_count,
+            "per_second": round(timer_count / wall, 2),
+            "total_ms": round(timer_total * 1000, 3),
+            "busy_percent": round(100 * timer_total / wall, 3),
+            "top": [{"owner": label, "calls": count, "total_ms": round(total, 3),
+                     "mean_ms": round(mean, 3), "max_ms": round(worst, 3)}
+                    for label, count, total, mean, worst in app.timers.rows()[:8]]
+        },
+        "paint": {
+            "frames": paint_count,
+            "total_ms": round(paint_total * 1000, 3),
+            "windows": [{"window": label, "frames": count, "total_ms": round(total, 3),
+                         "mean_ms": round(mean, 3), "max_ms": round(worst, 3)}
+                        for label, count, total, mean, worst in app.paints.rows()]
+        }
+    }
+    close_apps(desktop)
+    spin(0.2)
+    return result
+
+def format_result(result):
+    latency = result["latency"]
+    timers = result["timers"]
+    paint = result["paint"]
+    lines = [
+        f"▶ {result['scenario']} ({result['seconds']:.1f}s)",
+        f"  loop latency ms  p50 {latency['p50_ms']:.2f}  p95 {latency['p95_ms']:.2f}  "
+        f"p99 {latency['p99_ms']:.2f}  max {latency['max_ms']:.2f}",
+        f"  timers           {timers['callbacks']} calls ({timers['per_second']}/s), "
+        f"{timers['total_ms']:.1f} ms total, {timers['busy_percent']:.2f}% busy",
+    ]
+    for row in timers["top"]:
+        lines.append(f"    {row['owner']:<40} {row['calls']:>6} calls  mean {row['mean_ms']:.3f} ms  "
+                     f"max {row['max_ms']:.3f} ms")
+    lines.append(f"  paint            {paint['frames']} frames, {paint['total_ms']:.1f} ms total")
+    for row in paint["windows"]:
+        lines.append(f"    {row['window']:<40} {row['frames']:>6} frames mean {row['mean_ms']:.3f} ms  "
+                     f"max {row['max_ms']:.3f} ms")
+    if result["details"]:
+        lines.append(f"  details          {json.dumps(result['details'], ensure_ascii=False)}")
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run BrainrotOS headless scenario benchmarks")
+    parser.add_argument("--seconds", type=float, default=5.0, help="how long each scenario runs")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    args = parser.parse_args()
+    
+    app = create_application()
+    app.setApplicationName("BrainrotOS")
+    app.setApplicationVersion("1.0.0")
+    
+    from desktop_shell import BrainrotDesktop
+    
+    start = time.perf_counter()
+    desktop = BrainrotDesktop()
+    desktop.show()
+    spin(0.5)
+    startup_ms = (time.perf_counter() - start) * 1000
+    
+    print(f"🧠 BrainrotOS benchmarks (Qt {QT_VERSION_STR}, PyQt {PYQT_VERSION_STR}, Python {platform.python_version()})")
+    print(f"  desktop startup incl. 0.5s settle: {startup_ms:.1f} ms")
+    
+    results = []
+    for name in args.scenario or list(SCENARIOS):
+        result = run_scenario(app, desktop, name, args.seconds)
+        results.append(result)
+        print(format_result(result))
+    
+    if args.json:
+        report = {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "version": app.applicationVersion(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seconds_per_scenario": args.seconds,
+            "results": results
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"📝 Results written to {args.json}")
+    
+    desktop.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+🎛️ BrainrotOS sound synthesis benchmark
+Renders every meme sound in SOUND_RECIPES with audio_synth and with the
+per-sample Python loops the sound player used before, and compares the two.
+
+    python benchmarks/synth_bench.py --repeat 5
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import harness  # puts the repo on sys.path
+from audio_synth import SAMPLE_RATE, SOUND_RECIPES, render
+
+# The old SoundPlayerApp generators, kept here as the baseline
+def loop_tone(frequency, duration, sample_rate=SAMPLE_RATE, amplitude=0.5):
+    frames = int(duration * sample_rate)
+    arr = np.zeros(frames)
+    for i in range(frames):
+        arr[i] = amplitude * np.sin(2 * np.pi * frequency * i / sample_rate)
+    arr = (arr * 32767).astype(np.int16)
+    return np.column_stack((arr, arr))
+
+def loop_sweep(start_freq, end_freq, duration, sample_rate=SAMPLE_RATE, amplitude=0.5):
+    frames = int(duration * sample_rate)
+    arr = np.zeros(frames)
+    for i in range(frames):
+        freq = start_freq + (end_freq - start_freq) * (i / frames)
+        arr[i] = amplitude * np.sin(2 * np.pi * freq * i / sample_rate)
+    envelope_len = frames // 10
+    envelope = np.linspace(0, 1, envelope_len)
+    arr[:envelope_len] *= envelope
+    arr[-envelope_len:] *= envelope[::-1]
+    arr = (arr * 32767).astype(np.int16)
+    return np.column_stack((arr, arr))
+
+def loop_noise_burst(duration, sample_rate=SAMPLE_RATE, amplitude=0.3):
+    frames = int(duration * sample_rate)
+    arr = np.random.normal(0, amplitude, frames)
+    arr *= np.exp(-np.linspace(0, 5, frames))
+    arr = (arr * 32767).astype(np.int16)
+    return np.column_stack((arr, arr))
+
+LOOPS = {"tone": loop_tone, "sweep": loop_sweep, "noise_burst": loop_noise_burst}
+
+def time_all(render_one, repeat):
+    """Best-of-repeat seconds to render the whole set, and per-sound seconds from that run"""
+    best, best_rows = None, None
+    for _ in range(repeat):
+        rows = {}
+        for name, recipe in SOUND_RECIPES.items():
+            started = time.perf_counter()
+            render_one(recipe)
+            rows[name] = time.perf_counter() - started
+        total = sum(rows.values())
+        if best is None or total < best:
+            best, best_rows = total, rows
+    return best, best_rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BrainrotOS sound synthesis")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per implementation; the best is kept")
+    args = parser.parse_args()
+
+    def loop_render(recipe):
+        generator, recipe_args, kwargs = recipe
+        return LOOPS[generator](*recipe_args, **kwargs)
+
+    loop_total, loop_rows = time_all(loop_render, args.repeat)
+    fast_total, fast_rows = time_all(render, args.repeat)
+
+    # A steady tone must come out the same either way (give or take rounding)
+    difference = np.abs(loop_tone(440, 0.4).astype(np.int32) - render(("tone", (440, 0.4), {})).astype(np.int32))
+    samples = sum(len(render(recipe, channels=1)) for recipe in SOUND_RECIPES.values())
+
+    print(f"🎛️ {len(SOUND_RECIPES)} meme sounds, {samples} samples at {SAMPLE_RATE} Hz, best of {args.repeat}")
+    print(f"    {'sound':<24} {'loops ms':>10} {'vector ms':>10} {'speedup':>8}")
+    for name in SOUND_RECIPES:
+        loop_ms, fast_ms = loop_rows[name] * 1000, fast_rows[name] * 1000
+        print(f"    {name:<24} {loop_ms:10.2f} {fast_ms:10.3f} {loop_ms / max(fast_ms, 1e-6):7.0f}x")
+    print(f"    {'all sounds':<24} {loop_total * 1000:10.1f} {fast_total * 1000:10.2f} "
+          f"{loop_total / max(fast_total, 1e-9):7.0f}x")
+    print(f"    tone max difference {difference.max()} LSB")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,418 @@
+"""
+🖥️ Virtualized desktop icon canvas for BrainrotOS
+Icons are rows in a compact IconStore (parallel lists, no widget per icon) and
+live on a snap-to-grid layout. A dict from grid cell to icon doubles as the
+spatial index: hit-testing is one lookup and painting only visits the cells
+inside the exposed rectangle. Faces, labels and glows are cached sprites, so a
+frame costs a few blits per visible icon however many icons the desktop holds.
+Dragging an icon snaps it to the nearest cell; the arrangement is saved.
+"""
+
+import os
+import json
+import math
+from array import array
+from collections import OrderedDict
+from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtCore import Qt, QRect, QRectF, QTimer, QVariantAnimation, QEasingCurve
+from PyQt5.QtGui import QPainter, QPixmap, QColor, QLinearGradient, QPen, QFont
+
+import paths
+from frame_clock import FrameClock
+from glow_compositor import glow_cache
+
+class IconStore:
+    """Icon data as parallel columns; an icon is just its index"""
+    def __init__(self):
+        self.keys = []
+        self.names = []
+        self.emojis = []
+        self.callbacks = []
+        self.cols = array("i")
+        self.rows = array("i")
+        self.index_of = {}  # key -> index
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def add(self, key, name, emoji, callback, col, row):
+        index = len(self.keys)
+        self.keys.append(key)
+        self.names.append(name)
+        self.emojis.append(emoji)
+        self.callbacks.append(callback)
+        self.cols.append(col)
+        self.rows.append(row)
+        self.index_of[key] = index
+        return index
+
+class SpatialGrid:
+    """Which icon sits in which grid cell; at most one icon per cell"""
+    def __init__(self):
+        self.cells = {}  # (col, row) -> icon index
+        self.max_col = -1
+        self.max_row = -1
+    
+    def place(self, index, col, row):
+        self.cells[(col, row)] = index
+        self.max_col = max(self.max_col, col)
+        self.max_row = max(self.max_row, row)
+    
+    def remove(self, col, row):
+        self.cells.pop((col, row), None)
+    
+    def at(self, col, row):
+        return self.cells.get((col, row))
+    
+    def in_range(self, first_col, last_col, first_row, last_row):
+        """(index, col, row) for every occupied cell in the range"""
+        cells = self.cells
+        if (last_col - first_col + 1) * (last_row - first_row + 1) > len(cells):
+            # Range bigger than the desktop: walk the icons instead of the cells
+            return [(index, col, row) for (col, row), index in cells.items()
+                    if first_col <= col <= last_col and first_row <= row <= last_row]
+        found = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                index = cells.get((col, row))
+                if index is not None:
+                    found.append((index, col, row))
+        return found
+    
+    def first_free(self, columns, start=0):
+        """First empty cell in row-major order within the given column count"""
+        cell = start
+        while self.at(cell % columns, cell // columns) is not None:
+            cell += 1
+        return cell % columns, cell // columns
+
+class DesktopCanvas(QWidget):
+    """Paints the desktop icons; put it in a QScrollArea for large desktops"""
+    FACE_SIZE = 120
+    PITCH = 150          # grid spacing, face plus gap
+    ORIGIN = 40          # top-left margin of the grid
+    HOVER_SCALE = 130 / 120
+    GLOW_RADIUS = 20
+    GLOW_COLOR = QColor(0, 255, 255)
+    LABEL_CACHE_SIZE = 1024
+    SAVE_DELAY_MS = 500
+    
+    def __init__(self, columns=4, layout_file=None, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(True)
+        self.columns = columns
+        self.store = IconStore()
+        self.grid = SpatialGrid()
+        self.layout_file = layout_file or paths.data_path("desktop_layout.json")
+        self.saved_cells = self.load_layout()
+        
+        self.faces = {}               # "normal" / "hover" / "pressed" -> shared face pixmap
+        self.labels = OrderedDict()   # icon index -> label pixmap, LRU
+        self.hovered = None
+        self.pressed = None
+        self.press_pos = None
+        self.drag_pos = None
+        self.hover_scale = 1.0
+        self.glow_intensity = 0
+        self.glow_direction = 1
+        self.float_phase = 0
+        
+        self.hover_animation = QVariantAnimation(self)
+        self.hover_animation.setDuration(200)
+        self.hover_animation.setEasingCurve(QEasingCurve.OutBounce)
+        self.hover_animation.valueChanged.connect(self.set_hover_scale)
+        
+        clock = FrameClock.instance()
+        self.float_timer = clock.subscribe(self.animate_floating, 50, self, animation=True)
+        self.glow_timer = clock.subscribe(self.update_glow, 50, self, start=False, animation=True)
+        
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.save_layout)
+    
+    def add_icon(self, key, name, emoji, callback=None):
+        """Add one icon at its saved cell, or the first free one"""
+        return self.add_icons([(key, name, emoji, callback)])[0]
+    
+    def add_icons(self, icons):
+        """Add many (key, name, emoji, callback) icons with a single relayout"""
+        added = []
+        next_free = 0
+        for key, name, emoji, callback in icons:
+            cell = self.saved_cells.get(key)
+            if cell is None or self.grid.at(*cell) is not None:
+                cell = self.grid.first_free(self.columns, next_free)
+                next_free = cell[1] * self.columns + cell[0] + 1
+            index = self.store.add(key, name, emoji, callback, *cell)
+            self.grid.place(index, *cell)
+            added.append(index)
+        self.update_extent()
+        self.update()
+        return added
+    
+    def icon_count(self):
+        return len(self.store)
+    
+    def cell_rect(self, col, row):
+        return QRect(self.ORIGIN + col * self.PITCH, self.ORIGIN + row * self.PITCH, self.FACE_SIZE, self.FACE_SIZE)
+    
+    def icon_rect(self, index):
+        return self.cell_rect(self.store.cols[index], self.store.rows[index])
+    
+    def icon_at(self, pos):
+        """Index of the icon face under pos, or None"""
+        x, y = pos.x() - self.ORIGIN, pos.y() - self.ORIGIN
+        if x < 0 or y < 0:
+            return None
+        col, dx = divmod(x, self.PITCH)
+        row, dy = divmod(y, self.PITCH)
+        if dx >= self.FACE_SIZE or dy >= self.FACE_SIZE:
+            return None
+        return self.grid.at(col, row)
+    
+    def nearest_cell(self, pos):
+        col = round((pos.x() - self.ORIGIN - self.FACE_SIZE / 2) / self.PITCH)
+        row = round((pos.y() - self.ORIGIN - self.FACE_SIZE / 2) / self.PITCH)
+        return max(0, col), max(0, row)
+    
+    def move_icon(self, index, col, row):
+        """Snap an icon to a cell, swapping with whatever was there"""
+        store = self.store
+        old = (store.cols[index], store.rows[index])
+        if old == (col, row):
+            return
+        other = self.grid.at(col, row)
+        self.grid.remove(*old)
+        if other is not None:
+            store.cols[other], store.rows[other] = old
+            self.grid.place(other, *old)
+        store.cols[index], store.rows[index] = col, row
+        self.grid.place(index, col, row)
+        self.update_extent()
+        self.schedule_save()
+    
+    def update_extent(self):
+        # The scroll area sizes the canvas from this
+        width = 2 * self.ORIGIN + (self.grid.max_col + 1) * self.PITCH
+        height = 2 * self.ORIGIN + (self.grid.max_row + 1) * self.PITCH
+        if (width, height) != (self.minimumWidth(), self.minimumHeight()):
+            self.setMinimumSize(width, height)
+    
+    def load_layout(self):
+        try:
+            with open(self.layout_file, encoding="utf-8") as f:
+                cells = json.load(f).get("cells", {})
+            return {key: (int(col), int(row)) for key, (col, row) in cells.items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"🖥️ Ignoring unreadable desktop layout: {e}")
+            return {}
+    
+    def schedule_save(self):
+        self.save_timer.start(self.SAVE_DELAY_MS)
+    
+    def save_layout(self):
+        store = self.store
+        cells = dict(self.saved_cells)
+        cells.update({key: [store.cols[i], store.rows[i]] for i, key in enumerate(store.keys)})
+        temp_file = self.layout_file + ".tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"cells": cells}, f, separators=(",", ":"))
+            os.replace(temp_file, self.layout_file)
+        except OSError as e:
+            print(f"🖥️ Could not save desktop layout: {e}")
+            return
+        self.saved_cells = {key: tuple(cell) for key, cell in cells.items()}
+    
+    def face(self, state):
+        pixmap = self.faces.get(state)
+        if pixmap is None:
+            pixmap = self.faces[state] = self.render_face(state)
+        return pixmap
+    
+    def render_face(self, state):
+        """The glassy button face, shared by every icon"""
+        stops, border = {
+            "normal": ([(0, QColor(255, 255, 255, 40)), (0.1, QColor(255, 255, 255, 25)),
+                        (0.5, QColor(100, 100, 100, 15)), (0.9, QColor(50, 50, 50, 25)),
+                        (1, QColor(0, 0, 0, 40))], QColor(255, 255, 255, 60)),
+            "hover": ([(0, QColor(0, 255, 255, 60)), (0.1, QColor(0, 255, 255, 40)),
+                       (0.5, QColor(0, 150, 255, 25)), (0.9, QColor(0, 100, 200, 40)),
+                       (1, QColor(0, 50, 150, 60))], QColor(0, 255, 255, 100)),
+            "pressed": ([(0, QColor(255, 0, 255, 80)), (0.5, QColor(150, 0, 255, 60)),
+                         (1, QColor(100, 0, 200, 80))], QColor(255, 0, 255, 120)),
+        }[state]
+        pixmap = self.blank_pixmap(self.FACE_SIZE, self.FACE_SIZE)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        gradient = QLinearGradient(0, 0, 0, self.FACE_SIZE)
+        for position, color in stops:
+            gradient.setColorAt(position, color)
+        painter.setBrush(gradient)
+        painter.setPen(QPen(border, 2))
+        painter.drawRoundedRect(QRectF(1, 1, self.FACE_SIZE - 2, self.FACE_SIZE - 2), 15, 15)
+        painter.end()
+        return pixmap
+    
+    def label(self, index):
+        pixmap = self.labels.get(index)
+        if pixmap is not None:
+            self.labels.move_to_end(index)
+            return pixmap
+        pixmap = self.blank_pixmap(self.FACE_SIZE, self.FACE_SIZE)
+        painter = QPainter(pixmap)
+        font = QFont("Segoe UI")
+        font.setPixelSize(11)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(QRect(4, 0, self.FACE_SIZE - 8, self.FACE_SIZE), Qt.AlignCenter | Qt.TextWordWrap,
+                         f"{self.store.emojis[index]}\n{self.store.names[index]}")
+        painter.end()
+        self.labels[index] = pixmap
+        if len(self.labels) > self.LABEL_CACHE_SIZE:
+            self.labels.popitem(last=False)
+        return pixmap
+    
+    def blank_pixmap(self, width, height):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+    
+    def float_offset(self, index):
+        return int(3 * math.sin((self.float_phase + index * 20) * 0.05))
+    
+    def icons_in(self, area):
+        """(index, col, row) for every icon that draws anything inside area"""
+        # Grow by the glow and float margins so partly exposed icons count
+        margin = self.GLOW_RADIUS + 10
+        first_col = max(0, (area.left() - self.ORIGIN - margin) // self.PITCH)
+        last_col = (area.right() - self.ORIGIN + margin) // self.PITCH
+        first_row = max(0, (area.top() - self.ORIGIN - margin) // self.PITCH)
+        last_row = (area.bottom() - self.ORIGIN + margin) // self.PITCH
+        return self.grid.in_range(first_col, min(last_col, self.grid.max_col),
+                                  first_row, min(last_row, self.grid.max_row))
+    
+    def paintEvent(self, event):
+        visible = self.icons_in(event.rect())
+        if not visible and self.drag_pos is None:
+            return
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        glow = glow_cache.sprite(self.FACE_SIZE, self.FACE_SIZE, self.GLOW_RADIUS, self.GLOW_COLOR, 15)
+        for index, col, row in visible:
+            if index == self.pressed and self.drag_pos is not None:
+                continue  # drawn under the cursor below
+            rect = self.cell_rect(col, row).translated(0, self.float_offset(index))
+            self.paint_icon(painter, index, rect, glow)
+        
+        if self.drag_pos is not None and self.pressed is not None:
+            rect = QRect(0, 0, self.FACE_SIZE, self.FACE_SIZE)
+            rect.moveCenter(self.drag_pos)
+            painter.setOpacity(0.8)
+            self.paint_icon(painter, self.pressed, rect, glow)
+    
+    def paint_icon(self, painter, index, rect, glow):
+        hovered = index == self.hovered
+        opacity = painter.opacity()
+        painter.setOpacity(opacity * ((50 + self.glow_intensity) if hovered else 100) / 255)
+        painter.drawPixmap(rect.x() - self.GLOW_RADIUS, rect.y() - self.GLOW_RADIUS, glow)
+        painter.setOpacity(opacity)
+        
+        if hovered and self.hover_scale != 1.0:
+            painter.save()
+            center = rect.center()
+            painter.translate(center.x(), center.y())
+            painter.scale(self.hover_scale, self.hover_scale)
+            rect = QRect(-self.FACE_SIZE // 2, -self.FACE_SIZE // 2, self.FACE_SIZE, self.FACE_SIZE)
+        state = "pressed" if index == self.pressed and self.drag_pos is None else "hover" if hovered else "normal"
+        painter.drawPixmap(rect.topLeft(), self.face(state))
+        painter.drawPixmap(rect.topLeft(), self.label(index))
+        if hovered and self.hover_scale != 1.0:
+            painter.restore()
+    
+    def update_icon(self, index):
+        if index is not None:
+            margin = self.GLOW_RADIUS + 12
+            self.update(self.icon_rect(index).adjusted(-margin, -margin, margin, margin))
+    
+    def animate_floating(self):
+        """Each icon bobs with its own phase; only the on-screen icons, plus their glow and bob, repaint"""
+        self.float_phase += 1
+        area = self.visibleRegion().boundingRect()
+        if area.isEmpty():
+            return
+        dirty = QRect()
+        for index, col, row in self.icons_in(area):
+            dirty |= self.cell_rect(col, row)
+        if not dirty.isNull():
+            margin = self.GLOW_RADIUS + 12
+            self.update(dirty.adjusted(-margin, -margin, margin, margin) & area)
+    
+    def set_hover_scale(self, scale):
+        self.hover_scale = scale
+        self.update_icon(self.hovered)
+    
+    def set_hovered(self, index):
+        if index == self.hovered:
+            return
+        previous = self.hovered
+        self.hovered = index
+        self.hover_scale = 1.0
+        self.glow_intensity = 0
+        self.update_icon(previous)
+        self.hover_animation.stop()
+        if index is None:
+            self.glow_timer.stop()
+            return
+        self.hover_animation.setStartValue(1.0)
+        self.hover_animation.setEndValue(self.HOVER_SCALE)
+        self.hover_animation.start()
+        self.glow_timer.start()
+    
+    def update_glow(self):
+        self.glow_intensity += self.glow_direction * 5
+        if self.glow_intensity >= 100:
+            self.glow_direction = -1
+        elif self.glow_intensity <= 0:
+            self.glow_direction = 1
+        self.update_icon(self.hovered)
+    
+    def mouseMoveEvent(self, event):
+        pos = event.pos()
+        if self.pressed is not None and event.buttons() & Qt.LeftButton:
+            if self.drag_pos is None and (pos - self.press_pos).manhattanLength() < QApplication.startDragDistance():
+                return
+            self.drag_pos = pos
+            self.update()
+            return
+        self.set_hovered(self.icon_at(pos))
+    
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            return super().mousePressEvent(event)
+        self.pressed = self.icon_at(event.pos())
+        self.press_pos = event.pos()
+        self.update_icon(self.pressed)
+    
+    def mouseReleaseEvent(self, event):
+        if event.button() != Qt.LeftButton or self.pressed is None:
+            return super().mouseReleaseEvent(event)
+        index, self.pressed = self.pressed, None
+        if self.drag_pos is not None:
+            self.drag_pos = None
+            self.move_icon(index, *self.nearest_cell(event.pos()))
+            self.update()
+            return
+        self.update_icon(index)
+        if self.icon_at(event.pos()) == index and self.store.callbacks[index] is not None:
+            self.store.callbacks[index]()
+    
+    def leaveEvent(self, event):
+        self.set_hovered(None)
+        super().leaveEvent(event)
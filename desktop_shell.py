@@ -1,135 +1,50 @@
 import sys
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QPushButton, QLabel, QGridLayout, QFrame, QTextEdit,
+                             QPushButton, QLabel, QGridLayout, QFrame, QTextEdit, QPlainTextEdit,
                              QApplication, QDesktopWidget, QGraphicsDropShadowEffect,
-                             QScrollArea, QSizePolicy)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect, QParallelAnimationGroup
+                             QScrollArea, QSizePolicy, QShortcut)
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect,
+                          QParallelAnimationGroup, QUrl)
 from PyQt5.QtGui import (QFont, QPixmap, QPalette, QBrush, QPainter, QLinearGradient, 
-                         QRadialGradient, QColor, QFontMetrics)
+                         QRadialGradient, QColor, QFontMetrics, QKeySequence, QDesktopServices)
 import random
 import datetime
 import math
+import time
 
-class DesktopIcon(QPushButton):
-    def __init__(self, name, emoji, app_callback=None):
-        super().__init__()
-        self.app_callback = app_callback
-        self.name = name
-        self.emoji = emoji
-        self.setFixedSize(120, 120)
-        self.setText(f"{emoji}\n{name}")
-        
-        # Add Vista-style glass effect
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setColor(QColor(0, 255, 255, 100))
-        self.shadow_effect.setOffset(0, 0)
-        self.setGraphicsEffect(self.shadow_effect)
-        
-        # Animation properties
-        self.hover_animation = QPropertyAnimation(self, b"geometry")
-        self.hover_animation.setDuration(200)
-        self.hover_animation.setEasingCurve(QEasingCurve.OutBounce)
-        
-        self.glow_timer = QTimer()
-        self.glow_timer.timeout.connect(self.update_glow)
-        self.glow_intensity = 0
-        self.glow_direction = 1
-        
-        self.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(255, 255, 255, 40),
-                    stop:0.1 rgba(255, 255, 255, 25),
-                    stop:0.5 rgba(100, 100, 100, 15),
-                    stop:0.9 rgba(50, 50, 50, 25),
-                    stop:1 rgba(0, 0, 0, 40));
-                border: 2px solid rgba(255, 255, 255, 60);
-                border-radius: 15px;
-                color: white;
-                font-size: 11px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                text-shadow: 2px 2px 4px rgba(0, 0, 0, 80);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(0, 255, 255, 60),
-                    stop:0.1 rgba(0, 255, 255, 40),
-                    stop:0.5 rgba(0, 150, 255, 25),
-                    stop:0.9 rgba(0, 100, 200, 40),
-                    stop:1 rgba(0, 50, 150, 60));
-                border: 2px solid rgba(0, 255, 255, 100);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(255, 0, 255, 80),
-                    stop:0.5 rgba(150, 0, 255, 60),
-                    stop:1 rgba(100, 0, 200, 80));
-                border: 2px solid rgba(255, 0, 255, 120);
-            }
-        """)
-        
-        if app_callback:
-            self.clicked.connect(app_callback)
-            
-    def enterEvent(self, event):
-        # Start hover animation
-        current_rect = self.geometry()
-        new_rect = QRect(current_rect.x() - 5, current_rect.y() - 5, 
-                        current_rect.width() + 10, current_rect.height() + 10)
-        
-        self.hover_animation.setStartValue(current_rect)
-        self.hover_animation.setEndValue(new_rect)
-        self.hover_animation.start()
-        
-        # Start glow effect
-        self.glow_timer.start(50)
-        
-        super().enterEvent(event)
-        
-    def leaveEvent(self, event):
-        # Reverse hover animation
-        current_rect = self.geometry()
-        new_rect = QRect(current_rect.x() + 5, current_rect.y() + 5, 
-                        current_rect.width() - 10, current_rect.height() - 10)
-        
-        self.hover_animation.setStartValue(current_rect)
-        self.hover_animation.setEndValue(new_rect)
-        self.hover_animation.start()
-        
-        # Stop glow effect
-        self.glow_timer.stop()
-        self.glow_intensity = 0
-        self.update_shadow()
-        
-        super().leaveEvent(event)
-        
-    def update_glow(self):
-        self.glow_intensity += self.glow_direction * 5
-        if self.glow_intensity >= 100:
-            self.glow_direction = -1
-        elif self.glow_intensity <= 0:
-            self.glow_direction = 1
-            
-        self.update_shadow()
-        
-    def update_shadow(self):
-        if hasattr(self, 'shadow_effect'):
-            self.shadow_effect.setBlurRadius(15 + self.glow_intensity // 5)
-            self.shadow_effect.setColor(QColor(0, 255, 255, 50 + self.glow_intensity))
+from frame_clock import FrameClock
+from glow_compositor import GlowUnderlay
+from desktop_canvas import DesktopCanvas
+from system_monitor import SystemMonitor, GB
+from weather_provider import WeatherService
+from notes_store import NotesStore
+from app_registry import AppRegistry
+
+def pin_to_layout(widget):
+    """Freeze a live-updating widget at its laid-out size.
+    
+    Fixed-size widgets don't invalidate their parent's layout when their
+    contents change, so periodic setText() calls no longer cause relayouts.
+    """
+    parent = widget.parentWidget()
+    parent.ensurePolished()
+    parent.layout().activate()
+    widget.setFixedSize(widget.size())
 
 class TaskBar(QFrame):
+    VIBES = ["💯", "🔥", "💀", "😭", "🤡", "👑", "💎", "⚡", "🌟", "🚀"]
+    TRAY_ICONS = ["🔊 📶 🔋", "🔇 📶 🔋", "🔊 📵 🔋", "🔊 📶 🪫", "🔊 📶 ⚡"]
+    
+    # Tray button asking the desktop to toggle the performance HUD
+    hud_requested = pyqtSignal()
+    start_requested = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         self.setFixedHeight(60)
         
         # Add Vista-style glass effect
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(20)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 150))
-        self.shadow_effect.setOffset(0, -3)
-        self.setGraphicsEffect(self.shadow_effect)
+        self.shadow_effect = GlowUnderlay(self, 20, QColor(0, 0, 0, 150), offset=(0, -3))
         
         self.setStyleSheet("""
             QFrame {
@@ -185,6 +100,10 @@ class TaskBar(QFrame):
             }
         """)
         
+        # Start button glow, pulsed by animate_start_button
+        self.start_glow = GlowUnderlay(self.start_btn, 20, QColor(0, 255, 255), corner_radius=25)
+        self.start_glow.set_opacity(50 / 255)
+        
         # Quick Launch icons (like Vista)
         quick_launch_icons = [
             ("🌐", "Internet Explorer"),
@@ -230,9 +149,8 @@ class TaskBar(QFrame):
         self.add_running_app("🔊 Meme Player", False)
         
         # Add glow animation to start button
-        self.start_glow_timer = QTimer()
-        self.start_glow_timer.timeout.connect(self.animate_start_button)
-        self.start_glow_timer.start(100)
+        clock = FrameClock.instance()
+        self.start_glow_timer = clock.subscribe(self.animate_start_button, 100, self, animation=True)
         self.start_glow_phase = 0
         
         # Vibe level indicator with glass effect
@@ -281,16 +199,31 @@ class TaskBar(QFrame):
             }
         """)
         
+        # Performance HUD toggle in the tray area
+        self.hud_btn = QPushButton("📊")
+        self.hud_btn.setFixedSize(32, 32)
+        self.hud_btn.setToolTip("Performance HUD")
+        self.hud_btn.setStyleSheet("""
+            QPushButton {
+                background: rgba(255, 255, 255, 20);
+                border: 1px solid rgba(255, 255, 255, 40);
+                border-radius: 12px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background: rgba(255, 255, 255, 60);
+                border: 1px solid rgba(255, 255, 255, 100);
+            }
+        """)
+        self.hud_btn.clicked.connect(self.hud_requested.emit)
+        self.start_btn.clicked.connect(self.start_requested.emit)
+        
         # Update clock
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_clock)
-        self.timer.start(1000)
+        self.timer = clock.subscribe(self.update_clock, 1000, self)
         self.update_clock()
         
         # Animate system tray icons
-        self.tray_timer = QTimer()
-        self.tray_timer.timeout.connect(self.animate_tray)
-        self.tray_timer.start(3000)
+        self.tray_timer = clock.subscribe(self.animate_tray, 3000, self, animation=True)
         
         layout.addWidget(self.start_btn)
         
@@ -315,23 +248,36 @@ class TaskBar(QFrame):
         layout.addStretch()
         layout.addWidget(self.vibe_label)
         layout.addWidget(self.system_tray)
+        layout.addWidget(self.hud_btn)
         layout.addWidget(self.clock_label)
         
         self.setLayout(layout)
         
+        # Live labels get a fixed size up front so their updates never relayout the taskbar
+        self.pin_label(self.vibe_label, [f"Vibe Level: {vibe}" for vibe in self.VIBES])
+        self.pin_label(self.system_tray, self.TRAY_ICONS)
+        self.pin_label(self.clock_label, [f"⏰ {d}{d}:{d}{d}:{d}{d}" for d in "0123456789"])
+    
+    def pin_label(self, label, texts):
+        """Fix a label at the size of the widest text it will show"""
+        self.ensurePolished()
+        current = label.text()
+        width = 0
+        for text in texts:
+            label.setText(text)
+            width = max(width, label.sizeHint().width())
+        label.setText(current)
+        
+        margins = self.layout().contentsMargins()
+        label.setFixedSize(width, self.contentsRect().height() - margins.top() - margins.bottom())
+    
     def animate_start_button(self):
         self.start_glow_phase += 1
         intensity = int(50 + 30 * math.sin(self.start_glow_phase * 0.1))
-        
-        glow_effect = QGraphicsDropShadowEffect()
-        glow_effect.setBlurRadius(20)
-        glow_effect.setColor(QColor(0, 255, 255, intensity))
-        glow_effect.setOffset(0, 0)
-        self.start_btn.setGraphicsEffect(glow_effect)
+        self.start_glow.set_opacity(intensity / 255)
         
     def animate_tray(self):
-        icons = ["🔊 📶 🔋", "🔇 📶 🔋", "🔊 📵 🔋", "🔊 📶 🪫", "🔊 📶 ⚡"]
-        self.system_tray.setText(random.choice(icons))
+        self.system_tray.setText(random.choice(self.TRAY_ICONS))
         
     def add_running_app(self, name, is_active=False):
         """Add a running application to the taskbar"""
@@ -381,8 +327,7 @@ class TaskBar(QFrame):
         
         # Random vibe updates
         if random.randint(1, 30) == 1:  # 1/30 chance each second
-            vibes = ["💯", "🔥", "💀", "😭", "🤡", "👑", "💎", "⚡", "🌟", "🚀"]
-            self.vibe_label.setText(f"Vibe Level: {random.choice(vibes)}")
+            self.vibe_label.setText(f"Vibe Level: {random.choice(self.VIBES)}")
 
 class EnhancedWeatherWidget(QWidget):
     """Enhanced weather widget with live updates"""
@@ -393,11 +338,7 @@ class EnhancedWeatherWidget(QWidget):
         self.setup_timer()
         
     def setup_ui(self):
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 100))
-        self.shadow_effect.setOffset(2, 2)
-        self.setGraphicsEffect(self.shadow_effect)
+        self.shadow_effect = GlowUnderlay(self, 15, QColor(0, 0, 0, 100), offset=(2, 2), corner_radius=8)
         
         layout = QVBoxLayout()
         
@@ -442,23 +383,25 @@ class EnhancedWeatherWidget(QWidget):
         layout.addWidget(title_label)
         layout.addWidget(self.content_label)
         self.setLayout(layout)
-        self.update_weather()
+        self.content_label.setText("Currently: Checking the sky...\nTemp: --\nHumidity: --\nWind: --")
+        pin_to_layout(self.content_label)
         
     def setup_timer(self):
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_weather)
-        self.timer.start(10000)  # Update every 10 seconds
+        self.weather = WeatherService.instance()
+        self.weather.updated.connect(self.show_weather)
+        self.timer = FrameClock.instance().subscribe(self.update_weather, 10000, self)  # Update every 10 seconds
+        self.update_weather()
         
     def update_weather(self):
-        conditions = ["Sunny", "Cloudy", "Rainy", "Snowy", "Foggy", "Windy"]
-        temps = ["15°C", "20°C", "25°C", "30°C", "35°C"]
-        humidity = ["30%", "45%", "60%", "75%", "90%"]
-        
-        condition = random.choice(conditions)
-        temp = random.choice(temps)
-        hum = random.choice(humidity)
-        
-        self.content_label.setText(f"Currently: {condition}\nTemp: {temp}\nHumidity: {hum}\nWind: 5 mph")
+        # Cheap when the cache is fresh; network fetches happen on the service's worker thread
+        self.weather.request()
+        
+    def show_weather(self, report):
+        if report is None:
+            self.content_label.setText("Currently: 📡 Offline\nTemp: --\nHumidity: --\nWind: --")
+            return
+        self.content_label.setText(f"Currently: {report.condition}\nTemp: {report.temperature_c}°C\n"
+                                   f"Humidity: {report.humidity}%\nWind: {report.wind_kmh} km/h")
 
 class EnhancedCalendarWidget(QWidget):
     """Enhanced calendar widget with events"""
@@ -468,11 +411,7 @@ class EnhancedCalendarWidget(QWidget):
         self.setup_ui()
         
     def setup_ui(self):
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 100))
-        self.shadow_effect.setOffset(2, 2)
-        self.setGraphicsEffect(self.shadow_effect)
+        self.shadow_effect = GlowUnderlay(self, 15, QColor(0, 0, 0, 100), offset=(2, 2), corner_radius=8)
         
         layout = QVBoxLayout()
         
@@ -519,6 +458,32 @@ class EnhancedCalendarWidget(QWidget):
         layout.addWidget(content_label)
         self.setLayout(layout)
 
+class Sparkline(QWidget):
+    """Tiny line chart of recent values (0-100), one line per series"""
+    def __init__(self, colors, parent=None):
+        super().__init__(parent)
+        self.colors = [QColor(color) for color in colors]
+        self.series = [()] * len(colors)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+    
+    def set_series(self, *series):
+        if list(series) != self.series:
+            self.series = list(series)
+            self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        width, height = self.width() - 1, self.height() - 1
+        for values, color in zip(self.series, self.colors):
+            if len(values) < 2:
+                continue
+            painter.setPen(color)
+            step = width / (len(values) - 1)
+            points = [(i * step, height - height * min(max(value, 0), 100) / 100) for i, value in enumerate(values)]
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+
 class EnhancedSystemWidget(QWidget):
     """Enhanced system monitor widget"""
     def __init__(self):
@@ -528,11 +493,7 @@ class EnhancedSystemWidget(QWidget):
         self.setup_timer()
         
     def setup_ui(self):
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 100))
-        self.shadow_effect.setOffset(2, 2)
-        self.setGraphicsEffect(self.shadow_effect)
+        self.shadow_effect = GlowUnderlay(self, 15, QColor(0, 0, 0, 100), offset=(2, 2), corner_radius=8)
         
         layout = QVBoxLayout()
         
@@ -575,19 +536,29 @@ class EnhancedSystemWidget(QWidget):
         layout.addWidget(title_label)
         layout.addWidget(self.content_label)
         self.setLayout(layout)
-        self.update_stats()
+        self.content_label.setText("CPU: --%\nRAM: --\nDisk: --\nVibes: Maximum")
+        pin_to_layout(self.content_label)
         
+        # CPU (cyan) and RAM (magenta) history, drawn beside the numbers
+        self.sparkline = Sparkline(["#00ffff", "#ff66ff"], self.content_label)
+        self.sparkline.setGeometry(125, 12, 65, 50)
+    
     def setup_timer(self):
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_stats)
-        self.timer.start(2000)  # Update every 2 seconds
-        
-    def update_stats(self):
-        cpu = random.randint(10, 95)
-        ram = random.randint(2, 8)
-        disk = random.randint(100, 500)
-        
-        self.content_label.setText(f"CPU: {cpu}%\nRAM: {ram}GB used\nDisk: {disk}GB free\nVibes: Maximum")
+        # Samples are pushed from the monitor's thread every 2 seconds
+        monitor = SystemMonitor.instance()
+        monitor.sampled.connect(self.update_stats)
+        if monitor.last_sample is not None:
+            self.update_stats(monitor.last_sample)
+        monitor.start()
+        
+    def update_stats(self, sample):
+        text = (f"CPU: {sample.cpu_percent:.0f}%\n"
+                f"RAM: {sample.mem_used / GB:.1f}/{sample.mem_total / GB:.1f}GB\n"
+                f"Disk: {sample.disk_free / GB:.0f}GB free\n"
+                f"Vibes: Maximum")
+        if text != self.content_label.text():
+            self.content_label.setText(text)
+        self.sparkline.set_series(sample.cpu_history, sample.mem_history)
 
 class EnhancedMusicWidget(QWidget):
     """Enhanced music player widget"""
@@ -598,11 +569,7 @@ class EnhancedMusicWidget(QWidget):
         self.setup_timer()
         
     def setup_ui(self):
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 100))
-        self.shadow_effect.setOffset(2, 2)
-        self.setGraphicsEffect(self.shadow_effect)
+        self.shadow_effect = GlowUnderlay(self, 15, QColor(0, 0, 0, 100), offset=(2, 2), corner_radius=8)
         
         layout = QVBoxLayout()
         
@@ -646,11 +613,10 @@ class EnhancedMusicWidget(QWidget):
         layout.addWidget(self.content_label)
         self.setLayout(layout)
         self.update_track()
+        pin_to_layout(self.content_label)
         
     def setup_timer(self):
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_track)
-        self.timer.start(15000)  # Change track every 15 seconds
+        self.timer = FrameClock.instance().subscribe(self.update_track, 15000, self)  # Change track every 15 seconds
         
     def update_track(self):
         tracks = [
@@ -664,18 +630,21 @@ class EnhancedMusicWidget(QWidget):
         self.content_label.setText(f"Track: {track}\nArtist: {artist}\nAlbum: {album}\nVolume: 💯")
 
 class EnhancedNotesWidget(QWidget):
-    """Enhanced notes widget"""
+    """Enhanced notes widget, editable and autosaved through NotesStore"""
+    DEFAULT_NOTES = "• Touch grass (postponed)\n• Learn new rizz lines\n• Update vibe check\n• Stream on Twitch\n• Buy more RGB"
+    SAVE_DELAY_MS = 400  # after the last keystroke
+    MAX_UNSAVED = 2.0  # seconds of continuous typing before saving anyway
+    
     def __init__(self):
         super().__init__()
         self.setFixedSize(200, 150)
+        self.store = NotesStore()
+        self.dirty_since = None
         self.setup_ui()
+        self.setup_autosave()
         
     def setup_ui(self):
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 100))
-        self.shadow_effect.setOffset(2, 2)
-        self.setGraphicsEffect(self.shadow_effect)
+        self.shadow_effect = GlowUnderlay(self, 15, QColor(0, 0, 0, 100), offset=(2, 2), corner_radius=8)
         
         layout = QVBoxLayout()
         
@@ -696,12 +665,10 @@ class EnhancedNotesWidget(QWidget):
             }
         """)
         
-        content = "• Touch grass (postponed)\n• Learn new rizz lines\n• Update vibe check\n• Stream on Twitch\n• Buy more RGB"
-        
-        content_label = QLabel(content)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet("""
-            QLabel {
+        self.editor = QPlainTextEdit()
+        self.editor.setPlainText(self.store.load(self.DEFAULT_NOTES))
+        self.editor.setStyleSheet("""
+            QPlainTextEdit {
                 background: rgba(255, 255, 255, 40);
                 color: white;
                 font-size: 10px;
@@ -718,8 +685,34 @@ class EnhancedNotesWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         layout.addWidget(title_label)
-        layout.addWidget(content_label)
+        layout.addWidget(self.editor)
         self.setLayout(layout)
+    
+    def setup_autosave(self):
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.save_notes)
+        self.editor.textChanged.connect(self.schedule_save)
+        QApplication.instance().aboutToQuit.connect(self.close_store)
+    
+    def schedule_save(self):
+        # Keystrokes only restart a timer; the store's writer thread does the disk work
+        now = time.monotonic()
+        if self.dirty_since is None:
+            self.dirty_since = now
+        if now - self.dirty_since >= self.MAX_UNSAVED:
+            self.save_notes()
+        else:
+            self.save_timer.start(self.SAVE_DELAY_MS)
+    
+    def save_notes(self):
+        self.save_timer.stop()
+        self.dirty_since = None
+        self.store.save(self.editor.toPlainText())
+    
+    def close_store(self):
+        self.save_notes()
+        self.store.close()
 
 class VistaWidget(QWidget):
     """Vista-style sidebar widget"""
@@ -728,11 +721,7 @@ class VistaWidget(QWidget):
         self.setFixedSize(200, 150)
         
         # Add glass effect
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 100))
-        self.shadow_effect.setOffset(2, 2)
-        self.setGraphicsEffect(self.shadow_effect)
+        self.shadow_effect = GlowUnderlay(self, 15, QColor(0, 0, 0, 100), offset=(2, 2), corner_radius=8)
         
         layout = QVBoxLayout()
         
@@ -778,8 +767,48 @@ class VistaWidget(QWidget):
         layout.addWidget(content_label)
         self.setLayout(layout)
 
-class BrainrotDesktop(QMainWindow):
+class DesktopBackground(QWidget):
+    """Vista gradient wallpaper that paints its own slow colour shift"""
+    # One full period of sin(phase * 0.02), in animation phases
+    PERIOD = int(round(2 * math.pi / 0.02))
+    
     def __init__(self):
+        super().__init__()
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        
+        # Gradient stops for every phase of the cycle, computed once. Neighbouring
+        # phases often round to the same colours, so entries are shared.
+        stops_by_shift = {}
+        self.color_table = []
+        for phase in range(self.PERIOD):
+            hue_shift = int(20 * math.sin(phase * 0.02))
+            if hue_shift not in stops_by_shift:
+                stops_by_shift[hue_shift] = (
+                    QColor(135 + hue_shift, 206 + hue_shift // 2, 250),
+                    QColor(70 + hue_shift, 130 + hue_shift // 2, 180),
+                    QColor(25 + hue_shift // 2, 25 + hue_shift // 2, 112),
+                    QColor(0, 0, 139 + hue_shift // 3)
+                )
+            self.color_table.append(stops_by_shift[hue_shift])
+        
+        self.stops = self.color_table[0]
+    
+    def set_phase(self, phase):
+        stops = self.color_table[phase % self.PERIOD]
+        # Only repaint when the rounded colours actually change
+        if stops is not self.stops:
+            self.stops = stops
+            self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        gradient = QLinearGradient(0, 0, self.width(), self.height())
+        for position, color in zip((0, 0.3, 0.7, 1), self.stops):
+            gradient.setColorAt(position, color)
+        painter.fillRect(event.rect(), QBrush(gradient))
+
+class BrainrotDesktop(QMainWindow):
+    def __init__(self, staged=False):
         super().__init__()
         self.setWindowTitle("🧠 BrainrotOS Vista Edition")
         self.setGeometry(100, 100, 1200, 800)
@@ -788,8 +817,9 @@ class BrainrotDesktop(QMainWindow):
         screen = QDesktopWidget().screenGeometry()
         self.setGeometry(0, 0, screen.width(), screen.height())
         
-        # Main widget
-        main_widget = QWidget()
+        # Main widget doubles as the animated Vista wallpaper
+        main_widget = DesktopBackground()
+        self.background = main_widget
         self.setCentralWidget(main_widget)
         
         # Main layout with sidebar
@@ -798,23 +828,17 @@ class BrainrotDesktop(QMainWindow):
         main_layout.setSpacing(0)
         
         # Desktop area layout
-        desktop_layout = QVBoxLayout()
-        desktop_layout.setContentsMargins(0, 0, 0, 0)
+        self.desktop_layout = QVBoxLayout()
+        self.desktop_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Desktop area
+        # Desktop area (icons are added by the setup_desktop stage)
         self.desktop_area = QWidget()
-        self.setup_desktop()
-        
-        # Taskbar
-        self.taskbar = TaskBar()
-        
-        desktop_layout.addWidget(self.desktop_area)
-        desktop_layout.addWidget(self.taskbar)
+        self.desktop_layout.addWidget(self.desktop_area)
         
         desktop_widget = QWidget()
-        desktop_widget.setLayout(desktop_layout)
+        desktop_widget.setLayout(self.desktop_layout)
         
-        # Vista-style sidebar
+        # Vista-style sidebar (gadgets are added by their own stages)
         self.sidebar = self.create_sidebar()
         
         main_layout.addWidget(desktop_widget)
@@ -822,24 +846,64 @@ class BrainrotDesktop(QMainWindow):
         
         main_widget.setLayout(main_layout)
         
-        # Set Vista-style background with animated elements
-        self.background_phase = 0
-        self.background_timer = QTimer()
-        self.background_timer.timeout.connect(self.animate_background)
-        self.background_timer.start(100)
+        # Store app windows
+        self.registry = AppRegistry.instance()
+        self.app_windows = self.registry.windows
+        self.perf_hud = None
+        self.start_menu = None
+        
+        # Boot stages as (name, splash message, callable). Run them all now,
+        # or let the caller drive them one event-loop slice at a time.
+        self.build_stages = [
+            ("setup_desktop", "Spawning desktop icons...", self.setup_desktop),
+            ("taskbar", "Assembling Vista taskbar...", self.setup_taskbar),
+            ("weather_widget", "Forecasting vibes...", lambda: self.add_sidebar_widget(EnhancedWeatherWidget)),
+            ("calendar_widget", "Booking rizz meetings...", lambda: self.add_sidebar_widget(EnhancedCalendarWidget)),
+            ("system_widget", "Measuring system aura...", lambda: self.add_sidebar_widget(EnhancedSystemWidget)),
+            ("music_widget", "Queueing Ohio hits...", lambda: self.add_sidebar_widget(EnhancedMusicWidget)),
+            ("notes_widget", "Unpacking sigma notes...", lambda: self.add_sidebar_widget(EnhancedNotesWidget)),
+            ("vista_logo", "Polishing Vista logo...", self.finish_sidebar),
+            ("background", "Starting background animation...", self.start_background_animation),
+        ]
         
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(135, 206, 250, 255),
-                    stop:0.3 rgba(70, 130, 180, 255),
-                    stop:0.7 rgba(25, 25, 112, 255),
-                    stop:1 rgba(0, 0, 139, 255));
-            }
-        """)
+        if not staged:
+            for _, _, stage in self.build_stages:
+                stage()
         
-        # Store app windows
-        self.app_windows = {}
+    def setup_taskbar(self):
+        self.taskbar = TaskBar()
+        self.taskbar.hud_requested.connect(self.toggle_perf_hud)
+        self.taskbar.start_requested.connect(self.toggle_start_menu)
+        QShortcut(QKeySequence("Ctrl+Space"), self, self.toggle_start_menu)
+        self.desktop_layout.addWidget(self.taskbar)
+    
+    def toggle_perf_hud(self):
+        """Show or hide the live frame-time/timer-cost overlay"""
+        if self.perf_hud is None:
+            from perf_hud import PerfHud
+            self.perf_hud = PerfHud()
+        self.perf_hud.setVisible(not self.perf_hud.isVisible())
+        
+    def toggle_start_menu(self):
+        """Open the search launcher over the start button (also Ctrl+Space)"""
+        if self.start_menu is None:
+            from start_menu import StartMenu
+            self.start_menu = StartMenu()
+            self.start_menu.activated.connect(self.open_search_result)
+        if self.start_menu.isVisible():
+            self.start_menu.hide()
+        else:
+            self.start_menu.popup(self.taskbar.start_btn)
+        
+    def open_search_result(self, item):
+        if item.kind == "app":
+            self.icon_callback(self.registry.specs[item.key])()
+        elif item.app:
+            window = self.launch_app(item.app)
+            if hasattr(window, "reveal"):
+                window.reveal(item.key)
+        else:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(item.key))
         
     def create_sidebar(self):
         sidebar = QWidget()
@@ -851,23 +915,23 @@ class BrainrotDesktop(QMainWindow):
             }
         """)
         
-        layout = QVBoxLayout()
-        layout.setContentsMargins(10, 20, 10, 20)
-        layout.setSpacing(15)
-        
-        # Create enhanced sidebar widgets with real functionality
-        widgets = [
-            EnhancedWeatherWidget(),
-            EnhancedCalendarWidget(), 
-            EnhancedSystemWidget(),
-            EnhancedMusicWidget(),
-            EnhancedNotesWidget()
-        ]
+        self.sidebar_layout = QVBoxLayout()
+        self.sidebar_layout.setContentsMargins(10, 20, 10, 20)
+        self.sidebar_layout.setSpacing(15)
+        self.sidebar_widgets = []
         
-        for widget in widgets:
-            layout.addWidget(widget)
-            
-        layout.addStretch()
+        sidebar.setLayout(self.sidebar_layout)
+        return sidebar
+        
+    def add_sidebar_widget(self, widget_class):
+        """Create one enhanced sidebar gadget and append it to the sidebar"""
+        widget = widget_class()
+        self.sidebar_widgets.append(widget)
+        self.sidebar_layout.addWidget(widget)
+        return widget
+        
+    def finish_sidebar(self):
+        self.sidebar_layout.addStretch()
         
         # Animated Vista logo
         self.vista_logo = QLabel("🌌 Vista Vibes")
@@ -889,25 +953,17 @@ class BrainrotDesktop(QMainWindow):
             }
         """)
         
-        layout.addWidget(self.vista_logo)
+        self.sidebar_layout.addWidget(self.vista_logo)
         
-        sidebar.setLayout(layout)
-        return sidebar
+    def start_background_animation(self):
+        # Set Vista-style background with animated elements
+        self.background_phase = 0
+        self.background_timer = FrameClock.instance().subscribe(self.animate_background, 100, self, animation=True)
         
     def animate_background(self):
         self.background_phase += 1
-        # Create subtle color shifting effect
-        hue_shift = int(20 * math.sin(self.background_phase * 0.02))
-        
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba({135 + hue_shift}, {206 + hue_shift//2}, 250, 255),
-                    stop:0.3 rgba({70 + hue_shift}, {130 + hue_shift//2}, 180, 255),
-                    stop:0.7 rgba({25 + hue_shift//2}, {25 + hue_shift//2}, 112, 255),
-                    stop:1 rgba(0, 0, {139 + hue_shift//3}, 255));
-            }}
-        """)
+        # Subtle color shifting effect, painted by the background widget itself
+        self.background.set_phase(self.background_phase)
         
     def setup_desktop(self):
         # Set desktop area style
@@ -917,101 +973,53 @@ class BrainrotDesktop(QMainWindow):
             }
         """)
         
-        layout = QGridLayout()
-        layout.setSpacing(30)
-        layout.setContentsMargins(40, 40, 40, 40)
-        
-        # Desktop icons with Vista-style arrangement
-        icons = [
-            ("Rizz Gen", "💘", self.open_rizz_generator),
-            ("NPC Chat", "🤖", self.open_npc_chat),
-            ("Meme Player", "🔊", self.open_sound_player),
-            ("Vibe Check", "✅", self.open_vibe_check),
-            ("Ohio Files", "📁", self.open_file_manager),
-            ("Sigma Notes", "📝", self.open_notepad),
-            ("Gyatt Cam", "📷", self.open_camera),
-            ("Touch Grass", "🌱", self.touch_grass),
-        ]
+        # Icons are painted by one canvas; the scroll area takes over once they outgrow the screen
+        self.desktop_canvas = DesktopCanvas(columns=4)
+        self.desktop_canvas.add_icons([(spec.key, spec.name, spec.emoji, self.icon_callback(spec))
+                                       for spec in self.registry.apps])
         
-        self.desktop_icons = []
-        row, col = 0, 0
-        for name, emoji, callback in icons:
-            icon = DesktopIcon(name, emoji, callback)
-            self.desktop_icons.append(icon)
-            layout.addWidget(icon, row, col)
-            col += 1
-            if col > 3:  # 4 icons per row for better Vista layout
-                col = 0
-                row += 1
-        
-        # Add floating animation to icons
-        self.float_timer = QTimer()
-        self.float_timer.timeout.connect(self.animate_floating_icons)
-        self.float_timer.start(50)
-        self.float_phase = 0
-        
-        # Add some stretch to push icons to top-left
-        layout.setRowStretch(row + 1, 1)
-        layout.setColumnStretch(4, 1)
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        scroll_area.setWidget(self.desktop_canvas)
         
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(scroll_area)
         self.desktop_area.setLayout(layout)
         
-    def animate_floating_icons(self):
-        """Create subtle floating animation for desktop icons"""
-        self.float_phase += 1
-        
-        for i, icon in enumerate(self.desktop_icons):
-            # Each icon floats with a different phase
-            offset_y = int(3 * math.sin((self.float_phase + i * 20) * 0.05))
-            current_margins = icon.contentsMargins()
-            icon.setContentsMargins(current_margins.left(), 
-                                  offset_y, 
-                                  current_margins.right(), 
-                                  current_margins.bottom())
-        
+    def icon_callback(self, spec):
+        if spec.action:
+            return getattr(self, spec.action)
+        return lambda: self.launch_app(spec.key)
+    
+    def launch_app(self, key):
+        return self.registry.launch(key)
+    
     def open_rizz_generator(self):
-        if "rizz" not in self.app_windows:
-            from apps.rizz_generator import RizzGeneratorApp
-            self.app_windows["rizz"] = RizzGeneratorApp()
-        self.app_windows["rizz"].show()
-        self.app_windows["rizz"].raise_()
+        self.launch_app("rizz")
         
     def open_npc_chat(self):
-        if "npc" not in self.app_windows:
-            from apps.npc_chat import NPCChatApp
-            self.app_windows["npc"] = NPCChatApp()
-        self.app_windows["npc"].show()
-        self.app_windows["npc"].raise_()
+        self.launch_app("npc")
         
     def open_sound_player(self):
-        if "sound" not in self.app_windows:
-            from apps.sound_player import SoundPlayerApp
-            self.app_windows["sound"] = SoundPlayerApp()
-        self.app_windows["sound"].show()
-        self.app_windows["sound"].raise_()
+        self.launch_app("sound")
         
     def open_vibe_check(self):
-        if "vibe" not in self.app_windows:
-            from apps.vibe_check import VibeCheckApp
-            self.app_windows["vibe"] = VibeCheckApp()
-        self.app_windows["vibe"].show()
-        self.app_windows["vibe"].raise_()
+        self.launch_app("vibe")
         
     def open_file_manager(self):
-        # Placeholder for file manager
-        self.show_placeholder("Ohio Files", "📁 Your files are in another castle (Ohio)")
+        self.launch_app("files")
         
     def open_notepad(self):
-        # Placeholder for notepad
-        self.show_placeholder("Sigma Notes", "📝 Write your sigma thoughts here")
+        self.launch_app("notes")
         
     def open_camera(self):
-        if "camera" not in self.app_windows:
-            from apps.gyatt_cam import GyattCam
-            self.app_windows["camera"] = GyattCam()
-        self.app_windows["camera"].show()
-        self.app_windows["camera"].raise_()
+        self.launch_app("camera")
         
+    def open_task_manager(self):
+        self.launch_app("tasks")
+    
     def touch_grass(self):
         # Easter egg
         self.show_placeholder("Touch Grass", "🌱 grass.exe not found\nPlease install outside.dll")
@@ -0,0 +1,203 @@
+"""
+🕒 Shared animation clock for BrainrotOS
+A single QTimer drives every periodic widget callback, so subscribers that are
+due in the same frame run together instead of each waking the event loop.
+Subscriptions flagged as animations can be slowed down or paused as a group
+(see animation_governor) without touching the widgets that own them.
+"""
+
+import time
+import traceback
+from functools import partial
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer, QEvent
+
+def now_ms():
+    return time.monotonic() * 1000
+
+def describe_callback(callback):
+    """Owner label such as 'EnhancedSystemWidget.update_stats'"""
+    name = getattr(callback, "__name__", None) or type(callback).__name__
+    owner = getattr(callback, "__self__", None)
+    if owner is not None:
+        return f"{type(owner).__name__}.{name}"
+    return getattr(callback, "__qualname__", name)
+
+class ClockSubscription:
+    """A periodic callback on the shared clock, driven like a QTimer"""
+    def __init__(self, clock, callback, interval_ms, widget=None, animation=False):
+        self.clock = clock
+        self.callback = callback
+        self.owner = describe_callback(callback)
+        self.interval = interval_ms
+        self.widget = widget
+        self.animation = animation
+        self.running = False
+        self.visible = widget is None or widget.isVisible()
+        self.occluded = False
+        self.due = 0.0
+    
+    def start(self, interval_ms=None):
+        if interval_ms is not None:
+            self.interval = interval_ms
+        self.running = True
+        self.due = now_ms() + self.interval
+        self.clock.reschedule()
+    
+    def stop(self):
+        if self.running:
+            self.running = False
+            self.clock.reschedule()
+    
+    def set_interval(self, interval_ms):
+        self.interval = interval_ms
+        if self.running:
+            self.due = min(self.due, now_ms() + interval_ms)
+            self.clock.reschedule()
+    
+    def is_active(self):
+        """Started and not paused (hidden widget, or a throttled animation)"""
+        if not (self.running and self.visible):
+            return False
+        if self.animation and (self.occluded or self.clock.animations_suspended):
+            return False
+        return True
+    
+    def effective_interval(self):
+        if self.animation:
+            return self.interval * self.clock.animation_scale
+        return self.interval
+
+class FrameClock(QObject):
+    """Process-wide frame scheduler; use FrameClock.instance()"""
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        super().__init__()
+        self.subscriptions = []
+        self.widget_subscriptions = {}
+        self.frame_interval = None
+        self.animation_scale = 1.0
+        self.animations_suspended = False
+        # Optional callback cost sink with an add(owner, seconds) method (see perf_monitor)
+        self.stats = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+    
+    def subscribe(self, callback, interval_ms, widget=None, start=True, animation=False):
+        """Call callback every interval_ms while started.
+        
+        When widget is given the subscription pauses automatically while the
+        widget is hidden and resumes when it is shown again. Purely decorative
+        callbacks should pass animation=True so they can be throttled.
+        """
+        subscription = ClockSubscription(self, callback, interval_ms, widget, animation)
+        self.subscriptions.append(subscription)
+        
+        if widget is not None:
+            key = id(widget)
+            if key not in self.widget_subscriptions:
+                self.widget_subscriptions[key] = []
+                widget.installEventFilter(self)
+                widget.destroyed.connect(partial(self.forget_widget, key))
+            self.widget_subscriptions[key].append(subscription)
+        
+        if start:
+            subscription.start()
+        return subscription
+    
+    def unsubscribe(self, subscription):
+        subscription.running = False
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+        if subscription.widget is not None:
+            subscriptions = self.widget_subscriptions.get(id(subscription.widget), [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+        self.reschedule()
+    
+    def forget_widget(self, key, *args):
+        for subscription in self.widget_subscriptions.pop(key, []):
+            subscription.running = False
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+        self.reschedule()
+    
+    def subscribed_widgets(self):
+        return [subscriptions[0].widget for subscriptions in self.widget_subscriptions.values() if subscriptions]
+    
+    def set_occluded(self, widget, occluded):
+        """Pause (or resume) a widget's animations while it is covered"""
+        changed = False
+        for subscription in self.widget_subscriptions.get(id(widget), []):
+            if subscription.occluded != occluded:
+                subscription.occluded = occluded
+                changed = True
+        if changed:
+            self.reschedule()
+    
+    def set_animation_rate(self, scale=1.0, suspended=False):
+        """Stretch every animation interval by scale, or pause animations entirely"""
+        if scale == self.animation_scale and suspended == self.animations_suspended:
+            return
+        self.animation_scale = scale
+        self.animations_suspended = suspended
+        self.reschedule()
+    
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.Show or event_type == QEvent.Hide:
+            visible = event_type == QEvent.Show
+            for subscription in self.widget_subscriptions.get(id(obj), []):
+                subscription.visible = visible
+            self.reschedule()
+        return False
+    
+    def reschedule(self):
+        """Run the frame timer at the fastest active rate, or not at all"""
+        if sip.isdeleted(self.timer):
+            # Widgets destroyed during interpreter shutdown, after the clock
+            return
+        
+        intervals = [s.effective_interval() for s in self.subscriptions if s.is_active()]
+        if not intervals:
+            self.frame_interval = None
+            self.timer.stop()
+            return
+        
+        frame_interval = max(1, int(min(intervals)))
+        if frame_interval != self.frame_interval or not self.timer.isActive():
+            self.frame_interval = frame_interval
+            self.timer.start(frame_interval)
+    
+    def tick(self):
+        now = now_ms()
+        # Anything due within half a frame runs now rather than one frame late
+        horizon = now + self.frame_interval / 2
+        
+        for subscription in list(self.subscriptions):
+            if not subscription.is_active() or subscription.due > horizon:
+                continue
+            
+            interval = subscription.effective_interval()
+            subscription.due += interval
+            if subscription.due <= now:
+                # Fell behind (e.g. after being paused); don't replay missed frames
+                subscription.due = now + interval
+            
+            stats = self.stats
+            try:
+                if stats is None:
+                    subscription.callback()
+                else:
+                    start = time.perf_counter()
+                    subscription.callback()
+                    stats.add(subscription.owner, time.perf_counter() - start)
+            except Exception:
+                traceback.print_exc()
@@ -0,0 +1,142 @@
+"""
+✨ Cached glow/shadow compositor for BrainrotOS
+Blurs each (size, radius, colour) shadow once into a bounded pixmap cache and
+draws the cached sprite behind the widget, instead of QGraphicsDropShadowEffect
+re-rendering and re-blurring the widget offscreen on every repaint.
+"""
+
+from collections import OrderedDict
+from PyQt5.QtWidgets import QWidget, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+from PyQt5.QtCore import Qt, QEvent, QRectF
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QBrush
+
+class GlowCache:
+    """LRU cache of blurred sprites, bounded by entry count and total bytes"""
+    def __init__(self, max_entries=64, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sprites = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def sprite(self, width, height, blur_radius, color, corner_radius=0):
+        """Blurred silhouette of a width x height rounded rect, padded by blur_radius"""
+        key = (width, height, blur_radius, color.rgba(), corner_radius)
+        pixmap = self.sprites.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return pixmap
+        
+        self.misses += 1
+        pixmap = self.render(width, height, blur_radius, color, corner_radius)
+        self.sprites[key] = pixmap
+        self.total_bytes += self.cost(pixmap)
+        
+        while self.sprites and (len(self.sprites) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, evicted = self.sprites.popitem(last=False)
+            self.total_bytes -= self.cost(evicted)
+        return pixmap
+    
+    def cost(self, pixmap):
+        return pixmap.width() * pixmap.height() * 4
+    
+    def render(self, width, height, blur_radius, color, corner_radius):
+        margin = blur_radius
+        image = QImage(width + 2 * margin, height + 2 * margin, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(color))
+        painter.drawRoundedRect(QRectF(margin, margin, width, height), corner_radius, corner_radius)
+        painter.end()
+        
+        if blur_radius <= 0:
+            return QPixmap.fromImage(image)
+        
+        # Same blur Qt's drop shadow uses, but run exactly once per sprite
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+        effect = QGraphicsBlurEffect()
+        effect.setBlurRadius(blur_radius)
+        effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+        
+        blurred = QImage(image.size(), QImage.Format_ARGB32_Premultiplied)
+        blurred.fill(Qt.transparent)
+        painter = QPainter(blurred)
+        scene.render(painter, QRectF(blurred.rect()), QRectF(image.rect()))
+        painter.end()
+        return QPixmap.fromImage(blurred)
+    
+    def clear(self):
+        self.sprites.clear()
+        self.total_bytes = 0
+
+# Shared by every glow in the shell and the apps
+glow_cache = GlowCache()
+
+class GlowUnderlay(QWidget):
+    """Sibling widget that sits just under its target and paints a cached glow.
+    
+    Glow intensity is animated with set_opacity(), which only re-blits the
+    cached sprite; nothing is blurred again. inset shrinks the glowing shape
+    inside the target, for widgets that paint within a transparent margin.
+    """
+    def __init__(self, target, blur_radius, color, offset=(0, 0), corner_radius=0, cache=None, inset=0):
+        super().__init__(target.parentWidget())
+        self.target = target
+        self.blur_radius = blur_radius
+        self.color = QColor(color)
+        self.offset = offset
+        self.corner_radius = corner_radius
+        self.inset = inset
+        self.cache = cache or glow_cache
+        self.opacity = 1.0
+        
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setFocusPolicy(Qt.NoFocus)
+        # Keep parent stylesheets (e.g. the sidebar's QWidget rule) from painting us
+        self.setStyleSheet("background: transparent; border: none;")
+        
+        target.installEventFilter(self)
+        self.sync_geometry()
+    
+    def set_opacity(self, opacity):
+        opacity = max(0.0, min(1.0, opacity))
+        if abs(opacity - self.opacity) >= 1 / 255:
+            self.opacity = opacity
+            self.update()
+    
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type in (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.ParentChange):
+            self.sync_geometry()
+        elif event_type == QEvent.Hide:
+            self.hide()
+        return False
+    
+    def sync_geometry(self):
+        parent = self.target.parentWidget()
+        if parent is None:
+            self.hide()
+            return
+        if self.parentWidget() is not parent:
+            self.setParent(parent)
+        
+        margin = self.blur_radius - self.inset
+        geometry = self.target.geometry().adjusted(-margin, -margin, margin, margin)
+        self.setGeometry(geometry.translated(*self.offset))
+        self.stackUnder(self.target)
+        self.setVisible(self.target.isVisibleTo(parent))
+    
+    def paintEvent(self, event):
+        sprite = self.cache.sprite(self.target.width() - 2 * self.inset, self.target.height() - 2 * self.inset,
+                                   self.blur_radius, self.color, self.corner_radius)
+        painter = QPainter(self)
+        painter.setOpacity(self.opacity)
+        painter.drawPixmap(0, 0, sprite)
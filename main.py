@@ -6,15 +6,32 @@ A satirical, Gen Z-themed desktop shell that parodies modern OS environments.
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QFont
 
 # Add the current directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from splash_screen import BrainrotSplashScreen
-from desktop_shell import BrainrotDesktop
+# Imported first so every later import can be timed
+from startup_profiler import profiler, parse_profile_flag
+
+with profiler.phase("import PyQt5.QtWidgets"):
+    from PyQt5.QtWidgets import QApplication
+with profiler.phase("import PyQt5.QtCore"):
+    from PyQt5.QtCore import Qt, QTimer
+with profiler.phase("import PyQt5.QtGui"):
+    from PyQt5.QtGui import QIcon, QFont
+
+with profiler.phase("import splash_screen"):
+    from splash_screen import BrainrotSplashScreen
+with profiler.phase("import desktop_shell"):
+    from desktop_shell import BrainrotDesktop
+with profiler.phase("import animation_governor"):
+    from animation_governor import AnimationGovernor
+with profiler.phase("import stall_watchdog"):
+    from stall_watchdog import StallWatchdog
+with profiler.phase("import session"):
+    from session import SessionManager
+with profiler.phase("import search_index"):
+    from search_index import SearchIndex
 
 class BrainrotOS:
     def __init__(self):
@@ -22,8 +39,9 @@ class BrainrotOS:
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
         
-        self.app = QApplication(sys.argv)
-        self.setup_application()
+        with profiler.phase("QApplication()"):
+            self.app = QApplication(sys.argv)
+            self.setup_application()
         
     def setup_application(self):
         # Set application properties
@@ -38,34 +56,88 @@ class BrainrotOS:
         # Set dark theme
         self.app.setStyle('Fusion')
         
+        # Slow down or pause animations nobody is looking at
+        AnimationGovernor.instance().install(self.app)
+        
+        # Log main-thread stacks whenever the UI freezes (BRAINROT_STALL_MS, 0 = off)
+        self.watchdog = StallWatchdog()
+        self.watchdog.start()
+        self.app.aboutToQuit.connect(self.watchdog.stop)
+        
     def run(self):
         """Launch BrainrotOS with splash screen"""
         print("🧠 Initializing BrainrotOS...")
         print("⚡ Loading brainrot protocols...")
         print("🎮 Starting the most cursed OS experience...")
         
-        # Show splash screen
-        splash = BrainrotSplashScreen()
+        # Show splash screen and let it paint before the heavy lifting starts
+        with profiler.phase("BrainrotSplashScreen()"):
+            splash = BrainrotSplashScreen()
+        profiler.watch_first_paint(splash, "first splash paint")
         splash.show()
+        self.app.processEvents()
         
-        # Create desktop (but don't show yet)
-        desktop = BrainrotDesktop()
+        # Create the desktop shell; its widgets are built in stages below
+        with profiler.phase("BrainrotDesktop.__init__"):
+            desktop = BrainrotDesktop(staged=True)
+        profiler.watch_first_paint(desktop, "first desktop paint", profiler.write_report)
         
         # Connect splash finished signal to show desktop
         def show_desktop():
             splash.close()
             desktop.show()
+            # Reopen last session's windows once the desktop is up (BRAINROT_SESSION=0 = off)
+            session = SessionManager.instance()
+            session.restore()
+            session.install(self.app)
+            # Start-menu search; built off the GUI thread, after the session is back
+            SearchIndex.instance().start()
             print("✅ BrainrotOS loaded successfully!")
             print("🎯 Welcome to the terminal online experience!")
             
         splash.finished.connect(show_desktop)
+        self.build_desktop(desktop, splash)
         
         # Start the application
         return self.app.exec_()
+        
+    def build_desktop(self, desktop, splash):
+        """Run the desktop build stages one event-loop slice at a time"""
+        stages = desktop.build_stages
+        
+        def run_stage(index=0):
+            if index >= len(stages):
+                splash.close_splash()
+                return
+                
+            name, message, stage = stages[index]
+            splash.set_progress(100 * index // len(stages), message)
+            try:
+                with profiler.phase(f"BrainrotDesktop.{name}"):
+                    stage()
+            except Exception as e:
+                # A half-built desktop is no use; say which stage broke and quit cleanly
+                print(f"💀 BrainrotOS failed to build the desktop ({name}): {e}")
+                import traceback
+                traceback.print_exc()
+                splash.close()
+                self.app.exit(1)
+                return
+            splash.set_progress(100 * (index + 1) // len(stages))
+            
+            # Yield to the event loop so the splash keeps animating
+            QTimer.singleShot(0, lambda: run_stage(index + 1))
+            
+        QTimer.singleShot(0, run_stage)
 
 def main():
     """Main entry point"""
     try:
+        # --profile-startup[=PATH] writes a boot phase report after the first desktop paint
+        report_path = parse_profile_flag(sys.argv[1:])
+        if report_path:
+            profiler.enable(report_path)
+        
         # Create and run BrainrotOS
         brainrot_os = BrainrotOS()
         sys.exit(brainrot_os.run())
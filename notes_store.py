@@ -0,0 +1,225 @@
+"""
+📝 Crash-safe storage for Quick Notes
+Edits are appended to a journal as small splice records (one CRC-checked JSON
+line each) by a writer thread that batches whatever is queued into one write
+and one fsync. Once the journal grows past a limit it is folded into an
+atomically replaced snapshot. Loading reads the snapshot plus the journal tail
+and drops a torn last line left behind by a power cut.
+"""
+
+import os
+import json
+import zlib
+import queue
+import threading
+
+import paths
+
+def encode_record(record):
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+def decode_record(line):
+    """The record on a journal/snapshot line, or None if it is torn or corrupt"""
+    if len(line) < 10 or not line.endswith(b"\n") or line[8:9] != b" ":
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload.decode("utf-8"))
+    except ValueError:
+        return None
+
+def diff_text(old, new):
+    """Smallest single splice (at, delete, insert) turning old into new"""
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    return start, len(old) - start - end, new[start:len(new) - end]
+
+def apply_splice(text, record):
+    at = record["at"]
+    return text[:at] + record["ins"] + text[at + record["del"]:]
+
+def fsync_dir(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class NotesStore:
+    """One note document; call load() once, then save() from the GUI thread"""
+    COMPACT_RECORDS = 500
+    COMPACT_BYTES = 256 * 1024
+    
+    def __init__(self, name="quick_notes", directory=None):
+        self.directory = directory or paths.data_path("notes")
+        os.makedirs(self.directory, exist_ok=True)
+        self.snapshot_file = os.path.join(self.directory, name + ".snapshot")
+        self.journal_file = os.path.join(self.directory, name + ".journal")
+        self.saved_text = None
+        self.seq = 0
+        self.queue = queue.Queue()
+        self.thread = None
+    
+    def load(self, default=""):
+        """Current text from the snapshot plus journal; runs before the writer starts"""
+        text, self.seq = default, 0
+        snapshot = self.read_snapshot()
+        if snapshot is not None:
+            text, self.seq = snapshot["text"], snapshot["seq"]
+        
+        journal_records = 0
+        journal_bytes = 0
+        torn = False
+        try:
+            with open(self.journal_file, "rb") as f:
+                for line in f:
+                    record = decode_record(line)
+                    if record is None:
+                        torn = True
+                        break
+                    journal_bytes += len(line)
+                    if record["seq"] <= self.seq:
+                        continue  # already folded into the snapshot
+                    text = apply_splice(text, record)
+                    self.seq = record["seq"]
+                    journal_records += 1
+        except FileNotFoundError:
+            pass
+        
+        if torn:
+            # A torn tail from a crash; cut it off so new records start on a clean line
+            print(f"📝 Dropping damaged notes journal tail at byte {journal_bytes}")
+            with open(self.journal_file, "r+b") as f:
+                f.truncate(journal_bytes)
+                os.fsync(f.fileno())
+        
+        self.saved_text = text
+        self.start(text, journal_records, journal_bytes)
+        return text
+    
+    def read_snapshot(self):
+        try:
+            with open(self.snapshot_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        record = decode_record(data)
+        if record is None:
+            print(f"📝 Ignoring damaged notes snapshot {self.snapshot_file}")
+        return record
+    
+    def save(self, text):
+        """Queue the change since the last save; never touches the disk itself"""
+        if self.saved_text is None:
+            raise RuntimeError("NotesStore.load() must run before save()")
+        if text == self.saved_text:
+            return
+        at, delete, insert = diff_text(self.saved_text, text)
+        self.seq += 1
+        self.queue.put({"seq": self.seq, "at": at, "del": delete, "ins": insert})
+        self.saved_text = text
+    
+    def flush(self, timeout=5):
+        """Block until everything saved so far is on disk"""
+        if self.thread is None:
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+    
+    def close(self):
+        if self.thread is None:
+            return
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+        self.thread = None
+    
+    def start(self, text, journal_records, journal_bytes):
+        self.thread = threading.Thread(target=self.write_loop, args=(text, journal_records, journal_bytes),
+                                       name="brainrot-notes-writer", daemon=True)
+        self.thread.start()
+    
+    def write_loop(self, text, journal_records, journal_bytes):
+        """Writer thread: append batches, fsync once per batch, compact when the journal is big"""
+        journal = open(self.journal_file, "ab")
+        fsync_dir(self.directory)
+        if not os.path.exists(self.snapshot_file):
+            # Pin down the starting text so the journal never depends on a caller's default
+            journal = self.compact(journal, text, self.seq)
+            journal_records = journal_bytes = 0
+        seq = self.seq
+        running = True
+        while running:
+            items = [self.queue.get()]
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            data = []
+            waiters = []
+            for item in items:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    text = apply_splice(text, item)
+                    data.append(encode_record(item))
+                    seq = item["seq"]
+            
+            if data:
+                chunk = b"".join(data)
+                try:
+                    journal.write(chunk)
+                    journal.flush()
+                    os.fsync(journal.fileno())
+                    journal_records += len(data)
+                    journal_bytes += len(chunk)
+                except OSError as e:
+                    print(f"📝 Could not write notes journal: {e}")
+                
+                if journal_records >= self.COMPACT_RECORDS or journal_bytes >= self.COMPACT_BYTES:
+                    journal = self.compact(journal, text, seq)
+                    journal_records = journal_bytes = 0
+            
+            if not running and journal_records:
+                # Fold the session's edits in on shutdown so the next start replays nothing
+                journal = self.compact(journal, text, seq)
+            for waiter in waiters:
+                waiter.set()
+        journal.close()
+    
+    def compact(self, journal, text, seq):
+        """Replace the snapshot with the current text, then start an empty journal"""
+        temp_file = self.snapshot_file + ".tmp"
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(encode_record({"seq": seq, "text": text}))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.snapshot_file)
+            fsync_dir(self.directory)
+        except OSError as e:
+            print(f"📝 Could not write notes snapshot: {e}")
+            return journal
+        
+        # A crash between here and the truncate is harmless: load() skips records the snapshot covers
+        journal.close()
+        journal = open(self.journal_file, "wb")
+        os.fsync(journal.fileno())
+        return journal
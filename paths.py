@@ -0,0 +1,25 @@
+"""
+📂 Where BrainrotOS keeps its files
+Everything lives under $BRAINROT_HOME (default ~/.brainrotos): data/ for user
+state, cache/ for anything that can be rebuilt and logs/ for diagnostics.
+"""
+
+import os
+
+def home_dir():
+    return os.path.abspath(os.path.expanduser(os.environ.get("BRAINROT_HOME", "~/.brainrotos")))
+
+def _subdir(name, parts):
+    directory = os.path.join(home_dir(), name)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, *parts) if parts else directory
+
+def data_path(*parts):
+    """Path under the data dir; the dir itself is created on demand"""
+    return _subdir("data", parts)
+
+def cache_path(*parts):
+    return _subdir("cache", parts)
+
+def log_path(*parts):
+    return _subdir("logs", parts)
@@ -0,0 +1,110 @@
+"""
+📊 Live performance HUD for BrainrotOS
+Always-on-top overlay showing frames per second, event-loop latency, every
+active timer callback and paint time per window, refreshed once a second from
+perf_monitor.
+"""
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QAbstractItemView, QDesktopWidget)
+from PyQt5.QtCore import Qt
+
+from frame_clock import FrameClock
+from perf_monitor import PerfMonitor
+
+class PerfHud(QWidget):
+    """Frameless overlay; instrumentation only runs while it is visible"""
+    def __init__(self):
+        super().__init__(None, Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.setWindowTitle("📊 Perf HUD")
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.resize(460, 420)
+        self.monitor = PerfMonitor.instance()
+        self.setup_ui()
+        
+        # Refresh is not an animation, so the idle governor leaves it alone
+        self.refresh_timer = FrameClock.instance().subscribe(self.refresh, 1000, self)
+        
+        screen = QDesktopWidget().availableGeometry()
+        self.move(screen.right() - self.width() - 240, screen.top() + 20)
+    
+    def setup_ui(self):
+        self.setStyleSheet("""
+            QWidget {
+                background: rgba(10, 10, 30, 220);
+                color: #00ff00;
+                font-family: 'Courier New';
+                font-size: 10px;
+            }
+            QTableWidget {
+                border: 1px solid rgba(0, 255, 255, 80);
+                gridline-color: rgba(0, 255, 255, 40);
+            }
+            QHeaderView::section {
+                background: rgba(0, 255, 255, 40);
+                color: white;
+                border: none;
+                padding: 2px;
+                font-weight: bold;
+            }
+        """)
+        
+        layout = QVBoxLayout()
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+        
+        self.summary_label = QLabel("📊 Collecting...")
+        self.summary_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #00ffff;")
+        layout.addWidget(self.summary_label)
+        
+        self.timer_table = self.create_table(["⏱️ Timer callback", "calls/s", "mean ms", "max ms"])
+        layout.addWidget(self.timer_table, 3)
+        
+        self.window_table = self.create_table(["🪟 Window", "fps", "mean ms", "max ms"])
+        layout.addWidget(self.window_table, 1)
+        
+        self.setLayout(layout)
+    
+    def create_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.verticalHeader().setVisible(False)
+        table.verticalHeader().setDefaultSectionSize(18)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.setFocusPolicy(Qt.NoFocus)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, len(headers)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        return table
+    
+    def showEvent(self, event):
+        self.monitor.enable()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        self.monitor.disable()
+        super().hideEvent(event)
+    
+    def refresh(self):
+        self.monitor.watch_windows()
+        stats = self.monitor.take()
+        self.summary_label.setText(
+            f"🎞️ {stats['fps']:.1f} fps   ⚡ loop latency p50 {stats['latency_p50_ms']:.1f} / "
+            f"p95 {stats['latency_p95_ms']:.1f} / max {stats['latency_max_ms']:.1f} ms")
+        self.fill_table(self.timer_table, stats["timers"])
+        self.fill_table(self.window_table, stats["windows"])
+    
+    def fill_table(self, table, rows):
+        table.setRowCount(len(rows))
+        for row, (label, rate, mean, worst) in enumerate(rows):
+            values = [label, f"{rate:.1f}", f"{mean:.3f}", f"{worst:.3f}"]
+            for column, value in enumerate(values):
+                item = table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if column:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    table.setItem(row, column, item)
+                item.setText(value)
@@ -0,0 +1,166 @@
+"""
+📈 Lightweight runtime instrumentation for BrainrotOS
+Times FrameClock callbacks and top-level window paints, and samples event-loop
+latency, while enabled. Cheap enough to leave running: a couple of
+perf_counter() calls per callback or frame and one 20 Hz probe timer.
+"""
+
+import time
+from collections import deque
+from PyQt5 import sip
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QObject, QTimer, QEvent
+
+from frame_clock import FrameClock
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+class CostStats:
+    """Call count, total and max duration per label (since the last take(), if any)"""
+    def __init__(self):
+        self.entries = {}
+    
+    def add(self, label, seconds):
+        entry = self.entries.get(label)
+        if entry is None:
+            entry = self.entries[label] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+    
+    def take(self):
+        entries = self.entries
+        self.entries = {}
+        return entries
+    
+    def totals(self):
+        count = sum(entry[0] for entry in self.entries.values())
+        total = sum(entry[1] for entry in self.entries.values())
+        return count, total
+    
+    def rows(self):
+        """(label, count, total ms, mean ms, max ms), most expensive first"""
+        rows = [(label, count, total * 1000, total * 1000 / count, worst * 1000)
+                for label, (count, total, worst) in self.entries.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+class PaintProbe(QObject):
+    """Event filter that times each backing-store sync (one frame) of a window"""
+    def __init__(self, stats):
+        super().__init__()
+        self.stats = stats
+        self.dispatching = False
+    
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.UpdateRequest or self.dispatching:
+            return False
+        
+        # Deliver the event ourselves so the whole synchronous paint is timed
+        self.dispatching = True
+        start = time.perf_counter()
+        try:
+            obj.event(event)
+        finally:
+            self.dispatching = False
+            self.stats.add(type(obj).__name__, time.perf_counter() - start)
+        return True
+
+class PerfMonitor(QObject):
+    """Process-wide instrumentation switch; use PerfMonitor.instance()"""
+    LATENCY_INTERVAL_MS = 50
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        super().__init__()
+        self.timers = CostStats()
+        self.paints = CostStats()
+        self.latency = deque(maxlen=200)
+        self.paint_probe = PaintProbe(self.paints)
+        self.windows = {}
+        self.enabled = False
+        self.window_started = time.perf_counter()
+        
+        self.latency_timer = QTimer(self)
+        self.latency_timer.setTimerType(Qt.PreciseTimer)
+        self.latency_timer.timeout.connect(self.sample_latency)
+        self.expected = None
+    
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        FrameClock.instance().stats = self.timers
+        self.watch_windows()
+        self.take()
+        self.expected = time.perf_counter() + self.LATENCY_INTERVAL_MS / 1000
+        self.latency_timer.start(self.LATENCY_INTERVAL_MS)
+    
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        FrameClock.instance().stats = None
+        self.latency_timer.stop()
+        for window in self.windows.values():
+            if not sip.isdeleted(window):
+                window.removeEventFilter(self.paint_probe)
+        self.windows = {}
+    
+    def watch_windows(self):
+        """Start timing paints of any top-level window shown since the last call"""
+        for window in QApplication.topLevelWidgets():
+            key = id(window)
+            if key in self.windows or not window.isVisible() or window.windowType() == Qt.ToolTip:
+                continue
+            self.windows[key] = window
+            window.installEventFilter(self.paint_probe)
+        self.windows = {key: window for key, window in self.windows.items() if not sip.isdeleted(window)}
+    
+    def sample_latency(self):
+        now = time.perf_counter()
+        self.latency.append(max(0.0, now - self.expected) * 1000)
+        self.expected = now + self.LATENCY_INTERVAL_MS / 1000
+    
+    def take(self):
+        """Stats gathered since the previous take(), as plain rows"""
+        now = time.perf_counter()
+        seconds = max(now - self.window_started, 1e-6)
+        self.window_started = now
+        
+        latency = list(self.latency)
+        self.latency.clear()
+        
+        def rows(entries):
+            return sorted(((label, count / seconds, total * 1000 / count, worst * 1000)
+                           for label, (count, total, worst) in entries.items()),
+                          key=lambda row: row[1] * row[2], reverse=True)
+        
+        timers = rows(self.timers.take())
+        # Active callbacks that didn't fire in this window still get a row
+        seen = {row[0] for row in timers}
+        for owner in sorted({s.owner for s in FrameClock.instance().subscriptions if s.is_active()} - seen):
+            timers.append((owner, 0.0, 0.0, 0.0))
+        
+        paints = self.paints.take()
+        return {
+            "seconds": seconds,
+            "fps": sum(count for count, _, _ in paints.values()) / seconds,
+            "latency_p50_ms": percentile(latency, 0.50),
+            "latency_p95_ms": percentile(latency, 0.95),
+            "latency_max_ms": max(latency, default=0.0),
+            "timers": timers,
+            "windows": rows(paints),
+        }
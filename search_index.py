@@ -0,0 +1,329 @@
+"""
+🔎 Start-menu search index for BrainrotOS
+Apps, recent files, rizz lines, NPC chat history and meme sound names are kept
+in one in-memory index. Each item's case-folded text is split into trigrams,
+and the first one and two letters of each word are indexed for short queries,
+with their matches kept in rank order. A query intersects the posting sets of
+its terms and checks only those candidates, so results come back in well under
+a millisecond while typing.
+
+The index is built on a worker thread once the desktop is up, because
+gathering content means importing app modules. After that it is updated in
+place: apps call SearchIndex.instance().add() / remove() as their content
+changes.
+"""
+
+import os
+import re
+import json
+import time
+import heapq
+import bisect
+import threading
+from collections import namedtuple, Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import paths
+
+# key identifies the item within its kind; app is the manifest key that opens it
+SearchItem = namedtuple("SearchItem", "kind key title detail app")
+
+WORD = re.compile(r"\w+")
+
+class TrigramIndex:
+    """Trigram and word-prefix posting sets over a changing set of items"""
+    # Ties between equally good matches go to apps first, chat last
+    KIND_ORDER = {"app": 0, "file": 1, "sound": 2, "rizz": 3, "chat": 4}
+    # A fuzzy match needs at least this share of the query's trigrams
+    FUZZY_SHARE = 0.6
+    
+    def __init__(self):
+        self.items = {}      # id -> SearchItem
+        self.texts = {}      # id -> folded title and detail
+        self.rank_keys = {}  # id -> (title words joined, title words, kind order, title length)
+        self.ids = {}        # (kind, key) -> id
+        self.grams = {}      # trigram -> set of ids
+        self.prefixes = {}   # one- or two-letter word prefix -> set of ids
+        self.ranked = {}     # same prefix -> sorted rank() keys, so a short query just takes the head
+        self.next_id = 0
+    
+    def __len__(self):
+        return len(self.items)
+    
+    @staticmethod
+    def trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def word_prefixes(text):
+        prefixes = set()
+        for word in WORD.findall(text):
+            prefixes.add(word[:1])
+            prefixes.add(word[:2])
+        return prefixes
+    
+    def add(self, item):
+        if (item.kind, item.key) in self.ids:
+            return False
+        item_id = self.next_id
+        self.next_id += 1
+        text = f"{item.title} {item.detail}".casefold()
+        self.items[item_id] = item
+        self.texts[item_id] = text
+        # Words only, so a leading emoji doesn't hide a title that starts with the query
+        words = tuple(WORD.findall(item.title.casefold()))
+        self.rank_keys[item_id] = (" ".join(words), words, self.KIND_ORDER.get(item.kind, 9), len(item.title))
+        self.ids[item.kind, item.key] = item_id
+        for gram in self.trigrams(text):
+            self.grams.setdefault(gram, set()).add(item_id)
+        for prefix in self.word_prefixes(text):
+            self.prefixes.setdefault(prefix, set()).add(item_id)
+            bisect.insort(self.ranked.setdefault(prefix, []), self.rank(item_id, prefix))
+        return True
+    
+    def remove(self, kind, key):
+        item_id = self.ids.pop((kind, key), None)
+        if item_id is None:
+            return
+        text = self.texts[item_id]
+        for prefix in self.word_prefixes(text):
+            ranked = self.ranked[prefix]
+            del ranked[bisect.bisect_left(ranked, self.rank(item_id, prefix))]
+            if not ranked:
+                del self.ranked[prefix]
+        del self.items[item_id]
+        del self.rank_keys[item_id]
+        del self.texts[item_id]
+        for table, keys in ((self.grams, self.trigrams(text)), (self.prefixes, self.word_prefixes(text))):
+            for gram in keys:
+                posting = table[gram]
+                posting.discard(item_id)
+                if not posting:
+                    del table[gram]
+    
+    def candidates(self, term):
+        if len(term) < 3:
+            return self.prefixes.get(term, set())
+        postings = [self.grams.get(gram) for gram in self.trigrams(term)]
+        if not all(postings):
+            return set()
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+    
+    def rank(self, item_id, query):
+        joined, words, order, length = self.rank_keys[item_id]
+        if joined.startswith(query):
+            quality = 0
+        elif any(word.startswith(query) for word in words):
+            quality = 1
+        else:
+            quality = 2
+        return (quality, order, length, item_id)
+    
+    def search(self, query, limit=10):
+        """Items matching every word of the query, best first"""
+        query = query.casefold().strip()
+        terms = query.split()
+        if not terms:
+            return []
+        if len(terms) == 1 and len(query) < 3:
+            return [self.items[key[-1]] for key in self.ranked.get(query, ())[:limit]] or self.fuzzy(query, limit)
+        matches = None
+        for term in sorted(terms, key=len, reverse=True):
+            found = self.candidates(term)
+            matches = found if matches is None else matches & found
+            if not matches:
+                break
+        if matches:
+            # Trigrams can all occur without the term itself; check the survivors
+            long_terms = [term for term in terms if len(term) >= 3]
+            matches = [item_id for item_id in matches
+                       if all(term in self.texts[item_id] for term in long_terms)]
+        if matches:
+            best = heapq.nsmallest(limit, matches, key=lambda item_id: self.rank(item_id, query))
+            return [self.items[item_id] for item_id in best]
+        return self.fuzzy(query, limit)
+    
+    def fuzzy(self, query, limit):
+        """Items sharing most of the query's trigrams, for typos like 'skibdi'"""
+        grams = self.trigrams(query)
+        if not grams:
+            return []
+        counts = Counter()
+        for gram in grams:
+            counts.update(self.grams.get(gram, ()))
+        needed = max(1, int(len(grams) * self.FUZZY_SHARE))
+        best = heapq.nsmallest(limit, (item_id for item_id, count in counts.items() if count >= needed),
+                               key=lambda item_id: (-counts[item_id],) + self.rank(item_id, query))
+        return [self.items[item_id] for item_id in best]
+
+class SearchIndex(QObject):
+    """Process-wide search index; use SearchIndex.instance()"""
+    ready = pyqtSignal()
+    built = pyqtSignal(object)   # from the build thread: the finished TrigramIndex
+    
+    # Most items kept per kind; the oldest go first
+    LIMITS = {"chat": 1000, "file": 50}
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, recent_file=None):
+        super().__init__()
+        self.recent_file = recent_file or paths.data_path("recent_files.json")
+        self.index = None
+        self.started = False
+        self.pending = []    # updates made while the index was being built
+        self.order = {kind: OrderedDict() for kind in self.LIMITS}
+        self.build_ms = 0.0
+        # The recent files list is read and rewritten here, in order, off the GUI thread
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="brainrot-recent-files")
+        self.recent = None
+        self.built.connect(self.install)
+    
+    @property
+    def is_ready(self):
+        return self.index is not None
+    
+    def start(self, registry=None):
+        """Build the index on a worker thread; content that lives in windows is copied here first"""
+        if self.started:
+            return
+        self.started = True
+        from app_registry import AppRegistry
+        registry = registry or AppRegistry.instance()
+        apps = list(registry.apps)
+        npc = registry.windows.get("npc")
+        if npc is not None:
+            history = list(npc.chat_history)
+        else:
+            history = list((registry.states.get("npc") or {}).get("history", []))
+        threading.Thread(target=self.build, args=(apps, history), name="brainrot-search-index",
+                         daemon=True).start()
+    
+    def build(self, apps, history):
+        started = time.perf_counter()
+        index = TrigramIndex()
+        for item in self.collect(apps, history):
+            index.add(item)
+        self.build_ms = (time.perf_counter() - started) * 1000
+        self.built.emit(index)
+    
+    def collect(self, apps, history):
+        for spec in apps:
+            yield SearchItem("app", spec.key, f"{spec.emoji} {spec.name}", "App", spec.key)
+        for entry in self.load_recent_files():
+            yield self.file_item(entry["path"], entry.get("app"))
+        # Importing these is the slow part
+        try:
+            from apps.rizz_generator import RIZZ_LINES
+            for line in RIZZ_LINES:
+                yield SearchItem("rizz", line, line, "💘 Rizz line", "rizz")
+        except ImportError as e:
+            print(f"🔎 Rizz lines not searchable: {e}")
+        try:
+            from audio_synth import SOUND_RECIPES
+            for name in SOUND_RECIPES:
+                yield SearchItem("sound", name, name, "🔊 Meme sound", "sound")
+        except ImportError as e:
+            print(f"🔎 Meme sounds not searchable: {e}")
+        for timestamp, sender, message in history:
+            yield self.chat_item(timestamp, sender, message)
+    
+    def install(self, index):
+        self.index = index
+        for item in index.items.values():
+            if item.kind in self.order:
+                self.order[item.kind][item.key] = True
+        for operation, args in self.pending:
+            operation(*args)
+        self.pending = []
+        print(f"🔎 Search index ready: {len(index)} items in {self.build_ms:.0f} ms")
+        self.ready.emit()
+    
+    def search(self, query, limit=10):
+        return self.index.search(query, limit) if self.index is not None else []
+    
+    def items(self, kind):
+        if self.index is None:
+            return []
+        return [item for item in self.index.items.values() if item.kind == kind]
+    
+    def add(self, item):
+        if not self.started:
+            return  # e.g. an isolated app's own process, which has no launcher
+        if self.index is None:
+            self.pending.append((self.add, (item,)))
+            return
+        if self.index.add(item) and item.kind in self.order:
+            order = self.order[item.kind]
+            order[item.key] = True
+            while len(order) > self.LIMITS[item.kind]:
+                self.index.remove(item.kind, order.popitem(last=False)[0])
+    
+    def remove(self, kind, key):
+        if not self.started:
+            return
+        if self.index is None:
+            self.pending.append((self.remove, (kind, key)))
+            return
+        self.index.remove(kind, key)
+        if kind in self.order:
+            self.order[kind].pop(key, None)
+    
+    def remove_kind(self, kind):
+        if self.index is None:
+            if self.started:
+                self.pending.append((self.remove_kind, (kind,)))
+            return
+        for item_kind, key in [entry for entry in self.index.ids if entry[0] == kind]:
+            self.remove(item_kind, key)
+    
+    def add_chat_message(self, timestamp, sender, message):
+        self.add(self.chat_item(timestamp, sender, message))
+    
+    def chat_item(self, timestamp, sender, message):
+        return SearchItem("chat", (timestamp, sender, message), message, f"💬 {sender} · {timestamp}", "npc")
+    
+    def file_item(self, path, app=None):
+        return SearchItem("file", path, os.path.basename(path) or path, f"📄 {os.path.dirname(path)}", app)
+    
+    def load_recent_files(self):
+        try:
+            with open(self.recent_file, encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            print(f"🔎 Ignoring unreadable recent files list: {e}")
+            return []
+        return [entry for entry in entries if isinstance(entry, dict) and "path" in entry]
+    
+    def add_recent_file(self, path, app=None):
+        """Remember an opened file: searchable now, and listed again next boot"""
+        path = os.path.abspath(path)
+        # Re-adding moves it to the newest end
+        self.remove("file", path)
+        self.add(self.file_item(path, app))
+        self.writer.submit(self.save_recent_file, path, app)
+    
+    def save_recent_file(self, path, app):
+        """Writer thread: put path first in the list on disk"""
+        if self.recent is None:
+            self.recent = self.load_recent_files()
+        entries = [entry for entry in self.recent if entry["path"] != path]
+        entries.insert(0, {"path": path, "app": app})
+        del entries[self.LIMITS["file"]:]
+        self.recent = entries
+        temp_file = self.recent_file + ".tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_file, self.recent_file)
+        except OSError as e:
+            print(f"🔎 Could not save recent files: {e}")
@@ -0,0 +1,185 @@
+"""
+💾 Session snapshot for BrainrotOS
+Remembers which app windows were open, where they were and each app's
+save_state(), in one small JSON file under the data dir. Changes (windows
+shown, hidden, moved or resized, and app state seen by a periodic check) are
+debounced; the file is only rewritten, atomically, when the snapshot differs.
+
+On boot only the windows that were open are recreated, one per event-loop
+slice after the desktop is up. Every other app's state is handed to the
+registry and restored when that app is first launched.
+"""
+
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QEvent, QTimer
+
+import paths
+from app_registry import AppRegistry
+from frame_clock import FrameClock
+
+class SessionManager(QObject):
+    """Process-wide session tracker; use SessionManager.instance()"""
+    VERSION = 1
+    SAVE_DELAY_MS = 1000
+    CHECK_MS = 5000
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, registry=None, session_file=None):
+        super().__init__()
+        self.registry = registry or AppRegistry.instance()
+        self.session_file = session_file or paths.data_path("session.json")
+        self.entries = {}     # key -> entry as last written
+        self.geometries = {}  # key -> [x, y, width, height]
+        self.keys = {}        # id(window) -> key
+        self.enabled = os.environ.get("BRAINROT_SESSION", "1") != "0"
+        # Snapshots are taken on the GUI thread; writing and fsyncing them happens here, in order
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="brainrot-session")
+        self.pending = None
+        
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.save)
+        # App state changes have no signal, so look for them now and then
+        self.check_timer = FrameClock.instance().subscribe(self.save, self.CHECK_MS, start=False)
+    
+    def install(self, app):
+        """Track windows from now on and write a final snapshot at quit"""
+        if not self.enabled:
+            return
+        self.registry.launched.connect(self.track)
+        self.registry.evicted.connect(self.schedule_save)
+        for key in self.registry.windows:
+            self.track(key)
+        app.aboutToQuit.connect(self.save_now)
+        self.check_timer.start()
+    
+    def load(self):
+        try:
+            with open(self.session_file, encoding="utf-8") as f:
+                session = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"💾 Ignoring unreadable session {self.session_file}: {e}")
+            return {}
+        if not isinstance(session, dict) or session.get("version") != self.VERSION:
+            return {}
+        return {key: entry for key, entry in session.get("apps", {}).items() if key in self.registry.specs}
+    
+    def restore(self):
+        """Reopen what was open last time; everything else waits for first launch"""
+        if not self.enabled:
+            return
+        self.entries = self.load()
+        reopen = []
+        for key, entry in self.entries.items():
+            if entry.get("state") is not None:
+                self.registry.states[key] = entry["state"]
+            if entry.get("geometry"):
+                self.geometries[key] = entry["geometry"]
+            if entry.get("open"):
+                reopen.append(key)
+        
+        def reopen_next(index=0):
+            if index < len(reopen):
+                key = reopen[index]
+                try:
+                    self.registry.launch(key)
+                except Exception as e:
+                    # Forget it, so the next save doesn't bring the same failure back
+                    print(f"💾 Could not reopen {key} from the last session: {e!r}")
+                    self.registry.states.pop(key, None)
+                    self.geometries.pop(key, None)
+                    self.schedule_save()
+                QTimer.singleShot(0, lambda: reopen_next(index + 1))
+        
+        if reopen:
+            print(f"💾 Restoring {len(reopen)} app window(s) from the last session")
+            QTimer.singleShot(0, reopen_next)
+    
+    def track(self, key):
+        window = self.registry.windows.get(key)
+        if window is None:
+            return
+        geometry = self.geometries.get(key)
+        if geometry is not None:
+            x, y, width, height = geometry
+            window.move(x, y)
+            window.resize(width, height)
+        self.keys[id(window)] = key
+        window.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Show, QEvent.Hide, QEvent.Move, QEvent.Resize):
+            key = self.keys.get(id(obj))
+            if key is not None and self.registry.windows.get(key) is obj:
+                if event.type() != QEvent.Hide:
+                    # Frame position, so move() puts the window back in the same place
+                    pos, size = obj.pos(), obj.size()
+                    self.geometries[key] = [pos.x(), pos.y(), size.width(), size.height()]
+                self.schedule_save()
+        return False
+    
+    def schedule_save(self, *args):
+        # Not restarted on every event, so a long drag still saves once a second
+        if not self.save_timer.isActive():
+            self.save_timer.start(self.SAVE_DELAY_MS)
+    
+    def snapshot(self):
+        entries = {}
+        for key in self.registry.specs:
+            window = self.registry.windows.get(key)
+            host = self.registry.hosts.get(key)
+            if window is not None:
+                entry = {"open": window.isVisible(),
+                         "state": window.save_state() if hasattr(window, "save_state") else None}
+            elif host is not None:
+                if host.running:
+                    host.query_state()  # picked up by the next check
+                entry = {"open": host.running, "state": host.state}
+            elif key in self.registry.states:
+                entry = {"open": False, "state": self.registry.states[key]}
+            else:
+                continue
+            if key in self.geometries:
+                entry["geometry"] = self.geometries[key]
+            entries[key] = entry
+        return entries
+    
+    def save(self):
+        self.save_timer.stop()
+        entries = self.snapshot()
+        if entries == self.entries:
+            return
+        self.entries = entries
+        self.pending = self.writer.submit(self.write, entries)
+    
+    def save_now(self):
+        """Save and wait until it's on disk (at quit)"""
+        self.save()
+        if self.pending is not None:
+            self.pending.result()
+    
+    def write(self, entries):
+        """Writer thread: replace the session file atomically"""
+        data = json.dumps({"version": self.VERSION, "apps": entries}, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+        temp_file = self.session_file + ".tmp"
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.session_file)
+        except OSError as e:
+            print(f"💾 Could not write session: {e}")
+            # Not on disk after all, so the next check writes again
+            self.entries = None
@@ -0,0 +1,136 @@
+"""
+🔊 Prebuilt meme sound files for BrainrotOS
+generate_sounds.py renders every recipe in audio_synth.SOUND_RECIPES to a
+16-bit WAV in assets/sounds. Each file name carries a hash of the recipe, the
+output format and SYNTH_VERSION, so a rebuild only renders sounds whose
+definition changed and stale files are easy to spot.
+
+The sound player maps these files instead of synthesizing. A sound with no
+built file is rendered once and kept in the cache dir for the next launch.
+"""
+
+import os
+import re
+import json
+import mmap
+import wave
+import struct
+import hashlib
+from contextlib import contextmanager
+
+import paths
+from audio_synth import SAMPLE_RATE, SOUND_RECIPES, SYNTH_VERSION, render
+
+SOUNDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sounds")
+# Only files named like this are ours to replace; other WAVs in the dir are left alone
+BUILT_NAME = re.compile(r"^([a-z0-9_]+)-[0-9a-f]{16}\.wav$")
+
+def recipe_key(recipe, sample_rate=SAMPLE_RATE, channels=2):
+    """Hash of everything that decides a sound's samples"""
+    generator, args, kwargs = recipe
+    blob = json.dumps([SYNTH_VERSION, generator, list(args), kwargs, sample_rate, channels], sort_keys=True)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+def slug(name):
+    """'🔊 MLG Airhorn' -> 'mlg_airhorn'"""
+    return re.sub(r"[^a-z0-9]+", "_", name.casefold()).strip("_") or "sound"
+
+def file_name(name, sample_rate=SAMPLE_RATE, channels=2):
+    return f"{slug(name)}-{recipe_key(SOUND_RECIPES[name], sample_rate, channels)}.wav"
+
+def search_dirs():
+    return (SOUNDS_DIR, paths.cache_path("sounds"))
+
+def find(name, sample_rate=SAMPLE_RATE, channels=2):
+    """Path of the built WAV for name in this format, or None"""
+    wanted = file_name(name, sample_rate, channels)
+    for directory in search_dirs():
+        path = os.path.join(directory, wanted)
+        if os.path.exists(path):
+            return path
+    return None
+
+def write_wav(path, pcm, sample_rate=SAMPLE_RATE):
+    """Write int16 frames ((n,) or (n, channels)) to path atomically"""
+    temp_file = path + ".tmp"
+    with wave.open(temp_file, "wb") as f:
+        f.setnchannels(1 if pcm.ndim == 1 else pcm.shape[1])
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.astype("<i2", copy=False).tobytes())
+    os.replace(temp_file, path)
+
+def remove_stale(directory, keep, sound=None):
+    """Delete built sounds in directory (only those of slug sound, if given) that aren't in keep"""
+    removed = []
+    for entry in os.listdir(directory):
+        match = BUILT_NAME.match(entry)
+        if match and entry not in keep and sound in (None, match.group(1)):
+            os.remove(os.path.join(directory, entry))
+            removed.append(entry)
+    return removed
+
+def save(name, pcm, sample_rate=SAMPLE_RATE, channels=2):
+    """Keep a sound the player had to synthesize; returns its path, or None if it can't be written"""
+    directory = paths.cache_path("sounds")
+    wanted = file_name(name, sample_rate, channels)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        write_wav(os.path.join(directory, wanted), pcm, sample_rate)
+        remove_stale(directory, {wanted}, slug(name))
+    except OSError as e:
+        print(f"🔊 Could not keep {name}: {e}")
+        return None
+    return os.path.join(directory, wanted)
+
+def build(directory=SOUNDS_DIR, sample_rate=SAMPLE_RATE, channels=2, force=False):
+    """Render every recipe whose file is missing; returns (built, unchanged, removed) names"""
+    os.makedirs(directory, exist_ok=True)
+    built, unchanged = [], []
+    wanted = set()
+    for name, recipe in SOUND_RECIPES.items():
+        target = file_name(name, sample_rate, channels)
+        wanted.add(target)
+        if not force and os.path.exists(os.path.join(directory, target)):
+            unchanged.append(name)
+            continue
+        write_wav(os.path.join(directory, target), render(recipe, sample_rate, channels), sample_rate)
+        built.append(name)
+    return built, unchanged, remove_stale(directory, wanted)
+
+@contextmanager
+def open_wav(path):
+    """Map a PCM WAV file; yields (sample_rate, channels, sample_width, samples memoryview).
+    
+    The view is only valid inside the with block.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        if view[:4] != b"RIFF" or view[8:12] != b"WAVE":
+            raise ValueError(f"{path} is not a WAV file")
+        fmt = None
+        offset = 12
+        while offset + 8 <= len(view):
+            chunk, size = struct.unpack_from("<4sI", view, offset)
+            start = offset + 8
+            if chunk == b"fmt ":
+                encoding, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", view, start)
+                if encoding != 1:
+                    raise ValueError(f"{path} is not PCM")
+                fmt = (sample_rate, channels, bits // 8)
+            elif chunk == b"data":
+                if fmt is None:
+                    raise ValueError(f"{path} has no format chunk")
+                samples = view[start:start + size]
+                try:
+                    yield fmt + (samples,)
+                finally:
+                    samples.release()
+                return
+            offset = start + size + (size & 1)
+        raise ValueError(f"{path} has no data chunk")
+    finally:
+        view.release()
+        mapped.close()
@@ -1,10 +1,13 @@
 import sys
 from PyQt5.QtWidgets import QApplication, QSplashScreen, QLabel, QVBoxLayout, QWidget, QGraphicsDropShadowEffect
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QPixmap, QFont, QMovie, QPainter, QLinearGradient, QRadialGradient, QColor, QBrush
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect, QPointF
+from PyQt5.QtGui import (QPixmap, QFont, QMovie, QPainter, QLinearGradient, QRadialGradient, QColor, QBrush,
+                         QRegion, QStaticText, QTextOption, QTransform)
 import random
 import math
 
+from frame_clock import FrameClock
+
 class BrainrotSplashScreen(QSplashScreen):
     finished = pyqtSignal()
     
@@ -17,6 +20,9 @@ class BrainrotSplashScreen(QSplashScreen):
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
         self.setFixedSize(900, 700)
         
+        # paintEvent covers every pixel of the dirty region itself
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        
         # Animation properties
         self.animation_phase = 0
         self.orb_positions = []
@@ -53,26 +59,112 @@ class BrainrotSplashScreen(QSplashScreen):
         self.current_text = self.meme_texts[0]
         self.text_index = 0
         
-        # Animation timer
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_animation)
-        self.animation_timer.start(50)  # 20 FPS
-        
-        # Text update timer
-        self.text_timer = QTimer()
-        self.text_timer.timeout.connect(self.update_text)
-        self.text_timer.start(800)
+        # Real boot progress (0-100), reported by whoever is building the desktop
+        self.progress = 0
+        
+        # Text regions, fixed for the lifetime of the splash
+        self.title_rect = QRect(0, 0, self.width(), 200)
+        self.subtitle_rect = QRect(0, 200, self.width(), 100)
+        self.loading_rect = QRect(0, self.height() - 200, self.width(), 50)
+        self.meme_rect = QRect(0, self.height() - 150, self.width(), 100)
+        self.progress_rect = QRect(100, self.height() - 50, self.width() - 200, 20)
+        
+        # Fonts and static text are built once instead of on every frame
+        self.title_font = QFont('Segoe UI', 56, QFont.Bold)
+        self.subtitle_font = QFont('Segoe UI', 24, QFont.Normal)
+        self.loading_font = QFont('Segoe UI', 18, QFont.Normal)
+        self.meme_font = QFont('Segoe UI', 14, QFont.Normal)
+        
+        self.loading_texts = [self.create_static_text(f"Loading{'.' * dots}", self.loading_font)
+                              for dots in range(4)]
+        self.meme_static_texts = {}
+        
+        # Cached layers, rendered lazily on the first paint
+        self.background_layer = None
+        self.title_layer = None
+        self.subtitle_layer = None
+        
+        # Animation and text updates share the desktop's frame clock
+        clock = FrameClock.instance()
+        self.animation_timer = clock.subscribe(self.update_animation, 50, self, animation=True)  # 20 FPS
+        self.text_timer = clock.subscribe(self.update_text, 800, self, animation=True)
+        
+    def create_static_text(self, text, font, wrap_width=None):
+        """Lay out a piece of text once so repaints only have to blit glyphs"""
+        static_text = QStaticText(text)
+        option = QTextOption(Qt.AlignHCenter)
+        if wrap_width:
+            option.setWrapMode(QTextOption.WordWrap)
+            static_text.setTextWidth(wrap_width)
+        static_text.setTextOption(option)
+        static_text.prepare(QTransform(), font)
+        return static_text
+    
+    def meme_static_text(self, text):
+        if text not in self.meme_static_texts:
+            self.meme_static_texts[text] = self.create_static_text(text, self.meme_font, self.width())
+        return self.meme_static_texts[text]
+    
+    def create_layer(self):
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(Qt.transparent)
+        return layer
+    
+    def build_layers(self):
+        """Render the parts of the splash that never change into pixmaps"""
+        # Vista-style gradient background
+        self.background_layer = self.create_layer()
+        painter = QPainter(self.background_layer)
+        gradient = QLinearGradient(0, 0, 0, self.height())
+        gradient.setColorAt(0, QColor(135, 206, 250, 255))  # Sky blue
+        gradient.setColorAt(0.3, QColor(70, 130, 180, 255))  # Steel blue
+        gradient.setColorAt(0.7, QColor(25, 25, 112, 255))   # Midnight blue
+        gradient.setColorAt(1, QColor(0, 0, 139, 255))       # Dark blue
+        painter.fillRect(self.rect(), QBrush(gradient))
+        painter.end()
         
-        # Close timer
-        self.close_timer = QTimer()
-        self.close_timer.timeout.connect(self.close_splash)
-        self.close_timer.start(5000)  # 5 seconds for dramatic effect
+        # Main title at full opacity; the glow is applied as painter opacity
+        self.title_layer = self.create_layer()
+        painter = QPainter(self.title_layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(self.title_font)
+        painter.drawText(self.title_rect, Qt.AlignCenter, "🧠 BrainrotOS Vista")
+        painter.end()
+        
+        # Subtitle with glass effect
+        self.subtitle_layer = self.create_layer()
+        painter = QPainter(self.subtitle_layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QColor(200, 255, 255, 180))
+        painter.setFont(self.subtitle_font)
+        painter.drawText(self.subtitle_rect, Qt.AlignCenter, "The Most Cursed OS Experience")
+        painter.end()
+    
+    def draw_layer(self, painter, layer, rect):
+        """Blit only the part of a cached layer that lies inside rect"""
+        ratio = layer.devicePixelRatio()
+        source = QRect(int(rect.x() * ratio), int(rect.y() * ratio),
+                       int(rect.width() * ratio), int(rect.height() * ratio))
+        painter.drawPixmap(rect, layer, source)
+    
+    def orb_rect(self, orb):
+        size = orb['size']
+        return QRect(int(orb['x'] - size / 2) - 1, int(orb['y'] - size / 2) - 1, size + 2, size + 2)
+    
+    def title_alpha(self):
+        return min(255, 200 + int(self.text_glow_intensity))
         
     def update_animation(self):
         self.animation_phase += 1
+        dirty = QRegion()
         
         # Update orb positions
         for orb in self.orb_positions:
+            dirty += self.orb_rect(orb)
+            
             orb['x'] += orb['dx']
             orb['y'] += orb['dy']
             orb['color_phase'] = (orb['color_phase'] + 2) % 360
@@ -87,14 +179,30 @@ class BrainrotSplashScreen(QSplashScreen):
             orb['x'] = max(0, min(900, orb['x']))
             orb['y'] = max(0, min(700, orb['y']))
         
+            dirty += self.orb_rect(orb)
+        
         # Update text glow
+        previous_title_alpha = self.title_alpha()
         self.text_glow_intensity += self.text_glow_direction * 3
         if self.text_glow_intensity >= 100:
             self.text_glow_direction = -1
         elif self.text_glow_intensity <= 20:
             self.text_glow_direction = 1
             
-        self.update()
+        if self.title_alpha() != previous_title_alpha:
+            dirty += self.title_rect
+        
+        # The loading text pulses every frame, but only its own strip needs repainting
+        dirty += self.loading_text_rect()
+        
+        self.update(dirty)
+    
+    def loading_text_rect(self):
+        # The widest variant ("Loading...") bounds all of them
+        size = self.loading_texts[-1].size()
+        rect = QRect(0, 0, int(size.width()) + 4, int(size.height()) + 4)
+        rect.moveCenter(self.loading_rect.center())
+        return rect
         
     def update_text(self):
         if not self.isVisible():
@@ -103,6 +211,20 @@ class BrainrotSplashScreen(QSplashScreen):
         # Cycle through meme texts
         self.text_index = (self.text_index + 1) % len(self.meme_texts)
         self.current_text = self.meme_texts[self.text_index]
+        self.update(self.meme_rect)
+        
+    def set_progress(self, progress, message=None):
+        """Report real boot progress (0-100) and optionally the current stage"""
+        progress = max(0, min(100, int(progress)))
+        if progress != self.progress:
+            self.progress = progress
+            self.update(self.progress_rect)
+        if message and message != self.current_text:
+            # Real stage names from now on, not the meme rotation
+            if self.text_timer:
+                self.text_timer.stop()
+            self.current_text = message
+            self.update(self.meme_rect)
         
     def close_splash(self):
         # Stop timers safely
@@ -110,27 +232,33 @@ class BrainrotSplashScreen(QSplashScreen):
             self.animation_timer.stop()
         if hasattr(self, 'text_timer') and self.text_timer:
             self.text_timer.stop()
-        if hasattr(self, 'close_timer') and self.close_timer:
-            self.close_timer.stop()
         
         self.finished.emit()
         self.close()
         
+    def draw_static_text(self, painter, static_text, rect):
+        """Draw prepared text centred inside rect"""
+        size = static_text.size()
+        x = rect.x() + (rect.width() - size.width()) / 2
+        y = rect.y() + (rect.height() - size.height()) / 2
+        painter.drawStaticText(QPointF(x, y), static_text)
+    
     def paintEvent(self, event):
+        if self.background_layer is None:
+            self.build_layers()
+        
+        dirty = event.rect()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Vista-style gradient background
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(135, 206, 250, 255))  # Sky blue
-        gradient.setColorAt(0.3, QColor(70, 130, 180, 255))  # Steel blue
-        gradient.setColorAt(0.7, QColor(25, 25, 112, 255))   # Midnight blue
-        gradient.setColorAt(1, QColor(0, 0, 139, 255))       # Dark blue
-        
-        painter.fillRect(self.rect(), QBrush(gradient))
+        self.draw_layer(painter, self.background_layer, dirty)
         
         # Draw animated orbs
         for orb in self.orb_positions:
+            if not self.orb_rect(orb).intersects(dirty):
+                continue
+            
             # Create radial gradient for each orb
             orb_gradient = QRadialGradient(orb['x'], orb['y'], orb['size'])
             
@@ -151,69 +279,48 @@ class BrainrotSplashScreen(QSplashScreen):
                               orb['size'], orb['size'])
         
         # Draw main title with glow effect
-        title_color = QColor(255, 255, 255, 200 + int(self.text_glow_intensity))
-        painter.setPen(title_color)
-        painter.setFont(QFont('Segoe UI', 56, QFont.Bold))
-        
-        title_rect = self.rect()
-        title_rect.setHeight(200)
-        painter.drawText(title_rect, Qt.AlignCenter, "🧠 BrainrotOS Vista")
+        if dirty.intersects(self.title_rect):
+            painter.setOpacity(self.title_alpha() / 255)
+            self.draw_layer(painter, self.title_layer, dirty.intersected(self.title_rect))
+            painter.setOpacity(1.0)
         
         # Draw subtitle with glass effect
-        subtitle_color = QColor(200, 255, 255, 180)
-        painter.setPen(subtitle_color)
-        painter.setFont(QFont('Segoe UI', 24, QFont.Normal))
-        
-        subtitle_rect = self.rect()
-        subtitle_rect.setTop(200)
-        subtitle_rect.setHeight(100)
-        painter.drawText(subtitle_rect, Qt.AlignCenter, "The Most Cursed OS Experience")
+        if dirty.intersects(self.subtitle_rect):
+            self.draw_layer(painter, self.subtitle_layer, dirty.intersected(self.subtitle_rect))
         
         # Draw loading text with animated dots
-        loading_color = QColor(255, 255, 0, 150 + int(self.text_glow_intensity // 2))
-        painter.setPen(loading_color)
-        painter.setFont(QFont('Segoe UI', 18, QFont.Normal))
+        if dirty.intersects(self.loading_rect):
+            loading_color = QColor(255, 255, 0, 150 + int(self.text_glow_intensity // 2))
+            painter.setPen(loading_color)
+            painter.setFont(self.loading_font)
         
-        dots = "." * ((self.animation_phase // 10) % 4)
-        loading_text = f"Loading{dots}"
-        
-        loading_rect = self.rect()
-        loading_rect.setTop(self.height() - 200)
-        loading_rect.setHeight(50)
-        painter.drawText(loading_rect, Qt.AlignCenter, loading_text)
+            dots = (self.animation_phase // 10) % 4
+            self.draw_static_text(painter, self.loading_texts[dots], self.loading_rect)
         
         # Draw current meme text
-        meme_color = QColor(255, 200, 255, 200)
-        painter.setPen(meme_color)
-        painter.setFont(QFont('Segoe UI', 14, QFont.Normal))
-        
-        meme_rect = self.rect()
-        meme_rect.setTop(self.height() - 150)
-        meme_rect.setHeight(100)
-        painter.drawText(meme_rect, Qt.AlignCenter | Qt.TextWordWrap, self.current_text)
+        if dirty.intersects(self.meme_rect):
+            painter.setPen(QColor(255, 200, 255, 200))
+            painter.setFont(self.meme_font)
+            self.draw_static_text(painter, self.meme_static_text(self.current_text), self.meme_rect)
         
         # Draw progress bar effect
-        progress = min(100, (self.animation_phase // 10) % 120)
-        progress_rect = self.rect()
-        progress_rect.setTop(self.height() - 50)
-        progress_rect.setHeight(20)
-        progress_rect.setLeft(100)
-        progress_rect.setRight(self.width() - 100)
-        
-        # Progress bar background
-        painter.setBrush(QBrush(QColor(255, 255, 255, 50)))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(progress_rect, 10, 10)
-        
-        # Progress bar fill
-        fill_width = int((progress_rect.width() * progress) / 100)
-        fill_rect = progress_rect
-        fill_rect.setWidth(fill_width)
-        
-        progress_gradient = QLinearGradient(fill_rect.left(), 0, fill_rect.right(), 0)
-        progress_gradient.setColorAt(0, QColor(0, 255, 255, 200))
-        progress_gradient.setColorAt(0.5, QColor(0, 200, 255, 255))
-        progress_gradient.setColorAt(1, QColor(0, 150, 255, 200))
-        
-        painter.setBrush(QBrush(progress_gradient))
-        painter.drawRoundedRect(fill_rect, 10, 10)
+        if dirty.intersects(self.progress_rect):
+            progress_rect = QRect(self.progress_rect)
+        
+            # Progress bar background
+            painter.setBrush(QBrush(QColor(255, 255, 255, 50)))
+            painter.setPen(Qt.NoPen)
+            painter.drawRoundedRect(progress_rect, 10, 10)
+        
+            # Progress bar fill
+            fill_width = int((progress_rect.width() * self.progress) / 100)
+            fill_rect = progress_rect
+            fill_rect.setWidth(fill_width)
+        
+            progress_gradient = QLinearGradient(fill_rect.left(), 0, fill_rect.right(), 0)
+            progress_gradient.setColorAt(0, QColor(0, 255, 255, 200))
+            progress_gradient.setColorAt(0.5, QColor(0, 200, 255, 255))
+            progress_gradient.setColorAt(1, QColor(0, 150, 255, 200))
+        
+            painter.setBrush(QBrush(progress_gradient))
+            painter.drawRoundedRect(fill_rect, 10, 10)
@@ -0,0 +1,110 @@
+"""
+🐢 Event-loop stall watchdog for BrainrotOS
+A QTimer heartbeat on the main thread and a watchdog thread that checks it.
+When the heartbeat is late by more than the threshold, the main thread's Python
+stack is captured and written, with the stall duration, to a rotating log.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+import traceback
+from logging.handlers import RotatingFileHandler
+from PyQt5.QtCore import QObject, QTimer
+
+import paths
+
+class StallWatchdog(QObject):
+    """Start once from the main thread; threshold_ms=0 disables it"""
+    DEFAULT_THRESHOLD_MS = 500
+    
+    def __init__(self, threshold_ms=None, log_file=None):
+        super().__init__()
+        if threshold_ms is None:
+            threshold_ms = self.threshold_from_env()
+        self.threshold = threshold_ms / 1000
+        # Resolved on the first stall, so a quiet session never creates the logs dir
+        self.log_file = log_file
+        self.main_ident = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.logger = None
+        
+        # Twice per threshold: a stall is still caught within 1.5x the threshold
+        self.heartbeat = QTimer(self)
+        self.heartbeat.timeout.connect(self.beat)
+    
+    def threshold_from_env(self):
+        value = os.environ.get("BRAINROT_STALL_MS", str(self.DEFAULT_THRESHOLD_MS))
+        try:
+            return int(value)
+        except ValueError:
+            print(f"🐢 Ignoring BRAINROT_STALL_MS={value!r}, using {self.DEFAULT_THRESHOLD_MS} ms")
+            return self.DEFAULT_THRESHOLD_MS
+    
+    @property
+    def enabled(self):
+        return self.threshold > 0
+    
+    def start(self):
+        if not self.enabled or self.thread is not None:
+            return
+        self.last_beat = time.monotonic()
+        self.heartbeat.start(max(20, int(self.threshold * 1000 / 2)))
+        self.thread = threading.Thread(target=self.watch, name="brainrot-stall-watchdog", daemon=True)
+        self.thread.start()
+        print(f"🐢 Stall watchdog armed ({int(self.threshold * 1000)} ms)")
+    
+    def stop(self):
+        self.heartbeat.stop()
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+            self.thread = None
+    
+    def create_logger(self):
+        if self.log_file is None:
+            self.log_file = paths.log_path("stalls.log")
+        logger = logging.getLogger("brainrotos.stalls")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        if not logger.handlers:
+            handler = RotatingFileHandler(self.log_file, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+            logger.addHandler(handler)
+        return logger
+    
+    def beat(self):
+        self.last_beat = time.monotonic()
+    
+    def watch(self):
+        """Watchdog thread: poll the heartbeat, report stalls and recoveries"""
+        poll = max(0.01, self.threshold / 2)
+        stalled_since = None
+        
+        while not self.stopping.wait(poll):
+            last_beat = self.last_beat
+            lag = time.monotonic() - last_beat
+            
+            if stalled_since is None and lag > self.threshold:
+                stalled_since = last_beat
+                self.report_stall(lag)
+            elif stalled_since is not None and last_beat > stalled_since:
+                # The heartbeat ran again; last_beat is when the loop came back
+                self.report_recovery(last_beat - stalled_since)
+                stalled_since = None
+    
+    def report_stall(self, lag):
+        if self.logger is None:
+            self.logger = self.create_logger()
+        frame = sys._current_frames().get(self.main_ident)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "  (main thread stack unavailable)\n"
+        self.logger.warning("Event loop stalled for %.0f ms (threshold %.0f ms); main thread stack:\n%s",
+                            lag * 1000, self.threshold * 1000, stack.rstrip())
+    
+    def report_recovery(self, duration):
+        self.logger.warning("Event loop recovered after a %.0f ms stall", duration * 1000)
+        print(f"🐢 UI was frozen for {duration * 1000:.0f} ms, stack written to {self.log_file}")
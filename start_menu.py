@@ -0,0 +1,143 @@
+"""
+🧠 Start menu launcher for BrainrotOS
+Popup over the start button: type to search apps, recent files, rizz lines,
+NPC chat and meme sounds, Up/Down to pick, Enter to open, Esc to close.
+Results come from search_index; with an empty query it lists the apps.
+"""
+
+import time
+from PyQt5.QtWidgets import (QFrame, QVBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem,
+                             QApplication)
+from PyQt5.QtCore import Qt, QEvent, QPoint, pyqtSignal
+
+from search_index import SearchIndex
+
+class StartMenu(QFrame):
+    """Keyboard-first launcher; emits activated(SearchItem)"""
+    activated = pyqtSignal(object)
+    
+    LIMIT = 12
+    
+    def __init__(self, index=None):
+        super().__init__(None, Qt.Popup | Qt.FramelessWindowHint)
+        # A click on the start button closes the menu instead of reopening it
+        self.setAttribute(Qt.WA_NoMouseReplay)
+        self.index = index or SearchIndex.instance()
+        self.index.ready.connect(self.refresh)
+        self.resize(420, 460)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        self.setStyleSheet("""
+            QFrame {
+                background: rgba(20, 20, 50, 240);
+                border: 2px solid rgba(0, 255, 255, 150);
+                border-radius: 12px;
+            }
+            QLineEdit {
+                background: rgba(255, 255, 255, 30);
+                color: white;
+                border: 1px solid rgba(255, 255, 255, 80);
+                border-radius: 8px;
+                padding: 8px;
+                font-size: 14px;
+                font-family: 'Segoe UI';
+            }
+            QListWidget {
+                background: transparent;
+                color: white;
+                border: none;
+                font-size: 12px;
+                font-family: 'Segoe UI';
+            }
+            QListWidget::item {
+                padding: 4px;
+                border-radius: 6px;
+            }
+            QListWidget::item:selected {
+                background: rgba(0, 255, 255, 90);
+            }
+        """)
+        
+        layout = QVBoxLayout()
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(6)
+        
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔎 Search apps, files, rizz, chats, sounds...")
+        self.search_input.textChanged.connect(self.refresh)
+        self.search_input.installEventFilter(self)
+        
+        self.results = QListWidget()
+        self.results.setFocusPolicy(Qt.NoFocus)
+        self.results.itemClicked.connect(self.activate_item)
+        
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: #aaaaaa; font-size: 10px; border: none; background: transparent;")
+        
+        layout.addWidget(self.search_input)
+        layout.addWidget(self.results)
+        layout.addWidget(self.status_label)
+        self.setLayout(layout)
+    
+    def popup(self, anchor):
+        """Open just above anchor (the start button), with an empty query"""
+        self.index.start()
+        self.search_input.clear()
+        self.refresh()
+        corner = anchor.mapToGlobal(QPoint(0, 0))
+        screen = QApplication.desktop().availableGeometry(anchor)
+        x = max(screen.left(), min(corner.x(), screen.right() - self.width()))
+        y = max(screen.top(), corner.y() - self.height() - 6)
+        self.move(x, y)
+        self.show()
+        self.search_input.setFocus()
+    
+    def refresh(self):
+        query = self.search_input.text()
+        if not self.index.is_ready:
+            self.results.clear()
+            self.status_label.setText("⏳ Building the search index...")
+            return
+        started = time.perf_counter()
+        if query.strip():
+            items = self.index.search(query, self.LIMIT)
+        else:
+            items = self.index.items("app")
+        elapsed = (time.perf_counter() - started) * 1000
+        
+        self.results.setUpdatesEnabled(False)
+        self.results.clear()
+        for item in items:
+            row = QListWidgetItem(f"{item.title}\n    {item.detail}")
+            row.setData(Qt.UserRole, item)
+            self.results.addItem(row)
+        if items:
+            self.results.setCurrentRow(0)
+        self.results.setUpdatesEnabled(True)
+        if query.strip():
+            self.status_label.setText(f"{len(items)} result(s) in {elapsed:.2f} ms · {len(self.index.index)} items indexed")
+        else:
+            self.status_label.setText("Type to search · ↑↓ to pick · Enter to open · Esc to close")
+    
+    def eventFilter(self, obj, event):
+        if obj is self.search_input and event.type() == QEvent.KeyPress:
+            key = event.key()
+            if key in (Qt.Key_Down, Qt.Key_Up):
+                step = 1 if key == Qt.Key_Down else -1
+                count = self.results.count()
+                if count:
+                    self.results.setCurrentRow((self.results.currentRow() + step) % count)
+                return True
+            if key in (Qt.Key_Return, Qt.Key_Enter):
+                if self.results.currentItem() is not None:
+                    self.activate_item(self.results.currentItem())
+                return True
+            if key == Qt.Key_Escape:
+                self.hide()
+                return True
+        return False
+    
+    def activate_item(self, row):
+        self.hide()
+        self.activated.emit(row.data(Qt.UserRole))
@@ -0,0 +1,157 @@
+"""
+⏱️ Startup phase profiler for BrainrotOS
+Timestamps every boot phase so cold-start regressions can be tracked across releases.
+Only uses the standard library so it can be imported before PyQt5 and time that import too.
+"""
+
+import json
+import os
+import platform
+import time
+import datetime
+from contextlib import contextmanager
+
+class StartupProfiler:
+    """Collects boot phases and one-off marks relative to process start"""
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.marks = []
+        self.report_path = None
+        self.report_written = False
+        self.watchers = []
+    
+    @property
+    def enabled(self):
+        return self.report_path is not None
+    
+    def enable(self, report_path="startup_profile.json"):
+        """Write a report once the desktop has painted for the first time"""
+        self.report_path = report_path
+    
+    def elapsed_ms(self, timestamp=None):
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        return (timestamp - self.origin) * 1000
+    
+    @contextmanager
+    def phase(self, name):
+        """Time a block of boot work; phases are recorded even when no report is requested"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, time.perf_counter()))
+    
+    def mark(self, name):
+        """Record a single point in time, e.g. the first paint of a window"""
+        self.marks.append((name, time.perf_counter()))
+    
+    def watch_first_paint(self, widget, name, callback=None):
+        """Mark the moment widget finishes its first paint, then call callback"""
+        from PyQt5 import sip
+        from PyQt5.QtWidgets import QWidget
+        from PyQt5.QtCore import QObject, QEvent, QTimer
+        
+        profiler = self
+        # An opaque child (e.g. a full-window background) can cover the widget
+        # so completely that only the child is ever painted
+        watched = [widget] + widget.findChildren(QWidget)
+        
+        class FirstPaintWatcher(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    for target in watched:
+                        if not sip.isdeleted(target):
+                            target.removeEventFilter(self)
+                    # Paint events are delivered before the frame is flushed;
+                    # the next loop iteration is when the user can see it.
+                    QTimer.singleShot(0, self.painted)
+                return False
+            
+            def painted(self):
+                profiler.mark(name)
+                profiler.watchers.remove(self)
+                if callback:
+                    callback()
+        
+        watcher = FirstPaintWatcher()
+        self.watchers.append(watcher)
+        for target in watched:
+            target.installEventFilter(watcher)
+    
+    def report(self):
+        phases = [{
+            "name": name,
+            "start_ms": round(self.elapsed_ms(start), 3),
+            "duration_ms": round((end - start) * 1000, 3)
+        } for name, start, end in self.phases]
+        marks = [{"name": name, "at_ms": round(self.elapsed_ms(at), 3)} for name, at in self.marks]
+        
+        ends = [phase["start_ms"] + phase["duration_ms"] for phase in phases] + [mark["at_ms"] for mark in marks]
+        return {
+            "app": "BrainrotOS",
+            "version": self.app_version(),
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt_platform": os.environ.get("QT_QPA_PLATFORM", "default"),
+            "total_ms": round(max(ends, default=0), 3),
+            "phases": phases,
+            "marks": marks
+        }
+    
+    def app_version(self):
+        try:
+            from PyQt5.QtWidgets import QApplication
+            app = QApplication.instance()
+            if app:
+                return app.applicationVersion()
+        except ImportError:
+            pass
+        return "unknown"
+    
+    def format_text(self, report):
+        lines = [
+            f"🧠 BrainrotOS {report['version']} startup profile ({report['created']})",
+            f"Python {report['python']} on {report['platform']} [{report['qt_platform']}]",
+            "",
+            f"{'phase':<44} {'start ms':>10} {'took ms':>10}"
+        ]
+        for phase in report["phases"]:
+            lines.append(f"{phase['name']:<44} {phase['start_ms']:>10.1f} {phase['duration_ms']:>10.1f}")
+        lines.append("")
+        for mark in report["marks"]:
+            lines.append(f"{mark['name']:<44} {mark['at_ms']:>10.1f}")
+        lines.append(f"{'total':<44} {report['total_ms']:>10.1f}")
+        return "\n".join(lines) + "\n"
+    
+    def write_report(self):
+        """Write <report_path> (JSON) and a matching .txt summary"""
+        if not self.enabled or self.report_written:
+            return
+        self.report_written = True
+        
+        report = self.report()
+        text = self.format_text(report)
+        
+        with open(self.report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        text_path = os.path.splitext(self.report_path)[0] + ".txt"
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        
+        print(text, end="")
+        print(f"⏱️ Startup profile written to {self.report_path} and {text_path}")
+
+def parse_profile_flag(argv):
+    """Return the report path for --profile-startup[=PATH], or None"""
+    for arg in argv:
+        if arg == "--profile-startup":
+            return "startup_profile.json"
+        if arg.startswith("--profile-startup="):
+            return arg.split("=", 1)[1] or "startup_profile.json"
+    return None
+
+# Shared profiler; created at import so the origin is as close to process start as possible
+profiler = StartupProfiler()
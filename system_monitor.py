@@ -0,0 +1,160 @@
+"""
+💻 /proc-backed system sampler for BrainrotOS
+A background thread reads /proc/stat, /proc/meminfo and statvfs, keeps a ring
+buffer of history per metric and hands each sample to the GUI thread through a
+queued Qt signal, so the GUI never waits on the filesystem.
+"""
+
+import os
+import threading
+from array import array
+from collections import namedtuple
+from PyQt5.QtCore import QObject, pyqtSignal
+
+Sample = namedtuple("Sample", "cpu_percent mem_used mem_total disk_free cpu_history mem_history")
+
+GB = 1024 ** 3
+
+class RingBuffer:
+    """Fixed-size history of floats; appending never allocates"""
+    def __init__(self, size):
+        self.values = array("d", bytes(8 * size))
+        self.size = size
+        self.head = 0
+        self.count = 0
+    
+    def append(self, value):
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+    
+    def snapshot(self):
+        """Oldest to newest, as a tuple the GUI thread can keep"""
+        start = (self.head - self.count) % self.size
+        return tuple(self.values[(start + i) % self.size] for i in range(self.count))
+
+class ProcReader:
+    """Reads a /proc file through one open descriptor with pread()"""
+    def __init__(self, path):
+        self.fd = os.open(path, os.O_RDONLY)
+    
+    def read(self):
+        return os.pread(self.fd, 8192, 0)
+    
+    def close(self):
+        os.close(self.fd)
+
+class SystemMonitor(QObject):
+    """Process-wide sampler; use SystemMonitor.instance() and connect to sampled"""
+    sampled = pyqtSignal(object)
+    
+    INTERVAL = 2.0
+    # CPU use is a difference between two reads, so the first one comes this soon
+    FIRST_INTERVAL = 0.25
+    HISTORY = 60
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, disk_path="/"):
+        super().__init__()
+        self.disk_path = disk_path
+        self.cpu_history = RingBuffer(self.HISTORY)
+        self.mem_history = RingBuffer(self.HISTORY)
+        self.last_sample = None
+        self.previous_cpu = None
+        self.stopping = threading.Event()
+        self.thread = None
+    
+    @property
+    def available(self):
+        return os.path.exists("/proc/stat") and os.path.exists("/proc/meminfo")
+    
+    def start(self):
+        if self.thread is not None or not self.available:
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="brainrot-system-monitor", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+            self.thread = None
+    
+    def run(self):
+        stat = ProcReader("/proc/stat")
+        meminfo = ProcReader("/proc/meminfo")
+        failing = False
+        try:
+            while True:
+                try:
+                    sample = self.sample(stat, meminfo)
+                except Exception as e:
+                    # One bad read mustn't stop the sampler; say so once per run of failures
+                    if not failing:
+                        print(f"💻 System sample failed: {e!r}")
+                    failing = True
+                    sample = None
+                else:
+                    failing = False
+                if sample is not None:
+                    self.last_sample = sample
+                    self.sampled.emit(sample)
+                interval = self.FIRST_INTERVAL if self.last_sample is None and not failing else self.INTERVAL
+                if self.stopping.wait(interval):
+                    break
+        finally:
+            stat.close()
+            meminfo.close()
+    
+    def sample(self, stat, meminfo):
+        """The current Sample, or None on the first call (there's nothing to measure CPU against yet)"""
+        cpu = self.read_cpu(stat.read())
+        if cpu is None:
+            return None
+        mem_used, mem_total = self.read_memory(meminfo.read())
+        try:
+            vfs = os.statvfs(self.disk_path)
+            disk_free = vfs.f_bavail * vfs.f_frsize
+        except OSError:
+            disk_free = 0
+        
+        self.cpu_history.append(cpu)
+        self.mem_history.append(100 * mem_used / mem_total if mem_total else 0.0)
+        return Sample(cpu, mem_used, mem_total, disk_free,
+                      self.cpu_history.snapshot(), self.mem_history.snapshot())
+    
+    def read_cpu(self, data):
+        """Busy percentage since the previous read (None on the first), from the aggregate 'cpu' line"""
+        fields = data[:data.index(b"\n")].split()
+        # user nice system idle iowait irq softirq steal (guest time is already in user)
+        ticks = [int(value) for value in fields[1:9]]
+        idle = ticks[3] + ticks[4]
+        total = sum(ticks)
+        
+        previous = self.previous_cpu
+        self.previous_cpu = (idle, total)
+        if previous is None:
+            return None
+        if total == previous[1]:
+            return 0.0
+        return 100.0 * (1 - (idle - previous[0]) / (total - previous[1]))
+    
+    def read_memory(self, data):
+        """(used, total) bytes; used excludes reclaimable cache, like `free`"""
+        total = self.meminfo_kb(data, b"MemTotal:")
+        available = self.meminfo_kb(data, b"MemAvailable:")
+        return (total - available) * 1024, total * 1024
+    
+    def meminfo_kb(self, data, key):
+        start = data.find(key)
+        if start < 0:
+            return 0
+        end = data.index(b"\n", start)
+        return int(data[start + len(key):end].split()[0])
@@ -0,0 +1,57 @@
+"""
+🧪 Sigma Notes editing on files that aren't valid UTF-8
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+def open_view(app, path):
+    from apps.sigma_notes import LargeDocument, TextView
+    document = LargeDocument(str(path))
+    # Lines are indexed on a worker thread
+    while not document.index.done:
+        app.processEvents()
+    document.table.refresh()
+    view = TextView()
+    view.set_document(document)
+    return document, view
+
+def test_edit_keeps_bytes_that_are_not_utf8(app, tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"caf\xe9 xyz\n")
+    document, view = open_view(app, path)
+
+    view.set_cursor(0, 6)
+    view.insert_text("Q")
+    assert document.table.read(0, document.table.length) == b"caf\xe9 xQyz\n"
+
+    # Backspace over the stray byte removes exactly that byte
+    view.set_cursor(0, 4)
+    view.delete_backward()
+    assert document.table.read(0, document.table.length) == b"caf xQyz\n"
+
+    view.set_cursor(0, 0)
+    view.delete_forward()
+    document.save(wait=True)
+    app.processEvents()
+    assert path.read_bytes() == b"af xQyz\n"
+
+def test_long_line_is_not_cut_inside_a_character(app, tmp_path):
+    from apps.sigma_notes import TextView
+    path = tmp_path / "long.txt"
+    path.write_bytes(b"a" * (TextView.MAX_LINE_BYTES - 1) + "é".encode("utf-8") * 4 + b"\n")
+    document, view = open_view(app, path)
+
+    text = view.line_text(0)
+    assert text == "a" * (TextView.MAX_LINE_BYTES - 1)
+    assert view.byte_length(text) <= TextView.MAX_LINE_BYTES
@@ -0,0 +1,105 @@
+"""
+🧪 Weather fetching, caching and revalidation against a local HTTP server
+"""
+
+import os
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from weather_provider import OpenMeteoProvider, WeatherReport, WeatherService
+
+ETAG = '"sunny-v1"'
+PAYLOAD = {"current": {"temperature_2m": 21.4, "relative_humidity_2m": 55, "weather_code": 1, "wind_speed_10m": 12}}
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(PAYLOAD).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.seen = []
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def make_service(server, cache_file):
+    provider = OpenMeteoProvider(52.5, 13.4, f"http://127.0.0.1:{server.server_port}")
+    service = WeatherService(provider, cache_file=str(cache_file), ttl=600)
+    reports = []
+    service.updated.connect(reports.append)
+    return service, reports
+
+def wait_for_fetch(app, service):
+    # The worker's updated signal is queued to this thread
+    if service.pending is not None:
+        service.pending.result(timeout=10)
+    app.processEvents()
+
+def test_fetch_writes_cache_and_ttl_hit_skips_network(app, server, tmp_path):
+    cache_file = tmp_path / "weather.json"
+    service, reports = make_service(server, cache_file)
+    service.request()
+    wait_for_fetch(app, service)
+
+    expected = WeatherReport("Sunny", 21, 55, 12, "open-meteo")
+    assert reports == [expected]
+    assert len(server.seen) == 1
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cache["etag"] == ETAG
+    assert cache["report"] == expected._asdict()
+
+    # Within the TTL: answered from memory, and after a restart from the disk cache
+    service.request()
+    restarted, restarted_reports = make_service(server, cache_file)
+    restarted.request()
+    assert reports[-1] == expected
+    assert restarted_reports == [expected]
+    assert restarted.pending is None
+    assert len(server.seen) == 1
+
+def test_expired_cache_revalidates_with_etag(app, server, tmp_path):
+    cache_file = tmp_path / "weather.json"
+    service, reports = make_service(server, cache_file)
+    service.request()
+    wait_for_fetch(app, service)
+
+    # Expire it; the cached report is shown while a conditional GET goes out
+    service.cache["fetched_at"] = 0
+    service.request()
+    wait_for_fetch(app, service)
+
+    assert len(server.seen) == 2
+    assert server.seen[1].get("If-None-Match") == ETAG
+    assert reports == [reports[0]] * 3
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cache["etag"] == ETAG
+    assert cache["report"] == reports[0]._asdict()
+    assert cache["fetched_at"] > 0
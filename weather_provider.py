@@ -0,0 +1,217 @@
+"""
+🌤️ Weather for the BrainrotOS sidebar
+Providers fetch over HTTP on a worker thread; WeatherService coalesces requests
+from every widget, revalidates with ETag/If-Modified-Since and keeps an on-disk
+TTL cache, so restarts and whole kiosk fleets stay off the upstream API.
+
+Configure with BRAINROT_WEATHER_LAT / BRAINROT_WEATHER_LON (Open-Meteo),
+BRAINROT_WEATHER_URL (e.g. a local stub server) and BRAINROT_WEATHER_TTL
+(seconds). Without a location the classic random forecast is used.
+"""
+
+import os
+import json
+import time
+import random
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import paths
+
+WeatherReport = namedtuple("WeatherReport", "condition temperature_c humidity wind_kmh source")
+
+class WeatherProvider:
+    """Describes one upstream API: the request to make and how to read the reply"""
+    name = "base"
+    
+    def request(self):
+        """(url, params) for the current conditions, or None if no network is needed"""
+        raise NotImplementedError
+    
+    def parse(self, payload):
+        """WeatherReport from the decoded JSON body"""
+        raise NotImplementedError
+    
+    def offline_report(self):
+        return None
+
+class RandomWeatherProvider(WeatherProvider):
+    """The original made-up forecast; never touches the network"""
+    name = "random"
+    
+    def request(self):
+        return None
+    
+    def offline_report(self):
+        return WeatherReport(random.choice(["Sunny", "Cloudy", "Rainy", "Snowy", "Foggy", "Windy"]),
+                             random.choice([15, 20, 25, 30, 35]),
+                             random.choice([30, 45, 60, 75, 90]), 8, self.name)
+
+class OpenMeteoProvider(WeatherProvider):
+    """Current conditions from Open-Meteo (no API key needed)"""
+    name = "open-meteo"
+    
+    # WMO weather interpretation codes, collapsed to the widget's vocabulary
+    CONDITIONS = [
+        ((0, 1), "Sunny"), ((2, 3), "Cloudy"), ((45, 48), "Foggy"),
+        ((51, 67), "Rainy"), ((71, 77), "Snowy"), ((80, 82), "Rainy"),
+        ((85, 86), "Snowy"), ((95, 99), "Stormy"),
+    ]
+    
+    def __init__(self, latitude, longitude, base_url="https://api.open-meteo.com"):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.base_url = base_url.rstrip("/")
+    
+    def request(self):
+        return f"{self.base_url}/v1/forecast", {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m",
+        }
+    
+    def parse(self, payload):
+        current = payload["current"]
+        code = int(current.get("weather_code", 0))
+        condition = next((name for (low, high), name in self.CONDITIONS if low <= code <= high), "Vibing")
+        wind = current.get("wind_speed_10m", 0)
+        if wind >= 40 and condition in ("Sunny", "Cloudy"):
+            condition = "Windy"
+        return WeatherReport(condition, round(current["temperature_2m"]),
+                             round(current.get("relative_humidity_2m", 0)), round(wind), self.name)
+
+def provider_from_environment():
+    latitude = os.environ.get("BRAINROT_WEATHER_LAT")
+    longitude = os.environ.get("BRAINROT_WEATHER_LON")
+    if latitude and longitude:
+        base_url = os.environ.get("BRAINROT_WEATHER_URL", "https://api.open-meteo.com")
+        return OpenMeteoProvider(latitude, longitude, base_url)
+    return RandomWeatherProvider()
+
+class WeatherService(QObject):
+    """Shared weather source; use WeatherService.instance() and connect to updated"""
+    updated = pyqtSignal(object)
+    
+    DEFAULT_TTL = 600
+    MAX_BACKOFF = 3600
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, provider=None, cache_file=None, ttl=None):
+        super().__init__()
+        self.provider = provider or provider_from_environment()
+        self.cache_file = cache_file or paths.cache_path("weather.json")
+        self.ttl = ttl if ttl is not None else int(os.environ.get("BRAINROT_WEATHER_TTL", self.DEFAULT_TTL))
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="brainrot-weather")
+        self.lock = threading.Lock()
+        self.pending = None
+        self.failures = 0
+        self.retry_at = 0.0
+        self.session = None
+        self.cache = self.load_cache()
+        self.latest = self.cached_report()
+    
+    def request(self):
+        """Ask for fresh weather; never blocks. Results arrive through updated"""
+        if self.provider.request() is None:
+            self.updated.emit(self.provider.offline_report())
+            return
+        
+        now = time.time()
+        if self.latest is not None and now < self.expires_at():
+            self.updated.emit(self.latest)
+            return
+        if now < self.retry_at:
+            # Upstream failed recently; keep showing what we have
+            self.updated.emit(self.latest)
+            return
+        
+        # Show what we have (if anything) while it's revalidated
+        if self.latest is not None:
+            self.updated.emit(self.latest)
+        with self.lock:
+            # Several widgets asking at once share one fetch
+            if self.pending is not None and not self.pending.done():
+                return
+            self.pending = self.executor.submit(self.fetch)
+    
+    def expires_at(self):
+        # Each machine refreshes at a slightly different time so a fleet doesn't stampede
+        jitter = self.cache.get("jitter", 1.0)
+        return self.cache.get("fetched_at", 0) + self.ttl * jitter
+    
+    def fetch(self):
+        """Worker thread: conditional GET, update the cache, emit the result"""
+        import requests
+        
+        url, params = self.provider.request()
+        headers = {}
+        if self.cache.get("url") == url and self.cache.get("params") == params and self.cache.get("report"):
+            if self.cache.get("etag"):
+                headers["If-None-Match"] = self.cache["etag"]
+            if self.cache.get("last_modified"):
+                headers["If-Modified-Since"] = self.cache["last_modified"]
+        
+        if self.session is None:
+            self.session = requests.Session()
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=(3, 10))
+            if response.status_code == 304:
+                report = self.cache["report"]
+            else:
+                response.raise_for_status()
+                report = self.provider.parse(response.json())._asdict()
+        except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+            self.failures += 1
+            backoff = min(self.MAX_BACKOFF, 30 * 2 ** (self.failures - 1))
+            self.retry_at = time.time() + backoff
+            print(f"🌧️ Weather fetch failed ({e}); retrying in {backoff}s")
+            self.updated.emit(self.latest)
+            return
+        
+        self.failures = 0
+        if response.status_code == 304:
+            # Still fresh: keep the validators we sent, a 304 needn't repeat them
+            self.cache = dict(self.cache, fetched_at=time.time(), jitter=random.uniform(0.9, 1.1))
+        else:
+            self.cache = {
+                "url": url,
+                "params": params,
+                "fetched_at": time.time(),
+                "jitter": random.uniform(0.9, 1.1),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "report": report,
+            }
+        self.save_cache()
+        self.latest = WeatherReport(**report)
+        self.updated.emit(self.latest)
+    
+    def load_cache(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save_cache(self):
+        temp_file = self.cache_file + ".tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(self.cache, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"🌧️ Could not write weather cache: {e}")
+    
+    def cached_report(self):
+        try:
+            return WeatherReport(**self.cache["report"])
+        except (KeyError, TypeError):
+            return None